@@ -0,0 +1,34 @@
+"""Hatch build hook: ship the templates in exactly one layout.
+
+The wheel target excludes src/prd_kit/templates/ (see pyproject.toml). When
+scripts/build_template_archive.py has written src/prd_kit/templates.zip, the
+archive is shipped on its own as a build artifact; otherwise this hook adds
+the loose template files back. Editable installs read src/ directly.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# Files under templates/ that are never shipped (as in prd_kit.manifest)
+IGNORED_PARTS = {"__pycache__"}
+IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+
+class CustomBuildHook(BuildHookInterface):
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if self.target_name != "wheel" or version == "editable":
+            return
+        package_dir = Path(self.root) / "src" / "prd_kit"
+        if (package_dir / "templates.zip").is_file():
+            return
+
+        templates_dir = package_dir / "templates"
+        for path in sorted(templates_dir.rglob("*")):
+            rel = path.relative_to(templates_dir)
+            if not path.is_file() or IGNORED_PARTS.intersection(rel.parts):
+                continue
+            if path.suffix in IGNORED_SUFFIXES:
+                continue
+            build_data["force_include"][str(path)] = f"prd_kit/templates/{rel.as_posix()}"
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Benchmark PRD Kit hot paths on synthetic workspaces of growing size.
+
+For each size a workspace is generated with scripts/generate_workspace.py
+and every hot path is timed in-process (best and median of several runs):
+
+- get_feature_status: status of every feature in prds/
+- find_deliverable (cold): 10 lookups after deleting the workspace index
+- find_deliverable (warm): 10 lookups against an up-to-date index
+- check-completeness: validate up to 50 PRD.md files (no cache)
+- check-deliverables: validate up to 50 deliverables directories (no cache)
+- workspace graph: merge every deliverables map (no cache)
+- topological_sort_with_levels: order every deliverable in the workspace
+- completeness/deliverables rules: the validators' content scanners against
+  the separate re passes they replaced, on every sampled document joined
+  into one large text
+
+Results are printed as JSON (or written to --output); pass --baseline with
+a previous result file to compare, exiting non-zero if any benchmark got
+slower than --threshold times its baseline median.
+
+Usage:
+    python scripts/bench_hot_paths.py [--sizes 10,1000,10000] [--runs 3]
+        [--output results.json] [--baseline baseline.json] [--threshold 1.5]
+"""
+
+import argparse
+import json
+import platform
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).parent.parent
+TEMPLATES_DIR = ROOT / "src" / "prd_kit" / "templates"
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(TEMPLATES_DIR / "scripts"))
+
+from generate_workspace import generate_workspace  # noqa: E402
+from prd_scripts import check_completeness, check_deliverables  # noqa: E402
+from prd_scripts import index as index_module  # noqa: E402
+from prd_scripts.check_completeness import validate_file  # noqa: E402
+from prd_scripts.check_deliverables import validate_directory  # noqa: E402
+from prd_scripts.common import PRDKitPaths, get_feature_status  # noqa: E402
+from prd_scripts.graph import build_workspace_graph  # noqa: E402
+from prd_scripts.implementation_order import topological_sort_with_levels  # noqa: E402
+from prd_scripts.setup_init_feature import find_deliverable  # noqa: E402
+
+SAMPLE_SIZE = 50
+LOOKUPS = 10
+
+
+def measure(func, runs: int, setup=None) -> dict:
+    """Time func() runs times (after an optional untimed setup()) in ms."""
+    timings = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "runs": runs,
+    }
+
+
+def completeness_re_passes(content: str) -> tuple:
+    """The content checks check-completeness ran before its scanner."""
+    return (
+        re.findall(r'\[NEEDS_DETAIL:\s*([^\]]+)\]', content),
+        re.findall(r'\[(?:PLACEHOLDER|TODO|TBD|XXX)[^\]]*\]', content, re.IGNORECASE),
+        re.search(r'\*\*As a\*\*', content),
+        re.search(r'\*\*I want to\*\*', content),
+        re.search(r'\*\*So that\*\*', content),
+        re.search(r'```gherkin', content),
+    )
+
+
+def deliverables_re_passes(content: str) -> tuple:
+    """The content checks check-deliverables ran before its scanner."""
+    return (
+        "Source PRD" in content,
+        "Deliverable ID" in content,
+        re.findall(r'\[NEEDS_DETAIL:\s*([^\]]+)\]', content),
+        re.findall(
+            r'```(?:typescript|javascript|python|js|ts|vue|jsx|tsx)', content, re.IGNORECASE
+        ),
+        *(
+            re.findall(pattern, content)
+            for pattern in (
+                r'\binterface\s+\w+\s*{',
+                r'\btype\s+\w+\s*=',
+                r'\bimport\s+.*\bfrom\b',
+                r'\bexport\s+(default\s+)?(class|function|const|interface)',
+                r'src/\w+/\w+\.(vue|ts|js|tsx|jsx)',
+            )
+        ),
+    )
+
+
+def reset_index(paths: PRDKitPaths) -> None:
+    """Drop the in-process and on-disk workspace index."""
+    index = index_module._INDEXES.pop(paths.project_root, None)
+    if index is not None:
+        index.close()
+    (paths.prd_kit_dir / index_module.INDEX_FILE_NAME).unlink(missing_ok=True)
+
+
+def bench_workspace(root: Path, runs: int) -> dict:
+    """Run every hot-path benchmark against one generated workspace."""
+    paths = PRDKitPaths(root)
+    features = sorted(p.name for p in paths.prds_dir.iterdir())
+    prd_files = sorted(paths.prds_dir.glob("*/PRD.md"))[:SAMPLE_SIZE]
+    deliverable_dirs = sorted(paths.prds_dir.glob("*/deliverables"))[:SAMPLE_SIZE]
+
+    all_deliverables = [d for d in build_workspace_graph(paths.prds_dir).deliverables()]
+    rng = random.Random(0)
+    identifiers = [
+        f"{d['prd']}/{d['local_id']}" if i % 2 else d["file"]
+        for i, d in enumerate(rng.choices(all_deliverables, k=LOOKUPS))
+    ] if all_deliverables else []
+
+    def feature_statuses():
+        for name in features:
+            get_feature_status(paths, name)
+
+    def lookups():
+        for identifier in identifiers:
+            find_deliverable(paths, identifier)
+
+    prd_text = "\n".join(p.read_text() for p in prd_files)
+    deliverable_text = "\n".join(
+        p.read_text() for d in deliverable_dirs for p in sorted(d.glob("*.md"))
+    )
+
+    results = {
+        "get_feature_status": measure(feature_statuses, runs),
+        "find_deliverable (cold)": measure(lookups, runs, setup=lambda: reset_index(paths)),
+        "find_deliverable (warm)": measure(lookups, runs),
+        "check-completeness": measure(
+            lambda: [validate_file(p) for p in prd_files], runs
+        ),
+        "check-deliverables": measure(
+            lambda: [validate_directory(p) for p in deliverable_dirs], runs
+        ),
+        "workspace graph": measure(lambda: build_workspace_graph(paths.prds_dir), runs),
+        "topological_sort_with_levels": measure(
+            lambda: topological_sort_with_levels(all_deliverables), runs
+        ),
+        "completeness rules (scanner)": measure(
+            lambda: check_completeness.CONTENT_SCANNER.scan(prd_text), runs
+        ),
+        "completeness rules (re passes)": measure(
+            lambda: completeness_re_passes(prd_text), runs
+        ),
+        "deliverables rules (scanner)": measure(
+            lambda: check_deliverables.CONTENT_SCANNER.scan(deliverable_text), runs
+        ),
+        "deliverables rules (re passes)": measure(
+            lambda: deliverables_re_passes(deliverable_text), runs
+        ),
+    }
+    reset_index(paths)
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> int:
+    """Print each benchmark against its baseline; return the regression count."""
+    previous = {(r["benchmark"], r["features"]): r for r in baseline}
+    regressions = 0
+    print("\nComparison with baseline (median ms):", file=sys.stderr)
+    for result in results:
+        base = previous.get((result["benchmark"], result["features"]))
+        if base is None or not base["median_ms"]:
+            continue
+        ratio = result["median_ms"] / base["median_ms"]
+        marker = "❌" if ratio > threshold else "✅"
+        regressions += ratio > threshold
+        print(
+            f"  {marker} {result['benchmark']:30} {result['features']:>6} features "
+            f"{base['median_ms']:10.1f} -> {result['median_ms']:10.1f}  x{ratio:.2f}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PRD Kit hot paths")
+    parser.add_argument("--sizes", default="10,1000,10000", help="Comma-separated feature counts")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument(
+        "--deliverables", type=int, default=5,
+        help="Deliverables per decomposed feature",
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.3,
+        help="Dependency probability between deliverables",
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.5,
+        help="Slowdown ratio counted as a regression",
+    )
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            root = Path(tmp) / f"workspace-{size}"
+            start = time.perf_counter()
+            counts = generate_workspace(
+                root, size, deliverables=args.deliverables, density=args.density
+            )
+            print(
+                f"Generated {size} features ({counts['deliverables']} deliverables) "
+                f"in {time.perf_counter() - start:.1f}s",
+                file=sys.stderr,
+            )
+            for benchmark, timing in bench_workspace(root, args.runs).items():
+                results.append({"benchmark": benchmark, "features": size, **timing})
+                print(f"  {benchmark:30} median {timing['median_ms']:10.1f} ms", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline.get("results", []), args.threshold)
+        if regressions:
+            print(
+                f"\n❌ {regressions} benchmark(s) slower than x{args.threshold} baseline",
+                file=sys.stderr,
+            )
+            return 1
+        print("\n✅ No regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
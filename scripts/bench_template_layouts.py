@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark `prd init` with loose-file templates vs the packaged archive.
+
+Each run is a fresh interpreter initialising a fresh directory, so module
+imports and template reads are cold for the process (the OS page cache is
+not dropped). Builds src/prd_kit/templates.zip if it does not exist and
+removes it again afterwards.
+
+Usage:
+    python scripts/bench_template_layouts.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(Path(__file__).parent))
+
+from build_template_archive import ARCHIVE_PATH, build_archive  # noqa: E402
+
+
+def time_init(layout: str, workdir: Path, run: int) -> float:
+    """Run one `prd init --quiet` and return its wall time in ms."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"), PRD_KIT_TEMPLATES=layout)
+    target = workdir / f"{layout}-{run}"
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "prd_kit.cli", "init", str(target), "--quiet", "--no-git"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        env=env,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    built = not ARCHIVE_PATH.exists()
+    if built:
+        build_archive()
+    
+    results = {"files": [], "archive": []}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for run in range(runs):
+                # Interleave layouts so drift affects both equally
+                for layout in results:
+                    results[layout].append(time_init(layout, Path(tmp), run))
+    finally:
+        if built:
+            ARCHIVE_PATH.unlink()
+    
+    print(f"prd init, {runs} runs each (ms):")
+    for layout, timings in results.items():
+        print(
+            f"  {layout:8} median {statistics.median(timings):7.1f}"
+            f"  min {min(timings):7.1f}  max {max(timings):7.1f}"
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
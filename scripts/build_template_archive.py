@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Bundle src/prd_kit/templates/ into src/prd_kit/templates.zip.
+
+A wheel built while the archive is present ships it in place of the ~70
+loose files (see hatch_build.py), and `prd init` and `prd update` stream
+templates from it via importlib.resources. Run this before building a
+release; delete the archive to build wheels with the loose files again.
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from prd_kit.manifest import MANIFEST_FILE_NAME, TEMPLATES_DIR, iter_template_files  # noqa: E402
+from prd_kit.resources import ARCHIVE_NAME  # noqa: E402
+
+ARCHIVE_PATH = TEMPLATES_DIR.parent / ARCHIVE_NAME
+
+# Fixed timestamp so the archive is reproducible
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def build_archive(path: Path = ARCHIVE_PATH) -> int:
+    """Write the archive and return the number of entries."""
+    names = [(MANIFEST_FILE_NAME, TEMPLATES_DIR / MANIFEST_FILE_NAME)]
+    names += list(iter_template_files(TEMPLATES_DIR))
+    
+    tmp_path = path.with_suffix(".zip.tmp")
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for name, file_path in names:
+            info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            zf.writestr(info, file_path.read_bytes())
+    tmp_path.replace(path)
+    return len(names)
+
+
+def main():
+    if not (TEMPLATES_DIR / MANIFEST_FILE_NAME).exists():
+        print("❌ templates/manifest.json missing (run scripts/generate_manifest.py first)")
+        return 1
+    
+    count = build_archive()
+    size_kb = ARCHIVE_PATH.stat().st_size / 1024
+    print(f"✅ Wrote {ARCHIVE_PATH.relative_to(ROOT)} ({count} entries, {size_kb:.1f} KiB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
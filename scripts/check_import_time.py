@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Check that `prd version` stays within its import-time budget.
+
+Runs `python -X importtime -m prd_kit.cli version` and sums the cumulative
+time of every top-level import. The fast path must not load typer, rich or
+the command modules; any of those alone would blow the budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).parent.parent
+
+# Total import time allowed for `prd version`, in milliseconds
+BUDGET_MS = 50
+
+# Modules that must never be imported on the fast path
+FORBIDDEN = ("typer", "rich", "click", "prd_kit.app")
+
+RUNS = 5
+
+
+def measure() -> tuple[float, set[str]]:
+    """Run `prd version` once and return (total import ms, imported top-level modules)."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "prd_kit.cli", "version"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):  # Top-level import: includes its children
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def main():
+    timings = []
+    imported = set()
+    for _ in range(RUNS):
+        total_ms, modules = measure()
+        timings.append(total_ms)
+        imported |= modules
+    
+    best = min(timings)
+    errors = []
+    if best > BUDGET_MS:
+        errors.append(f"import time {best:.1f} ms exceeds budget of {BUDGET_MS} ms")
+    for module in FORBIDDEN:
+        if any(m == module or m.startswith(f"{module}.") for m in imported):
+            errors.append(f"'{module}' is imported by `prd version`")
+    
+    if errors:
+        print("❌ IMPORT TIME BUDGET EXCEEDED:\n")
+        for error in errors:
+            print(f"  • {error}")
+        print("\n⚠️  Keep heavy imports inside the commands that need them (see prd_kit/app.py).")
+        return 1
+    
+    print(f"✅ `prd version` imports in {best:.1f} ms (budget {BUDGET_MS} ms, best of {RUNS})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
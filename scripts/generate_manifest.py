@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Generate src/prd_kit/templates/manifest.json (content hashes of all templates).
+
+`prd update` uses the manifest to skip files whose template did not change.
+Run this after editing any template; `--check` exits 1 if it is out of date.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Project root
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from prd_kit.manifest import TEMPLATE_MANIFEST_PATH, build_template_manifest  # noqa: E402
+
+
+def render() -> str:
+    """Render the manifest exactly as it is written to disk."""
+    return json.dumps(build_template_manifest(), indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    content = render()
+    
+    if "--check" in sys.argv[1:]:
+        current = TEMPLATE_MANIFEST_PATH.read_text() if TEMPLATE_MANIFEST_PATH.exists() else ""
+        if current != content:
+            print("❌ templates/manifest.json is out of date")
+            print("\n⚠️  Run: python scripts/generate_manifest.py")
+            return 1
+        print("✅ templates/manifest.json is up to date")
+        return 0
+    
+    TEMPLATE_MANIFEST_PATH.write_text(content)
+    files = json.loads(content)["files"]
+    print(f"✅ Wrote {TEMPLATE_MANIFEST_PATH.relative_to(ROOT)} ({len(files)} files)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
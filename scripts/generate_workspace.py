@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Generate a synthetic PRD Kit workspace for benchmarking.
+
+Builds a .prd-kit/ marker plus realistic prds/ and specs/ trees: features
+spread across every pipeline stage (research with open [NEEDS_DETAIL] tags,
+drafted and approved PRDs, decomposed maps, generated deliverables), user
+stories with Gherkin criteria, deliverables wired into a dependency graph,
+and a spec directory for some deliverables. Output is deterministic for a
+given seed.
+
+An existing directory is only replaced if it is empty or was generated by
+this script (it holds the MARKER_FILE written on generation); pass --force
+to replace any other directory.
+
+Usage:
+    python scripts/generate_workspace.py <dir> [--features N] [--deliverables N]
+        [--stories N] [--density F] [--cross-prd F] [--seed N] [--force]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+
+# Written at the workspace root so a later run may replace it
+MARKER_FILE = ".synthetic-workspace"
+
+# Pipeline stage of each feature, cycled so every size has all of them
+STAGES = (
+    "discovery_in_progress",
+    "discovery_complete",
+    "drafted",
+    "approved",
+    "decomposed",
+    "deliverables_generated",
+    "deliverables_generated",
+    "deliverables_generated",
+)
+
+RESEARCH_SECTIONS = (
+    "Initial Idea",
+    "Discovery Questions",
+    "Problem Space",
+    "User Understanding",
+    "Solution Space",
+    "Success Criteria",
+    "Constitution Alignment",
+)
+
+PRD_SECTIONS = (
+    "Problem Statement",
+    "Solution Overview",
+    "Non-Functional Requirements",
+    "Success Metrics",
+    "Risks & Mitigations",
+)
+
+FILLER = (
+    "Users need a reliable way to complete this workflow without support. "
+    "The current process is manual, slow and error-prone.\n"
+)
+
+
+def feature_name(index: int) -> str:
+    return f"feature-{index:05d}"
+
+
+def user_stories(count: int, heading: str = "###") -> str:
+    stories = []
+    for n in range(1, count + 1):
+        stories.append(
+            f"{heading} [US{n}] Story {n} (Priority: P{1 + n % 3})\n\n"
+            f"**As a** user **I want to** do thing {n} **So that** I get value {n}\n\n"
+            "```gherkin\n"
+            f"Given the user is on screen {n}\n"
+            f"When they perform action {n}\n"
+            f"Then outcome {n} is shown\n"
+            "```\n"
+        )
+    return "\n".join(stories)
+
+
+def write_research(feature_dir: Path, needs_detail: bool) -> None:
+    parts = ["# Research\n"]
+    for section in RESEARCH_SECTIONS:
+        parts.append(f"## {section}\n\n{FILLER * 4}")
+    if needs_detail:
+        parts.append("[NEEDS_DETAIL: confirm the expected volume]\n")
+    (feature_dir / "research.md").write_text("\n".join(parts))
+
+
+def write_prd(feature_dir: Path, name: str, approved: bool, stories: int) -> None:
+    status = "Approved" if approved else "Draft"
+    parts = [f"# PRD: {name}\n\n**Status**: {status}\n**Version**: 1.0\n"]
+    for section in PRD_SECTIONS[:2]:
+        parts.append(f"## {section}\n\n{FILLER * 6}")
+    parts.append(f"## User Stories\n\n{user_stories(stories)}")
+    for section in PRD_SECTIONS[2:]:
+        parts.append(f"## {section}\n\n{FILLER * 3}")
+    (feature_dir / "PRD.md").write_text("\n".join(parts))
+
+
+def write_deliverables(
+    feature_dir: Path,
+    name: str,
+    entries: list[dict],
+    stories: int,
+    write_files: bool,
+) -> None:
+    deliverables_dir = feature_dir / "deliverables"
+    deliverables_dir.mkdir()
+    (deliverables_dir / "deliverables-map.json").write_text(json.dumps({
+        "source_prd": f"prds/{name}/PRD.md",
+        "deliverables": entries,
+    }, indent=2))
+    if not write_files:
+        return
+
+    for d in entries:
+        (deliverables_dir / d["file"]).write_text(
+            f"# Deliverable: {d['title']}\n\n"
+            f"**Deliverable ID**: {d['id']}\n"
+            f"**Source PRD**: prds/{name}/PRD.md\n"
+            f"**Priority**: {d['priority'].upper()}\n\n"
+            f"## Context\n\n{FILLER * 2}\n"
+            f"## User Stories\n\n{user_stories(stories)}\n"
+            f"## Acceptance Criteria\n\n- [ ] Works\n\n"
+            f"## Out of Scope\n\n- Everything else\n"
+        )
+    (deliverables_dir / "README.md").write_text(
+        "# Implementation Roadmap\n\n## Implementation Order\n\n"
+        + "\n".join(f"Phase 1: {d['id']}" for d in entries) + "\n"
+    )
+
+
+def generate_workspace(
+    root: Path,
+    features: int,
+    deliverables: int = 5,
+    stories: int = 3,
+    density: float = 0.3,
+    cross_prd: float = 0.0,
+    seed: int = 0,
+    force: bool = False,
+) -> dict:
+    """Generate a workspace under root (replacing it) and return its counts.
+
+    Args:
+        root: Workspace directory
+        features: Number of features in prds/
+        deliverables: Deliverables per decomposed feature
+        stories: User stories per PRD and per deliverable
+        density: Probability that a deliverable depends on each earlier one
+            of its PRD (at most 3 dependencies)
+        cross_prd: Probability that a deliverable also depends on a
+            deliverable of an earlier PRD ("other-prd:001")
+        seed: Random seed
+        force: Replace root even if it is a non-empty directory that was not
+            generated by this script
+
+    Raises:
+        ValueError: If root exists and may not be replaced
+    """
+    rng = random.Random(seed)
+    if root.exists():
+        if not force and not (root / MARKER_FILE).is_file() and any(root.iterdir()):
+            raise ValueError(
+                f"{root} is not empty and was not generated by this script; "
+                "use --force to replace it"
+            )
+        shutil.rmtree(root)
+    (root / ".prd-kit").mkdir(parents=True)
+    (root / MARKER_FILE).write_text("Generated by scripts/generate_workspace.py\n")
+    prds_dir = root / "prds"
+    specs_dir = root / "specs"
+    prds_dir.mkdir()
+    specs_dir.mkdir()
+
+    counts = {"features": features, "deliverables": 0, "dependencies": 0, "specs": 0}
+    decomposed: list[str] = []
+    spec_number = 0
+
+    for index in range(features):
+        name = feature_name(index)
+        stage = STAGES[index % len(STAGES)]
+        feature_dir = prds_dir / name
+        feature_dir.mkdir()
+
+        write_research(feature_dir, needs_detail=stage == "discovery_in_progress")
+        if stage in ("discovery_in_progress", "discovery_complete"):
+            continue
+        write_prd(feature_dir, name, approved=stage != "drafted", stories=stories)
+        if stage in ("drafted", "approved"):
+            continue
+
+        entries = []
+        for n in range(1, deliverables + 1):
+            d_id = f"{n:03d}"
+            earlier = [f"{m:03d}" for m in range(1, n) if rng.random() < density][-3:]
+            if decomposed and rng.random() < cross_prd:
+                earlier.append(f"{rng.choice(decomposed)}:001")
+            entries.append({
+                "id": d_id,
+                "name": f"part-{n}",
+                "title": f"{name} part {n}",
+                "type": "backend" if n % 2 else "frontend",
+                "priority": ("high", "medium", "low")[n % 3],
+                "estimated_effort": ("small", "medium", "large")[n % 3],
+                "file": f"deliverable-{d_id}-part-{n}.md",
+                "dependencies": earlier,
+            })
+            counts["dependencies"] += len(earlier)
+        write_files = stage == "deliverables_generated"
+        write_deliverables(feature_dir, name, entries, stories, write_files)
+        decomposed.append(name)
+        counts["deliverables"] += len(entries)
+
+        # Start a spec for the first deliverable of generated features
+        if write_files:
+            spec_number += 1
+            spec_dir = specs_dir / f"{spec_number:03d}-{name}-part-1"
+            spec_dir.mkdir()
+            source = feature_dir / "deliverables" / entries[0]["file"]
+            shutil.copyfile(source, spec_dir / "deliverable.md")
+            if spec_number % 2:
+                (spec_dir / "context.md").write_text("# Context\n")
+                (spec_dir / "plan.md").write_text("# Plan\n")
+                (spec_dir / "tasks.md").write_text("- [x] Setup\n- [ ] Build\n- [ ] Test\n")
+            counts["specs"] += 1
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic PRD Kit workspace")
+    parser.add_argument(
+        "root", type=Path,
+        help="Workspace directory (replaced if generated before)",
+    )
+    parser.add_argument("--features", type=int, default=100, help="Number of features")
+    parser.add_argument(
+        "--deliverables", type=int, default=5,
+        help="Deliverables per decomposed feature",
+    )
+    parser.add_argument(
+        "--stories", type=int, default=3,
+        help="User stories per PRD and deliverable",
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.3,
+        help="Dependency probability between deliverables",
+    )
+    parser.add_argument(
+        "--cross-prd", type=float, default=0.0,
+        help="Probability of a dependency on another PRD",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Replace root even if it was not generated by this script",
+    )
+    args = parser.parse_args()
+
+    try:
+        counts = generate_workspace(
+            args.root,
+            args.features,
+            deliverables=args.deliverables,
+            stories=args.stories,
+            density=args.density,
+            cross_prd=args.cross_prd,
+            seed=args.seed,
+            force=args.force,
+        )
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"✅ Generated {args.root}: " + ", ".join(f"{v} {k}" for k, v in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,10 @@
 """Verify that init.py and update.py are in sync with actual template files."""
 
 from pathlib import Path
+import hashlib
+import json
 import sys
+import zipfile
 
 # Project root
 ROOT = Path(__file__).parent.parent
@@ -113,6 +116,30 @@ def main():
         missing = expected_in_update - update_files
         errors.append(f"update.py files_to_update MISSING: {missing}")
     
+    # Check the generated template manifest is current (names and hashes)
+    manifest_path = TEMPLATES_DIR / "manifest.json"
+    if manifest_path.exists():
+        manifest_files = json.loads(manifest_path.read_text())["files"]
+        shipped = {
+            f.relative_to(TEMPLATES_DIR).as_posix(): hashlib.sha256(f.read_bytes()).hexdigest()
+            for f in TEMPLATES_DIR.rglob("*")
+            if f.is_file() and f != manifest_path
+            and "__pycache__" not in f.parts and f.suffix != ".pyc"
+        }
+        recorded = {name: entry["sha256"] for name, entry in manifest_files.items()}
+        if recorded != shipped:
+            errors.append("templates/manifest.json is stale (run scripts/generate_manifest.py)")
+    else:
+        errors.append("templates/manifest.json MISSING (run scripts/generate_manifest.py)")
+    
+    # A built template archive replaces the loose files in the wheel, so it must match them
+    archive_path = TEMPLATES_DIR.parent / "templates.zip"
+    if archive_path.exists() and manifest_path.exists():
+        with zipfile.ZipFile(archive_path) as zf:
+            archived_manifest = zf.read("manifest.json")
+        if archived_manifest != manifest_path.read_bytes():
+            errors.append("templates.zip is stale (run scripts/build_template_archive.py)")
+    
     # Report
     if errors:
         print("❌ SYNC ERRORS FOUND:\n")
@@ -0,0 +1,198 @@
+"""PRD Kit CLI - Typer application.
+
+Command modules (and rich) are imported inside each command so that running
+one command does not pay for loading all of them.
+"""
+
+import typer
+
+app = typer.Typer(
+    name="prd",
+    help="PRD Kit - Product Requirements Document generation with AI agents",
+    no_args_is_help=True,
+)
+
+
+@app.callback()
+def main(
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record a Chrome trace of this run in .prd-kit/traces/ (same as PRD_KIT_TRACE=1)",
+    ),
+) -> None:
+    """PRD Kit - Product Requirements Document generation with AI agents"""
+    if profile:
+        from prd_kit.tracing import enable
+
+        enable()
+
+
+@app.command("init")
+def init(
+    path: str = typer.Argument(
+        ".",
+        help="Path to initialize the PRD Kit project. Use '.' for current directory.",
+    ),
+    ai: str = typer.Option(
+        "copilot",
+        "--ai",
+        "-a",
+        help="AI agent to configure: copilot, claude",
+    ),
+    script: str = typer.Option(
+        None,
+        "--script",
+        "-s",
+        help="Script type: sh (bash) or ps (powershell). Auto-detected if not specified.",
+    ),
+    here: bool = typer.Option(
+        False,
+        "--here",
+        help="Initialize in current directory (same as path='.')",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Force initialization in non-empty directory",
+    ),
+    no_git: bool = typer.Option(
+        False,
+        "--no-git",
+        help="Skip git repository initialization",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Print only a JSON list of created paths (for provisioning scripts)",
+    ),
+) -> None:
+    """Initialize a new PRD Kit project."""
+    from prd_kit.commands.init import init_command
+
+    target_path = "." if here else path
+    init_command(
+        path=target_path,
+        ai=ai,
+        script=script,
+        force=force,
+        no_git=no_git,
+        quiet=quiet,
+    )
+
+
+@app.command("update")
+def update(
+    ai: str = typer.Option(
+        None,
+        "--ai",
+        "-a",
+        help="AI agent to update: copilot, claude. Auto-detected if not specified.",
+    ),
+    script: str = typer.Option(
+        None,
+        "--script",
+        "-s",
+        help="Script type: sh (bash) or ps (powershell). Auto-detected if not specified.",
+    ),
+) -> None:
+    """Update PRD Kit templates and agents in current project."""
+    from prd_kit.commands.update import update_command
+
+    update_command(ai=ai, script=script)
+
+
+@app.command("daemon")
+def daemon(
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the daemon running for the current project",
+    ),
+) -> None:
+    """Serve setup scripts and validators from a warm process over a Unix socket."""
+    from prd_kit.commands.daemon import daemon_command
+
+    daemon_command(stop=stop)
+
+
+@app.command("validate")
+def validate(
+    paths: list[str] = typer.Argument(
+        None,
+        help="Files or deliverables directories to validate.",
+    ),
+    all_files: bool = typer.Option(
+        False,
+        "--all",
+        help="Validate every research.md, PRD.md and deliverables directory in prds/",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of worker processes. Defaults to the number of CPU cores.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore cached results in .prd-kit/cache/ and re-validate every file",
+    ),
+) -> None:
+    """Validate PRDs and deliverables, streaming one NDJSON result per file."""
+    from prd_kit.commands.validate import validate_command
+
+    validate_command(paths=paths, all_files=all_files, jobs=jobs, use_cache=not no_cache)
+
+
+@app.command("watch")
+def watch(
+    feature: str = typer.Argument(
+        None,
+        help="Feature to watch (prds/<feature>/). Watches all of prds/ if omitted.",
+    ),
+    debounce: float = typer.Option(
+        0.3,
+        "--debounce",
+        help="Seconds without changes to wait before re-validating",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Use polling instead of inotify",
+    ),
+) -> None:
+    """Watch PRDs and specs and re-validate files as they change."""
+    from prd_kit.commands.watch import watch_command
+
+    watch_command(feature=feature, debounce=debounce, poll=poll)
+
+
+@app.command("status")
+def status(
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Output the dashboard as JSON",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Number of worker threads",
+    ),
+) -> None:
+    """Show the pipeline status of every feature in prds/ and spec in specs/."""
+    from prd_kit.commands.status import status_command
+
+    status_command(as_json=as_json, jobs=jobs)
+
+
+@app.command("version")
+def version() -> None:
+    """Show PRD Kit version."""
+    from prd_kit.commands.version import version_command
+
+    version_command()
@@ -1,91 +1,37 @@
-"""PRD Kit CLI - Main entry point."""
+"""PRD Kit CLI - Main entry point.
 
-import typer
-from rich.console import Console
+Kept free of heavy imports: `prd version` is answered without loading typer
+or rich, and every other command loads the Typer application on demand.
+"""
 
-from prd_kit.commands.init import init_command
-from prd_kit.commands.update import update_command
-from prd_kit.commands.version import version_command
+import sys
+from typing import TYPE_CHECKING
 
-app = typer.Typer(
-    name="prd",
-    help="PRD Kit - Product Requirements Document generation with AI agents",
-    no_args_is_help=True,
-)
+if TYPE_CHECKING:
+    import typer
 
-console = Console()
 
+def main() -> None:
+    """Run the `prd` command."""
+    if sys.argv[1:] == ["version"]:
+        from prd_kit.commands.version import version_command
 
-@app.command("init")
-def init(
-    path: str = typer.Argument(
-        ".",
-        help="Path to initialize the PRD Kit project. Use '.' for current directory.",
-    ),
-    ai: str = typer.Option(
-        "copilot",
-        "--ai",
-        "-a",
-        help="AI agent to configure: copilot, claude",
-    ),
-    script: str = typer.Option(
-        None,
-        "--script",
-        "-s",
-        help="Script type: sh (bash) or ps (powershell). Auto-detected if not specified.",
-    ),
-    here: bool = typer.Option(
-        False,
-        "--here",
-        help="Initialize in current directory (same as path='.')",
-    ),
-    force: bool = typer.Option(
-        False,
-        "--force",
-        "-f",
-        help="Force initialization in non-empty directory",
-    ),
-    no_git: bool = typer.Option(
-        False,
-        "--no-git",
-        help="Skip git repository initialization",
-    ),
-) -> None:
-    """Initialize a new PRD Kit project."""
-    target_path = "." if here else path
-    init_command(
-        path=target_path,
-        ai=ai,
-        script=script,
-        force=force,
-        no_git=no_git,
-    )
+        version_command()
+        return
 
+    from prd_kit.app import app
+
+    app()
 
-@app.command("update")
-def update(
-    ai: str = typer.Option(
-        None,
-        "--ai",
-        "-a",
-        help="AI agent to update: copilot, claude. Auto-detected if not specified.",
-    ),
-    script: str = typer.Option(
-        None,
-        "--script",
-        "-s",
-        help="Script type: sh (bash) or ps (powershell). Auto-detected if not specified.",
-    ),
-) -> None:
-    """Update PRD Kit templates and agents in current project."""
-    update_command(ai=ai, script=script)
 
+def __getattr__(name: str) -> "typer.Typer":
+    """Expose the Typer application as `prd_kit.cli.app` without importing it eagerly."""
+    if name == "app":
+        from prd_kit.app import app
 
-@app.command("version")
-def version() -> None:
-    """Show PRD Kit version."""
-    version_command()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -0,0 +1,44 @@
+"""Daemon command implementation."""
+
+import sys
+from pathlib import Path
+
+from rich.console import Console
+
+console = Console()
+
+
+def daemon_command(stop: bool) -> None:
+    """Run (or stop) the PRD Kit daemon for the current project.
+
+    The daemon is served by the project's own copy of prd_scripts so that it
+    answers exactly like the scripts the agents would otherwise run.
+    """
+    target = Path.cwd()
+    scripts_dir = target / ".prd-kit" / "scripts"
+    if not (scripts_dir / "prd_scripts" / "daemon.py").is_file():
+        console.print(
+            "[red]Error:[/red] Not in a PRD Kit project directory (or scripts are outdated)"
+        )
+        console.print("Run [cyan]prd init[/cyan] or [cyan]prd update[/cyan] first")
+        raise SystemExit(1)
+
+    sys.path.insert(0, str(scripts_dir))
+    import prd_scripts.daemon as daemon
+    from prd_scripts.client import DAEMON_SUPPORTED
+
+    if not DAEMON_SUPPORTED:
+        console.print(
+            "[yellow]The daemon is not supported on this platform[/yellow] (no Unix sockets)"
+        )
+        console.print("Agent commands still work: the client runs each script directly")
+        raise SystemExit(1)
+
+    if stop:
+        if daemon.stop(target):
+            console.print("[green]✓ Daemon stopped[/green]")
+        else:
+            console.print("[yellow]No daemon running[/yellow]")
+        return
+
+    raise SystemExit(daemon.serve(target))
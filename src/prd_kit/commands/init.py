@@ -1,17 +1,26 @@
 """Init command implementation."""
 
-import shutil
+import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
-console = Console()
+from prd_kit.gitignore import ensure_gitignore
+from prd_kit.manifest import (
+    record_installed_file,
+    stat_installed_file,
+    write_installed_manifest,
+)
+from prd_kit.resources import TemplateSource, open_templates
+from prd_kit.tracing import span
 
-# Paths relative to the package
-PACKAGE_DIR = Path(__file__).parent.parent
-TEMPLATES_DIR = PACKAGE_DIR / "templates"
+console = Console()
 
 # PRD Kit ASCII Art
 PRD_KIT_BANNER = """
@@ -33,12 +42,18 @@ def init_command(
     script: str | None,
     force: bool,
     no_git: bool,
+    quiet: bool = False,
 ) -> None:
-    """Initialize a new PRD Kit project."""
+    """Initialize a new PRD Kit project.
+
+    With quiet=True nothing is printed except, on success, a JSON list of the
+    paths created (relative to the project directory).
+    """
     target = Path(path).resolve()
 
     # Print banner
-    console.print(PRD_KIT_BANNER)
+    if not quiet:
+        console.print(PRD_KIT_BANNER)
 
     # Validate AI option
     supported_ai = ["copilot", "claude", "antigravity"]
@@ -59,6 +74,11 @@ def init_command(
         visible_contents = [c for c in contents if not c.name.startswith(".")]
         if visible_contents:
             if not force:
+                if quiet:
+                    Console(stderr=True).print(
+                        f"[red]Error:[/red] Directory is not empty: {target} (use --force)"
+                    )
+                    raise SystemExit(1)
                 # Prompt user for confirmation
                 console.print(f"\n[yellow]Warning:[/yellow] Current directory is not empty ({len(visible_contents)} items)")
                 console.print("Template files will be merged with existing content and may overwrite existing files")
@@ -69,6 +89,20 @@ def init_command(
     else:
         target.mkdir(parents=True, exist_ok=True)
 
+    if quiet:
+        console.quiet = True
+        try:
+            created = _create_directory_structure(target, ai)
+            if not no_git:
+                gitignore_existed = (target / ".gitignore").exists()
+                _init_git(target)
+                if not gitignore_existed and (target / ".gitignore").exists():
+                    created.append(target / ".gitignore")
+        finally:
+            console.quiet = False
+        print(json.dumps([p.relative_to(target).as_posix() for p in created]))
+        return
+
     console.print(f"[bold blue]Initializing PRD Kit[/bold blue] in {target}")
     console.print(f"  AI Agent: [green]{ai}[/green]")
     console.print(f"  Scripts: [green]Python (cross-platform)[/green]")
@@ -86,8 +120,12 @@ def init_command(
     console.print("  2. Start a new PRD with [cyan]@prd-discover[/cyan] in your AI assistant")
 
 
-def _create_directory_structure(target: Path, ai: str) -> None:
-    """Create the PRD Kit directory structure."""
+def _create_directory_structure(target: Path, ai: str) -> list[Path]:
+    """Create the PRD Kit directory structure.
+
+    Returns:
+        Directories and files that did not exist before, in creation order
+    """
     # .prd-kit structure
     prd_kit_dir = target / ".prd-kit"
 
@@ -108,16 +146,48 @@ def _create_directory_structure(target: Path, ai: str) -> None:
     elif ai == "antigravity":
         dirs_to_create.append(target / ".agent" / "workflows")
 
+    created = [d for d in dirs_to_create if not d.exists()]
     for dir_path in dirs_to_create:
         dir_path.mkdir(parents=True, exist_ok=True)
-        console.print(f"  Created: [dim]{dir_path.relative_to(target)}[/dim]")
+    console.print(f"  Created {len(created)} directories")
 
     # Copy template files
-    _copy_templates(target, ai)
-
-
-def _copy_templates(target: Path, ai: str) -> None:
-    """Copy template files to the target directory."""
+    return created + _copy_templates(target, ai)
+
+
+def _copy_template(
+    templates: TemplateSource, src_name: str, dest_path: Path
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Copy one template file (run in a worker thread).
+
+    Returns:
+        The installed-manifest and stat sidecar records for the file, or None
+        if it is not managed
+    """
+    if not templates.exists(src_name):
+        # Create placeholder if template doesn't exist yet
+        dest_path.write_text(f"# TODO: Template content for {src_name}\n")
+        return None
+
+    with span("copy template", "io", path=src_name):
+        templates.copy(src_name, dest_path)
+    # Record managed files so `prd update` can skip unchanged ones;
+    # memory/ holds user data and is never managed
+    if src_name.startswith("memory/"):
+        return None
+    digest = templates.hash(src_name)
+    return record_installed_file(src_name, digest), stat_installed_file(digest, dest_path)
+
+
+def _copy_templates(target: Path, ai: str) -> list[Path]:
+    """Copy template files to the target directory.
+
+    Parent directories are created in one pass up front, then files are
+    copied by a thread pool behind a single progress bar.
+
+    Returns:
+        Files that did not exist before
+    """
     prd_kit_dir = target / ".prd-kit"
 
     # Template mappings: source -> destination
@@ -157,7 +227,23 @@ def _copy_templates(target: Path, ai: str) -> None:
     # Python scripts (cross-platform)
     script_templates = {
         "scripts/prd_scripts/__init__.py": prd_kit_dir / "scripts" / "prd_scripts" / "__init__.py",
+        "scripts/prd_scripts/allocator.py": prd_kit_dir / "scripts" / "prd_scripts" / "allocator.py",
+        "scripts/prd_scripts/cache.py": prd_kit_dir / "scripts" / "prd_scripts" / "cache.py",
+        "scripts/prd_scripts/check_completeness.py": prd_kit_dir / "scripts" / "prd_scripts" / "check_completeness.py",
+        "scripts/prd_scripts/check_deliverables.py": prd_kit_dir / "scripts" / "prd_scripts" / "check_deliverables.py",
+        "scripts/prd_scripts/client.py": prd_kit_dir / "scripts" / "prd_scripts" / "client.py",
         "scripts/prd_scripts/common.py": prd_kit_dir / "scripts" / "prd_scripts" / "common.py",
+        "scripts/prd_scripts/daemon.py": prd_kit_dir / "scripts" / "prd_scripts" / "daemon.py",
+        "scripts/prd_scripts/gitrefs.py": prd_kit_dir / "scripts" / "prd_scripts" / "gitrefs.py",
+        "scripts/prd_scripts/graph.py": prd_kit_dir / "scripts" / "prd_scripts" / "graph.py",
+        "scripts/prd_scripts/implementation_order.py": prd_kit_dir / "scripts" / "prd_scripts" / "implementation_order.py",
+        "scripts/prd_scripts/index.py": prd_kit_dir / "scripts" / "prd_scripts" / "index.py",
+        "scripts/prd_scripts/markdown.py": prd_kit_dir / "scripts" / "prd_scripts" / "markdown.py",
+        "scripts/prd_scripts/pack.py": prd_kit_dir / "scripts" / "prd_scripts" / "pack.py",
+        "scripts/prd_scripts/scanner.py": prd_kit_dir / "scripts" / "prd_scripts" / "scanner.py",
+        "scripts/prd_scripts/status.py": prd_kit_dir / "scripts" / "prd_scripts" / "status.py",
+        "scripts/prd_scripts/tokens.py": prd_kit_dir / "scripts" / "prd_scripts" / "tokens.py",
+        "scripts/prd_scripts/trace.py": prd_kit_dir / "scripts" / "prd_scripts" / "trace.py",
         "scripts/prd_scripts/setup_constitution.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_constitution.py",
         "scripts/prd_scripts/setup_discover.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_discover.py",
         "scripts/prd_scripts/setup_draft.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_draft.py",
@@ -238,28 +324,60 @@ def _copy_templates(target: Path, ai: str) -> None:
         **agent_templates.get(ai, {}),
     }
 
-    for src_name, dest_path in all_templates.items():
-        src_path = TEMPLATES_DIR / src_name
-        if src_path.exists():
-            shutil.copy2(src_path, dest_path)
-            console.print(f"  Copied: [dim]{dest_path.relative_to(target)}[/dim]")
-        else:
-            # Create placeholder if template doesn't exist yet
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            dest_path.write_text(f"# TODO: Template content for {src_name}\n")
-            console.print(f"  Created placeholder: [yellow]{dest_path.relative_to(target)}[/yellow]")
-
-
+    created = [dest for dest in all_templates.values() if not dest.exists()]
+
+    for parent in {dest.parent for dest in all_templates.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    installed: dict[str, dict[str, Any]] = {}
+    stats: dict[str, dict[str, Any]] = {}
+    placeholders = []
+    with (
+        open_templates() as templates,
+        ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) + 4)) as pool,
+        Progress(
+            TextColumn("  Copying templates"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+            disable=not console.is_terminal,
+        ) as progress,
+    ):
+        task = progress.add_task("copy", total=len(all_templates))
+        futures = {
+            pool.submit(_copy_template, templates, src_name, dest_path): (src_name, dest_path)
+            for src_name, dest_path in all_templates.items()
+        }
+        for future, (src_name, dest_path) in futures.items():
+            records = future.result()
+            if records is not None:
+                rel_path = dest_path.relative_to(target).as_posix()
+                installed[rel_path], stats[rel_path] = records
+            elif not templates.exists(src_name):
+                placeholders.append(dest_path)
+            progress.advance(task)
+
+    console.print(f"  Copied {len(all_templates) - len(placeholders)} template files")
+    for dest_path in placeholders:
+        console.print(f"  Created placeholder: [yellow]{dest_path.relative_to(target)}[/yellow]")
+
+    write_installed_manifest(prd_kit_dir, installed, stats)
 
     # Create .gitkeep in prds/
-    (target / "prds" / ".gitkeep").touch()
+    gitkeep = target / "prds" / ".gitkeep"
+    if not gitkeep.exists():
+        created.append(gitkeep)
+    gitkeep.touch()
 
     # Create README.md
     readme = target / "README.md"
     if not readme.exists():
         readme.write_text(_generate_readme(ai))
         console.print(f"  Created: [dim]README.md[/dim]")
+        created.append(readme)
 
+    return created
 
 
 def _generate_readme(ai: str) -> str:
@@ -343,23 +461,24 @@ def _init_git(target: Path) -> None:
     git_dir = target / ".git"
     if git_dir.exists():
         console.print("  [dim]Git repository already exists[/dim]")
+        _update_gitignore(target)
         return
 
     try:
-        subprocess.run(
-            ["git", "init"],
-            cwd=target,
-            check=True,
-            capture_output=True,
-        )
+        with span("git init", "git", cwd=str(target)):
+            subprocess.run(
+                ["git", "init"],
+                cwd=target,
+                check=True,
+                capture_output=True,
+            )
         console.print("  [green]Initialized git repository[/green]")
 
         # Create .gitignore
         gitignore = target / ".gitignore"
         if not gitignore.exists():
             gitignore.write_text(
-                """# PRD Kit
-*.pyc
+                """*.pyc
 __pycache__/
 .env
 .venv/
@@ -374,3 +493,12 @@ build/
         console.print("  [yellow]Warning: git not found, skipping repository init[/yellow]")
     except subprocess.CalledProcessError as e:
         console.print(f"  [yellow]Warning: git init failed: {e}[/yellow]")
+    else:
+        _update_gitignore(target)
+
+
+def _update_gitignore(target: Path) -> None:
+    """Add PRD Kit's local state files to .gitignore."""
+    added = ensure_gitignore(target)
+    if added:
+        console.print(f"  Added {len(added)} PRD Kit entries to [dim].gitignore[/dim]")
@@ -0,0 +1,166 @@
+"""Status command implementation."""
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from prd_kit.resources import add_scripts_to_path
+from prd_kit.tracing import span
+
+console = Console()
+
+# Reuse the status detector shipped to projects in prd_scripts
+add_scripts_to_path()
+from prd_scripts.status import NEEDS_DETAIL_MARKER, detect_feature_status  # noqa: E402
+
+NEEDS_DETAIL_BYTES = NEEDS_DETAIL_MARKER.encode()
+UNCHECKED_TASK_PATTERN = re.compile(rb"^\s*[-*] \[ \]", re.MULTILINE)
+CHECKED_TASK_PATTERN = re.compile(rb"^\s*[-*] \[[xX]\]", re.MULTILINE)
+
+# Spec documents in pipeline order: the first missing one is the next phase
+SPEC_PHASES = (
+    ("context.md", "context"),
+    ("plan.md", "plan"),
+    ("tasks.md", "tasks"),
+)
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+def feature_status(feature_dir: Path) -> dict[str, Any]:
+    """Compute the dashboard row for one prds/<feature>/ directory."""
+    needs_detail = sum(
+        _read_bytes(feature_dir / name).count(NEEDS_DETAIL_BYTES)
+        for name in ("research.md", "PRD.md")
+    )
+    return {
+        "feature": feature_dir.name,
+        "status": detect_feature_status(feature_dir),
+        "needs_detail": needs_detail,
+    }
+
+
+def spec_status(spec_dir: Path) -> dict[str, Any]:
+    """Compute the dashboard row for one specs/<spec>/ directory."""
+    names = set(os.listdir(spec_dir))
+    has_deliverable = "deliverable.md" in names or any(
+        n.startswith("deliverable-") and n.endswith(".md") for n in names
+    )
+
+    next_phase = "implement"
+    for file_name, phase in SPEC_PHASES:
+        if file_name not in names:
+            next_phase = phase
+            break
+    if not has_deliverable:
+        next_phase = "init-feature"
+
+    tasks = _read_bytes(spec_dir / "tasks.md") if "tasks.md" in names else b""
+    unchecked = len(UNCHECKED_TASK_PATTERN.findall(tasks))
+    checked = len(CHECKED_TASK_PATTERN.findall(tasks))
+    if next_phase == "implement" and tasks and unchecked == 0:
+        next_phase = "done"
+
+    return {
+        "spec": spec_dir.name,
+        "has_deliverable": has_deliverable,
+        "has_context": "context.md" in names,
+        "has_plan": "plan.md" in names,
+        "has_tasks": "tasks.md" in names,
+        "next": next_phase,
+        "tasks_open": unchecked,
+        "tasks_done": checked,
+    }
+
+
+def _subdirs(directory: Path) -> list[Path]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(e.path) for e in entries
+                if e.is_dir() and not e.name.startswith(".")
+            )
+    except OSError:
+        return []
+
+
+def collect_status(root: Path, jobs: int | None = None) -> dict[str, Any]:
+    """Compute status rows for every feature and spec, concurrently."""
+    features = _subdirs(root / "prds")
+    specs = _subdirs(root / "specs")
+
+    with span("collect status", "command", features=len(features), specs=len(specs)):
+        with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            feature_rows = pool.map(feature_status, features)
+            spec_rows = pool.map(spec_status, specs)
+            return {"features": list(feature_rows), "specs": list(spec_rows)}
+
+
+def _print_tables(status: dict[str, Any]) -> None:
+    features = Table(title="PRDs", title_justify="left")
+    features.add_column("Feature", style="cyan", no_wrap=True)
+    features.add_column("Status")
+    features.add_column("NEEDS_DETAIL", justify="right")
+    for row in status["features"]:
+        needs = str(row["needs_detail"]) if row["needs_detail"] else "[dim]0[/dim]"
+        features.add_row(row["feature"], row["status"], needs)
+
+    specs = Table(title="Specs", title_justify="left")
+    specs.add_column("Spec", style="cyan", no_wrap=True)
+    for header in ("Deliverable", "Context", "Plan", "Tasks"):
+        specs.add_column(header, justify="center")
+    specs.add_column("Next")
+    specs.add_column("Open tasks", justify="right")
+
+    def mark(value: bool) -> str:
+        return "[green]✓[/green]" if value else "[dim]–[/dim]"
+
+    for row in status["specs"]:
+        specs.add_row(
+            row["spec"],
+            mark(row["has_deliverable"]),
+            mark(row["has_context"]),
+            mark(row["has_plan"]),
+            mark(row["has_tasks"]),
+            row["next"],
+            (
+                f"{row['tasks_open']}/{row['tasks_open'] + row['tasks_done']}"
+                if row["has_tasks"] else ""
+            ),
+        )
+
+    if status["features"]:
+        console.print(features)
+    else:
+        console.print("[dim]No features in prds/[/dim]")
+    if status["specs"]:
+        console.print(specs)
+    else:
+        console.print("[dim]No specs in specs/[/dim]")
+
+
+def status_command(as_json: bool, jobs: int | None) -> None:
+    """Show where every feature and spec is in the pipeline."""
+    root = Path.cwd()
+    if not (root / ".prd-kit").is_dir():
+        console.print("[red]Error:[/red] Not in a PRD Kit project directory")
+        console.print("Run [cyan]prd init[/cyan] first to initialize a project")
+        raise SystemExit(1)
+
+    status = collect_status(root, jobs)
+
+    if as_json:
+        print(json.dumps(status, indent=2))
+    else:
+        _print_tables(status)
@@ -1,13 +1,20 @@
 """Update command implementation."""
 
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 
-from prd_kit.commands.init import (
-    PACKAGE_DIR,
-    TEMPLATES_DIR,
+from prd_kit.gitignore import ensure_gitignore
+from prd_kit.manifest import (
+    is_unchanged_on_disk,
+    load_installed_manifest,
+    load_installed_stats,
+    record_installed_file,
+    stat_installed_file,
+    write_installed_manifest,
 )
+from prd_kit.resources import open_templates
 
 console = Console()
 
@@ -50,6 +57,11 @@ def update_command(
     # Update files (excluding user data)
     _update_files(target, ai)
 
+    # Keep local state (index, caches, traces) out of version control
+    added = ensure_gitignore(target)
+    if added:
+        console.print(f"  Added {len(added)} PRD Kit entries to [dim].gitignore[/dim]")
+
     console.print("\n[bold green]✓ PRD Kit updated successfully![/bold green]")
     console.print("\n[yellow]Note:[/yellow] Your PRDs and product-constitution.md were preserved")
 
@@ -92,7 +104,23 @@ def _update_files(target: Path, ai: str) -> None:
         ),
         # Python scripts (cross-platform)
         "scripts/prd_scripts/__init__.py": prd_kit_dir / "scripts" / "prd_scripts" / "__init__.py",
+        "scripts/prd_scripts/allocator.py": prd_kit_dir / "scripts" / "prd_scripts" / "allocator.py",
+        "scripts/prd_scripts/cache.py": prd_kit_dir / "scripts" / "prd_scripts" / "cache.py",
+        "scripts/prd_scripts/check_completeness.py": prd_kit_dir / "scripts" / "prd_scripts" / "check_completeness.py",
+        "scripts/prd_scripts/check_deliverables.py": prd_kit_dir / "scripts" / "prd_scripts" / "check_deliverables.py",
+        "scripts/prd_scripts/client.py": prd_kit_dir / "scripts" / "prd_scripts" / "client.py",
         "scripts/prd_scripts/common.py": prd_kit_dir / "scripts" / "prd_scripts" / "common.py",
+        "scripts/prd_scripts/daemon.py": prd_kit_dir / "scripts" / "prd_scripts" / "daemon.py",
+        "scripts/prd_scripts/gitrefs.py": prd_kit_dir / "scripts" / "prd_scripts" / "gitrefs.py",
+        "scripts/prd_scripts/graph.py": prd_kit_dir / "scripts" / "prd_scripts" / "graph.py",
+        "scripts/prd_scripts/implementation_order.py": prd_kit_dir / "scripts" / "prd_scripts" / "implementation_order.py",
+        "scripts/prd_scripts/index.py": prd_kit_dir / "scripts" / "prd_scripts" / "index.py",
+        "scripts/prd_scripts/markdown.py": prd_kit_dir / "scripts" / "prd_scripts" / "markdown.py",
+        "scripts/prd_scripts/pack.py": prd_kit_dir / "scripts" / "prd_scripts" / "pack.py",
+        "scripts/prd_scripts/scanner.py": prd_kit_dir / "scripts" / "prd_scripts" / "scanner.py",
+        "scripts/prd_scripts/status.py": prd_kit_dir / "scripts" / "prd_scripts" / "status.py",
+        "scripts/prd_scripts/tokens.py": prd_kit_dir / "scripts" / "prd_scripts" / "tokens.py",
+        "scripts/prd_scripts/trace.py": prd_kit_dir / "scripts" / "prd_scripts" / "trace.py",
         "scripts/prd_scripts/setup_constitution.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_constitution.py",
         "scripts/prd_scripts/setup_discover.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_discover.py",
         "scripts/prd_scripts/setup_draft.py": prd_kit_dir / "scripts" / "prd_scripts" / "setup_draft.py",
@@ -163,61 +191,83 @@ def _update_files(target: Path, ai: str) -> None:
             "agents/antigravity/prd-implement.md": target / ".agent" / "workflows" / "prd-implement.md",
         })
 
-    # Cleanup: Remove obsolete files
-    cleaned_count = 0
-    
-    # Directories that should only contain managed files
-    dirs_to_scan = [
-        prd_kit_dir / "templates",
-        prd_kit_dir / "commands",
-        prd_kit_dir / "validators",
-        prd_kit_dir / "scripts" / "prd_scripts",
-    ]
-    
-    if ai == "copilot":
-        dirs_to_scan.append(target / ".github" / "agents")
-    elif ai == "antigravity":
-        dirs_to_scan.append(target / ".agent" / "workflows")
-    
-    # Create set of expected paths for fast lookup
-    expected_paths = set(files_to_update.values())
-    
-    for dir_path in dirs_to_scan:
-        if not dir_path.exists():
-            continue
-            
-        for file_path in dir_path.iterdir():
-            if file_path.is_file():
-                # Skip partial files or hidden files if needed
-                if file_path.name.startswith("."):
-                    continue
-                
-                # If file exists on disk but not in our expected list, delete it
-                if file_path not in expected_paths:
-                    try:
-                        file_path.unlink()
-                        console.print(f"  Removed: [red]{file_path.relative_to(target)}[/red]")
-                        cleaned_count += 1
-                    except Exception as e:
-                        console.print(f"  [yellow]Failed to remove {file_path.relative_to(target)}: {e}[/yellow]")
-
-    # Copy files
-    updated_count = 0
-    created_count = 0
-    for src_name, dest_path in files_to_update.items():
-        src_path = TEMPLATES_DIR / src_name
-        if src_path.exists():
+    previous = load_installed_manifest(prd_kit_dir)
+    previous_files = previous or {}
+    previous_stats = load_installed_stats(prd_kit_dir)
+
+    with open_templates() as templates:
+        # Copy files whose template changed or that were modified/removed on disk
+        installed: dict[str, dict[str, Any]] = {}
+        stats: dict[str, dict[str, Any]] = {}
+        updated_count = 0
+        created_count = 0
+        unchanged_count = 0
+        for src_name, dest_path in files_to_update.items():
+            if not templates.exists(src_name):
+                continue
+
+            rel_path = dest_path.relative_to(target).as_posix()
+            digest = templates.hash(src_name)
+            record = previous_files.get(rel_path)
+            # Manifests written before the stat sidecar kept size/mtime in the record
+            stat_record = previous_stats.get(rel_path, record)
+            if (
+                record
+                and record.get("sha256") == digest
+                and is_unchanged_on_disk(dest_path, digest, stat_record)
+            ):
+                installed[rel_path] = record_installed_file(src_name, digest)
+                stats[rel_path] = stat_installed_file(digest, dest_path)
+                unchanged_count += 1
+                continue
+
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            if dest_path.exists():
-                shutil.copy2(src_path, dest_path)
-                console.print(f"  Updated: [dim]{dest_path.relative_to(target)}[/dim]")
+            existed = dest_path.exists()
+            templates.copy(src_name, dest_path)
+            installed[rel_path] = record_installed_file(src_name, digest)
+            stats[rel_path] = stat_installed_file(digest, dest_path)
+            if existed:
+                console.print(f"  Updated: [dim]{rel_path}[/dim]")
                 updated_count += 1
             else:
-                shutil.copy2(src_path, dest_path)
-                console.print(f"  Created: [green]{dest_path.relative_to(target)}[/green]")
+                console.print(f"  Created: [green]{rel_path}[/green]")
                 created_count += 1
 
-    console.print(f"\n[green]Updated {updated_count} files, created {created_count} new files, removed {cleaned_count} obsolete files[/green]")
+        # Cleanup: remove files a previous init/update installed whose template is
+        # no longer shipped. Files PRD Kit never installed are left alone, and
+        # files for another AI agent that are still shipped stay recorded.
+        cleaned_count = 0
+        for rel_path, record in previous_files.items():
+            if rel_path in installed:
+                continue
+            source = record.get("source", "")
+            if templates.exists(source):
+                installed[rel_path] = record_installed_file(source, record.get("sha256", ""))
+                if rel_path in previous_stats:
+                    stats[rel_path] = previous_stats[rel_path]
+                continue
+
+            file_path = target / rel_path
+            if not file_path.is_file():
+                continue
+            try:
+                file_path.unlink()
+                console.print(f"  Removed: [red]{rel_path}[/red]")
+                cleaned_count += 1
+            except OSError as e:
+                console.print(f"  [yellow]Failed to remove {rel_path}: {e}[/yellow]")
+
+    write_installed_manifest(prd_kit_dir, installed, stats)
+
+    console.print(
+        f"\n[green]Updated {updated_count} files, created {created_count} new files, "
+        f"removed {cleaned_count} obsolete files ({unchanged_count} unchanged)[/green]"
+    )
+    if previous is None:
+        console.print(
+            "[dim]No .prd-kit/manifest.json found: obsolete files from older versions were "
+            "not removed. Future updates will track installed files.[/dim]"
+        )
 
     # Migration Check: Tech Constitution
     tech_const_dest = prd_kit_dir / "memory" / "tech-constitution.md"
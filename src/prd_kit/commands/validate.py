@@ -0,0 +1,113 @@
+"""Validate command implementation."""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+
+from prd_kit.tracing import span
+from prd_kit.validators import COMPLETENESS, DELIVERABLES, validate, validator_for
+
+console = Console(stderr=True)
+
+
+def _validate_target(validator: str, path: str, use_cache: bool = True) -> dict[str, Any]:
+    """Run one validator on one path. Executed inside a worker process."""
+    try:
+        with span(validator, "validator", path=path):
+            result = validate(Path(path), validator, use_cache=use_cache)
+    except Exception as e:
+        return {
+            "validator": validator,
+            "path": path,
+            "passed": False,
+            "issues": [f"Validator crashed: {e}"],
+            "warnings": [],
+        }
+
+    return {"validator": validator, "path": path, **result._asdict()}
+
+
+def discover_targets(root: Path) -> list[tuple[str, Path]]:
+    """Find every research.md, PRD.md and deliverables directory under prds/."""
+    targets: list[tuple[str, Path]] = []
+    prds_dir = root / "prds"
+    if not prds_dir.is_dir():
+        return targets
+
+    for feature_dir in sorted(prds_dir.iterdir()):
+        if not feature_dir.is_dir() or feature_dir.name.startswith("."):
+            continue
+        for doc_name in ("research.md", "PRD.md"):
+            doc = feature_dir / doc_name
+            if doc.is_file():
+                targets.append((COMPLETENESS, doc.relative_to(root)))
+        deliverables_dir = feature_dir / "deliverables"
+        if deliverables_dir.is_dir():
+            targets.append((DELIVERABLES, deliverables_dir.relative_to(root)))
+
+    return targets
+
+
+def _classify_path(path: Path) -> tuple[str, Path]:
+    """Pick the validator for an explicitly given path."""
+    return validator_for(path), path
+
+
+def validate_command(
+    paths: list[str] | None,
+    all_files: bool,
+    jobs: int | None,
+    use_cache: bool = True,
+) -> None:
+    """Validate PRD documents and deliverables, streaming NDJSON results."""
+    root = Path.cwd()
+
+    targets: list[tuple[str, Path]] = []
+    if all_files:
+        with span("discover targets", "scan", root=str(root)):
+            targets.extend(discover_targets(root))
+    for path in paths or []:
+        targets.append(_classify_path(Path(path)))
+
+    if not targets:
+        if not all_files and not paths:
+            console.print("[red]Error:[/red] Provide one or more paths or use [cyan]--all[/cyan]")
+        else:
+            console.print("[yellow]No documents found to validate[/yellow]")
+        raise SystemExit(1)
+
+    workers = jobs or os.cpu_count() or 1
+    workers = max(1, min(workers, len(targets)))
+
+    failed = 0
+    if workers == 1:
+        results = (_validate_target(v, str(p), use_cache) for v, p in targets)
+        for result in results:
+            failed += _emit(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_validate_target, v, str(p), use_cache) for v, p in targets
+            ]
+            for future in as_completed(futures):
+                failed += _emit(future.result())
+
+    passed = len(targets) - failed
+    if failed:
+        console.print(
+            f"[red]✗ {failed} of {len(targets)} validations failed[/red] ({passed} passed)"
+        )
+        raise SystemExit(1)
+    console.print(f"[green]✓ All {len(targets)} validations passed[/green]")
+
+
+def _emit(result: dict[str, Any]) -> int:
+    """Write one NDJSON result line. Returns 1 if the validation failed."""
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+    return 0 if result["passed"] else 1
@@ -1,12 +1,17 @@
 """Version command implementation."""
 
-from rich.console import Console
+import sys
 
 from prd_kit import __version__
 
-console = Console()
-
 
 def version_command() -> None:
     """Display the current PRD Kit version."""
-    console.print(f"[bold blue]PRD Kit[/bold blue] version [green]{__version__}[/green]")
+    # Plain output (and no rich import) when piped or captured
+    if not sys.stdout.isatty():
+        print(f"PRD Kit version {__version__}")
+        return
+
+    from rich.console import Console
+
+    Console().print(f"[bold blue]PRD Kit[/bold blue] version [green]{__version__}[/green]")
@@ -0,0 +1,285 @@
+"""Watch command implementation."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+
+from prd_kit.commands.validate import _validate_target
+
+console = Console()
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots of the watched trees."""
+
+    def __init__(self, roots: list[Path], interval: float = 0.5):
+        self.roots = roots
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        stack = [root for root in self.roots if root.is_dir()]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir():
+                        stack.append(Path(entry.path))
+                    else:
+                        st = entry.stat()
+                        snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block until files change (or timeout expires) and return them."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify (through libc, no extra dependencies)."""
+
+    def __init__(self, roots: list[Path]):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = roots
+        self._watches: dict[int, Path] = {}
+        for root in roots:
+            if root.is_dir():
+                self._add_tree(root)
+            else:
+                # Root does not exist yet: watch the closest existing parent
+                parent = root.parent
+                while not parent.is_dir() and parent != parent.parent:
+                    parent = parent.parent
+                self._add_watch(parent)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), IN_WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> None:
+        self._add_watch(directory)
+        for dirpath, dirnames, _ in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in dirnames:
+                self._add_watch(Path(dirpath) / name)
+
+    def _is_watched(self, path: Path) -> bool:
+        return any(path == root or root in path.parents for root in self.roots)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block until files change (or timeout expires) and return them."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            wd, mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            if not self._is_watched(path):
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def create_watcher(
+    roots: list[Path], force_polling: bool = False
+) -> InotifyWatcher | PollingWatcher:
+    """Create an inotify watcher where available, else a polling watcher."""
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots)
+
+
+def target_for_path(path: Path) -> tuple[str, Path] | None:
+    """Map a changed file (relative to the project root) to its validator target."""
+    parts = path.parts
+    if len(parts) >= 3 and parts[0] == "prds":
+        if len(parts) == 3 and parts[2] in ("research.md", "PRD.md"):
+            return "check-completeness", path
+        if len(parts) == 4 and parts[2] == "deliverables":
+            return "check-deliverables", Path(*parts[:3])
+    if len(parts) == 3 and parts[0] == "specs":
+        if parts[2].startswith("deliverable") and parts[2].endswith(".md"):
+            return "check-deliverables", path
+    return None
+
+
+def initial_targets(roots: list[Path], root: Path) -> set[tuple[str, Path]]:
+    """Collect every validator target currently present in the watched trees."""
+    targets: set[tuple[str, Path]] = set()
+    for watched in roots:
+        if not watched.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(watched):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                target = target_for_path((Path(dirpath) / name).relative_to(root))
+                if target is not None:
+                    targets.add(target)
+    return targets
+
+
+def _report(
+    validator: str, path: Path, result: dict[str, Any], previous: dict[str, Any] | None
+) -> None:
+    """Print a validation result as a diff against the previous run."""
+    findings = set(result.get("issues", [])) | set(result.get("warnings", []))
+    old_findings = set()
+    if previous is not None:
+        old_findings = set(previous.get("issues", [])) | set(previous.get("warnings", []))
+
+    stamp = datetime.now().strftime("%H:%M:%S")
+    status = "[green]✓ passed[/green]" if result["passed"] else "[red]✗ failed[/red]"
+    console.print(
+        f"[dim]{stamp}[/dim] {path} {status} "
+        f"[dim]({len(result.get('issues', []))} issues, "
+        f"{len(result.get('warnings', []))} warnings)[/dim]"
+    )
+    if previous is None:
+        return
+    for finding in sorted(findings - old_findings):
+        console.print(f"  [red]+ {finding}[/red]")
+    for finding in sorted(old_findings - findings):
+        console.print(f"  [green]- {finding}[/green]")
+
+
+def watch_command(
+    feature: str | None,
+    debounce: float,
+    poll: bool,
+) -> None:
+    """Watch prds/ and specs/ and re-validate files as they change."""
+    root = Path.cwd()
+
+    if feature:
+        feature_dir = root / "prds" / feature
+        if not feature_dir.is_dir():
+            console.print(f"[red]Error:[/red] Feature not found: prds/{feature}")
+            raise SystemExit(1)
+        roots = [feature_dir, root / "specs"]
+    else:
+        roots = [root / "prds", root / "specs"]
+
+    watcher = create_watcher(roots, force_polling=poll)
+    mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    watched = ", ".join(str(r.relative_to(root)) for r in roots)
+    console.print(f"[bold blue]Watching[/bold blue] {watched} [dim]({mode}, Ctrl+C to stop)[/dim]")
+
+    results: dict[tuple[str, Path], dict[str, Any]] = {}
+    for validator, path in sorted(initial_targets(roots, root)):
+        results[(validator, path)] = _validate_target(validator, str(path))
+        _report(validator, path, results[(validator, path)], None)
+
+    pending: set[Path] = set()
+    try:
+        while True:
+            # Keep collecting until writes have been quiet for `debounce` seconds
+            changed = watcher.wait(debounce if pending else None)
+            if changed:
+                pending |= changed
+                continue
+
+            targets = set()
+            for changed_path in pending:
+                try:
+                    relative = changed_path.relative_to(root)
+                except ValueError:
+                    continue
+                target = target_for_path(relative)
+                if target is not None:
+                    targets.add(target)
+            pending.clear()
+
+            for validator, path in sorted(targets):
+                previous = results.get((validator, path))
+                if not (root / path).exists():
+                    results.pop((validator, path), None)
+                    console.print(f"[dim]{path} removed[/dim]")
+                    continue
+                result = _validate_target(validator, str(path))
+                results[(validator, path)] = result
+                _report(validator, path, result, previous)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching[/dim]")
+    finally:
+        watcher.close()
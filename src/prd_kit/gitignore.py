@@ -0,0 +1,54 @@
+"""PRD Kit - .gitignore entries for generated project files.
+
+The workspace index, result and pack caches, traces, the daemon socket, the
+feature-counter lock and the installed manifest's stat sidecar are local
+state that must never be committed.
+`prd init` and `prd update` both call ensure_gitignore(), which appends
+whichever of these entries a project's .gitignore is missing, so existing
+repositories and upgraded projects get them too.
+"""
+
+from pathlib import Path
+
+GITIGNORE_HEADER = "# PRD Kit"
+
+PRD_KIT_IGNORES = (
+    ".prd-kit/index.sqlite*",
+    ".prd-kit/cache/",
+    ".prd-kit/daemon.sock",
+    ".prd-kit/traces/",
+    ".prd-kit/feature-counter.*",
+    ".prd-kit/manifest.stat.json",
+)
+
+
+def ensure_gitignore(target: Path) -> list[str]:
+    """Append the missing PRD Kit entries to target/.gitignore.
+
+    The file is created if it does not exist. Entries already present
+    (anywhere in the file) are left alone.
+
+    Returns:
+        The entries that were added
+    """
+    gitignore = target / ".gitignore"
+    try:
+        content = gitignore.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        content = ""
+
+    present = {line.strip() for line in content.splitlines()}
+    missing = [entry for entry in PRD_KIT_IGNORES if entry not in present]
+    if not missing:
+        return []
+
+    lines = missing if GITIGNORE_HEADER in present else [GITIGNORE_HEADER, *missing]
+    block = "\n".join(lines) + "\n"
+    if content:
+        if GITIGNORE_HEADER not in present:
+            block = "\n" + block  # Blank line before a new section
+        if not content.endswith("\n"):
+            block = "\n" + block
+    with open(gitignore, "a", encoding="utf-8") as f:
+        f.write(block)
+    return missing
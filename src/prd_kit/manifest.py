@@ -0,0 +1,177 @@
+"""PRD Kit - Manifests of managed files.
+
+Two manifests are involved:
+
+- The template manifest (templates/manifest.json) ships with the package and
+  records the SHA-256 and size of every template file. It is generated by
+  scripts/generate_manifest.py and read through prd_kit.resources.
+- The installed manifest (.prd-kit/manifest.json) is written into a project by
+  `prd init` / `prd update` and records every file PRD Kit installed there:
+  where it came from and the content hash it was installed with. It holds
+  nothing machine-specific, so it can be committed.
+
+`prd update` compares the two to rewrite only files whose template changed
+(or that were modified on disk) and to delete only files it installed itself.
+To tell whether a file was modified without reading it, the size and mtime
+each file had after install are kept in a git-ignored sidecar,
+.prd-kit/manifest.stat.json. When those do not match (a fresh clone, or a
+file touched but not changed) the file is hashed instead.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from prd_kit import __version__
+
+PACKAGE_DIR = Path(__file__).parent
+TEMPLATES_DIR = PACKAGE_DIR / "templates"
+
+MANIFEST_FILE_NAME = "manifest.json"
+INSTALLED_STAT_FILE_NAME = "manifest.stat.json"
+TEMPLATE_MANIFEST_PATH = TEMPLATES_DIR / MANIFEST_FILE_NAME
+
+# Files under templates/ that are never installed into a project
+_IGNORED_PARTS = {"__pycache__"}
+_IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+
+class TemplateEntry(NamedTuple):
+    """A template file as recorded in the template manifest."""
+    sha256: str
+    size: int
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def iter_template_files(templates_dir: Path = TEMPLATES_DIR) -> Iterator[tuple[str, Path]]:
+    """Yield (name, path) for every template file, name relative to templates_dir."""
+    for path in sorted(templates_dir.rglob("*")):
+        if not path.is_file() or path.name == MANIFEST_FILE_NAME:
+            continue
+        rel = path.relative_to(templates_dir)
+        if _IGNORED_PARTS.intersection(rel.parts) or path.suffix in _IGNORED_SUFFIXES:
+            continue
+        yield rel.as_posix(), path
+
+
+def build_template_manifest(templates_dir: Path = TEMPLATES_DIR) -> dict[str, Any]:
+    """Hash every template file into a manifest dict."""
+    files: dict[str, dict[str, Any]] = {}
+    for name, path in iter_template_files(templates_dir):
+        data = path.read_bytes()
+        files[name] = {"sha256": hash_bytes(data), "size": len(data)}
+    return {"files": files}
+
+
+def parse_template_manifest(data: bytes) -> dict[str, TemplateEntry]:
+    """Parse the packaged template manifest.
+
+    Returns an empty dict when the manifest is malformed; callers then hash
+    template files on demand (see prd_kit.resources.TemplateSource.hash).
+    """
+    try:
+        return {
+            name: TemplateEntry(entry["sha256"], entry["size"])
+            for name, entry in json.loads(data).get("files", {}).items()
+        }
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+# ============================================================================
+# Installed manifest (.prd-kit/manifest.json)
+# ============================================================================
+
+def installed_manifest_path(prd_kit_dir: Path) -> Path:
+    """Return the path of a project's installed manifest."""
+    return prd_kit_dir / MANIFEST_FILE_NAME
+
+
+def load_installed_manifest(prd_kit_dir: Path) -> dict[str, dict[str, Any]] | None:
+    """Load the files recorded by the previous init/update.
+
+    Returns None if the project has no (readable) manifest, e.g. it was
+    created by a version of PRD Kit that did not write one.
+    """
+    try:
+        data = json.loads(installed_manifest_path(prd_kit_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    files = data.get("files") if isinstance(data, dict) else None
+    return files if isinstance(files, dict) else None
+
+
+def load_installed_stats(prd_kit_dir: Path) -> dict[str, dict[str, Any]]:
+    """Load the size/mtime sidecar of the installed manifest (empty if missing)."""
+    try:
+        data = json.loads((prd_kit_dir / INSTALLED_STAT_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    files = data.get("files") if isinstance(data, dict) else None
+    return files if isinstance(files, dict) else {}
+
+
+def record_installed_file(source: str, sha256: str) -> dict[str, Any]:
+    """Build the manifest record for an installed file."""
+    return {"source": source, "sha256": sha256}
+
+
+def stat_installed_file(sha256: str, dest_path: Path) -> dict[str, Any]:
+    """Build the sidecar record for a file just written (or verified) at dest_path."""
+    stat = dest_path.stat()
+    return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def is_unchanged_on_disk(
+    dest_path: Path, sha256: str, stat_record: dict[str, Any] | None
+) -> bool:
+    """Check that an installed file still has the content hash sha256.
+
+    A size and mtime match against the file's sidecar record answers without
+    reading the file; otherwise the file is hashed.
+    """
+    try:
+        stat = dest_path.stat()
+    except OSError:
+        return False
+    if (
+        stat_record is not None
+        and stat_record.get("sha256") == sha256
+        and stat.st_size == stat_record.get("size")
+        and stat.st_mtime_ns == stat_record.get("mtime_ns")
+    ):
+        return True
+    try:
+        return hash_bytes(dest_path.read_bytes()) == sha256
+    except OSError:
+        return False
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically write a JSON file."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def write_installed_manifest(
+    prd_kit_dir: Path,
+    files: dict[str, dict[str, Any]],
+    stats: dict[str, dict[str, Any]],
+) -> None:
+    """Atomically write a project's installed manifest and its stat sidecar."""
+    _write_json(
+        installed_manifest_path(prd_kit_dir),
+        {"version": __version__, "files": dict(sorted(files.items()))},
+    )
+    _write_json(
+        prd_kit_dir / INSTALLED_STAT_FILE_NAME,
+        {"files": dict(sorted(stats.items()))},
+    )
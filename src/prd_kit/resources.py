@@ -0,0 +1,208 @@
+"""PRD Kit - Access to packaged template files.
+
+Templates ship either as loose files under prd_kit/templates/ (the
+development layout) or as a single compressed archive, prd_kit/templates.zip,
+built by scripts/build_template_archive.py. The archive is read through
+importlib.resources, so it also works when prd_kit itself is imported from
+a zip, and every entry is streamed straight from it without unpacking.
+
+A release wheel ships exactly one of the two (see hatch_build.py).
+`open_templates()` reads the loose files whenever they are installed, so an
+archive left over in a development checkout can never shadow edited
+templates, and reads the archive otherwise. Set PRD_KIT_TEMPLATES=files or
+PRD_KIT_TEMPLATES=archive to force one layout.
+
+The CLI also imports the prd_scripts package shipped with the templates
+(validators, tracing, status detection); add_scripts_to_path() makes it
+importable from either layout.
+"""
+
+import os
+import shutil
+import sys
+import zipfile
+from importlib import resources
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from prd_kit.manifest import (
+    MANIFEST_FILE_NAME,
+    PACKAGE_DIR,
+    TEMPLATES_DIR,
+    TemplateEntry,
+    hash_bytes,
+    parse_template_manifest,
+)
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+ARCHIVE_NAME = "templates.zip"
+LAYOUT_ENV_VAR = "PRD_KIT_TEMPLATES"
+
+
+class TemplateSource:
+    """Read-only view of the packaged templates, addressed by relative name
+    (e.g. "commands/plan.md")."""
+
+    layout = ""
+
+    def __init__(self) -> None:
+        self._manifest: dict[str, TemplateEntry] | None = None
+
+    def exists(self, name: str) -> bool:
+        raise NotImplementedError
+
+    def size(self, name: str) -> int:
+        raise NotImplementedError
+
+    def read_bytes(self, name: str) -> bytes:
+        raise NotImplementedError
+
+    def copy(self, name: str, dest_path: Path) -> None:
+        """Write a template to dest_path (whose parent must exist)."""
+        dest_path.write_bytes(self.read_bytes(name))
+
+    @property
+    def manifest(self) -> dict[str, TemplateEntry]:
+        """Content hashes from the packaged manifest (empty if missing)."""
+        if self._manifest is None:
+            try:
+                self._manifest = parse_template_manifest(self.read_bytes(MANIFEST_FILE_NAME))
+            except (OSError, KeyError):
+                self._manifest = {}
+        return self._manifest
+
+    def hash(self, name: str) -> str:
+        """Return the content hash of a template.
+
+        Uses the manifest when its recorded size still matches the template
+        (so an edited template in a development checkout is not mistaken for
+        the released one) and hashes the content otherwise.
+        """
+        entry = self.manifest.get(name)
+        if entry is not None and self.size(name) == entry.size:
+            return entry.sha256
+        return hash_bytes(self.read_bytes(name))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "TemplateSource":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class DirectoryTemplates(TemplateSource):
+    """Templates stored as loose files."""
+
+    layout = "files"
+
+    def __init__(self, root: Path = TEMPLATES_DIR) -> None:
+        super().__init__()
+        self.root = root
+
+    def exists(self, name: str) -> bool:
+        return (self.root / name).is_file()
+
+    def size(self, name: str) -> int:
+        return (self.root / name).stat().st_size
+
+    def read_bytes(self, name: str) -> bytes:
+        return (self.root / name).read_bytes()
+
+    def copy(self, name: str, dest_path: Path) -> None:
+        shutil.copy2(self.root / name, dest_path)
+
+
+class ArchiveTemplates(TemplateSource):
+    """Templates stored in a single zip archive.
+
+    zipfile serialises access to the underlying file, so entries can be read
+    from several threads at once.
+    """
+
+    layout = "archive"
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        super().__init__()
+        self._fileobj = fileobj
+        self._zip = zipfile.ZipFile(fileobj)
+        self._infos = {info.filename: info for info in self._zip.infolist() if not info.is_dir()}
+
+    def exists(self, name: str) -> bool:
+        return name in self._infos
+
+    def size(self, name: str) -> int:
+        return self._infos[name].file_size
+
+    def read_bytes(self, name: str) -> bytes:
+        return self._zip.read(self._infos[name])
+
+    def copy(self, name: str, dest_path: Path) -> None:
+        with self._zip.open(self._infos[name]) as src, open(dest_path, "wb") as dest:
+            shutil.copyfileobj(src, dest)
+
+    def close(self) -> None:
+        self._zip.close()
+        self._fileobj.close()
+
+
+def _archive_resource() -> "Traversable | None":
+    """Return the packaged archive as an importlib.resources Traversable, or None."""
+    try:
+        archive = resources.files("prd_kit").joinpath(ARCHIVE_NAME)
+    except (ModuleNotFoundError, TypeError):
+        return None
+    return archive if archive.is_file() else None
+
+
+def open_templates(layout: str | None = None) -> TemplateSource:
+    """Open the packaged templates.
+
+    Args:
+        layout: "archive", "files" or None to choose automatically (loose
+            files if installed, else the archive). Defaults to
+            $PRD_KIT_TEMPLATES.
+
+    Returns:
+        A TemplateSource; close it (or use it as a context manager) when done
+    """
+    layout = layout or os.environ.get(LAYOUT_ENV_VAR) or None
+    if layout not in (None, "archive", "files"):
+        raise ValueError(f"Unknown template layout: {layout}")
+    if layout is None and TEMPLATES_DIR.is_dir():
+        layout = "files"
+
+    if layout != "files":
+        archive = _archive_resource()
+        if archive is not None:
+            return ArchiveTemplates(archive.open("rb"))
+        if layout == "archive":
+            raise FileNotFoundError(
+                f"prd_kit/{ARCHIVE_NAME} not found (run scripts/build_template_archive.py)"
+            )
+
+    return DirectoryTemplates()
+
+
+def scripts_path() -> str:
+    """Return the sys.path entry holding the packaged prd_scripts package.
+
+    That is templates/scripts/ when the loose templates are installed, and
+    the scripts/ folder inside templates.zip (loaded by zipimport) otherwise.
+    """
+    scripts_dir = TEMPLATES_DIR / "scripts"
+    archive = PACKAGE_DIR / ARCHIVE_NAME
+    if not scripts_dir.is_dir() and archive.is_file():
+        return os.path.join(archive, "scripts")
+    return str(scripts_dir)
+
+
+def add_scripts_to_path() -> None:
+    """Make the packaged prd_scripts importable (once per process)."""
+    path = scripts_path()
+    if path not in sys.path:
+        sys.path.insert(0, path)
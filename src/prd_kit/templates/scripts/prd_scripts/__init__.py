@@ -1,14 +1,11 @@
-"""PRD Kit Scripts - Cross-platform Python scripts for PRD Kit."""
+"""PRD Kit Scripts - Cross-platform Python scripts for PRD Kit.
 
-from .common import (
-    PRDKitPaths,
-    log_info,
-    log_success,
-    log_warn,
-    log_error,
-    check_prd_kit_initialized,
-    get_feature_status,
-)
+The helpers below are loaded from .common on first access, so that running
+a light module (e.g. python -m prd_scripts.client) does not import the
+workspace index, git and tracing machinery it never uses.
+"""
+
+import importlib
 
 __all__ = [
     "PRDKitPaths",
@@ -19,3 +16,9 @@ __all__ = [
     "check_prd_kit_initialized",
     "get_feature_status",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        return getattr(importlib.import_module(".common", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
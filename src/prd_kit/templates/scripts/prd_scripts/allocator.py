@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""PRD Kit - Concurrency-safe feature number allocation.
+
+Feature numbers (the NNN in specs/NNN-name and feat/NNN-name) are reserved
+from a counter in .prd-kit/feature-counter.json while holding an exclusive
+lock on .prd-kit/feature-counter.lock, so agents running
+setup_init_feature in parallel never get the same number.
+
+The counter stays compatible with numbers already in use: it records a
+fingerprint (mtimes) of specs/ and the git feature-branch refs, and only
+when that fingerprint changes are they rescanned, moving the counter past
+anything created outside the allocator.
+
+Usage:
+    python -m prd_scripts.allocator --count 3 --json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .common import check_prd_kit_initialized, log_success
+from .gitrefs import GitRefs, highest_feature_number
+from .trace import span
+
+COUNTER_FILE_NAME = "feature-counter.json"
+LOCK_FILE_NAME = "feature-counter.lock"
+
+SPEC_NUMBER_PATTERN = re.compile(r"^(\d+)-")
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path (blocks until acquired)."""
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _sources_fingerprint(project_root: Path) -> list[int]:
+    """Cheap fingerprint (a few stat calls) of where feature numbers are used."""
+    fingerprint = [_mtime(project_root / "specs")]
+    refs = GitRefs.find(project_root)
+    if refs is not None:
+        common = refs.common_dir
+        fingerprint.append(_mtime(common / "packed-refs"))
+        fingerprint.append(_mtime(common / "refs" / "heads" / "feat"))
+        remotes = common / "refs" / "remotes"
+        if remotes.is_dir():
+            for remote in sorted(p.name for p in remotes.iterdir()):
+                fingerprint.append(_mtime(remotes / remote / "feat"))
+    return fingerprint
+
+
+def scan_highest_feature_number(project_root: Path) -> int:
+    """Return the highest feature number used in specs/ or feat/NNN-* branches (0 if none)."""
+    highest = 0
+
+    specs_dir = project_root / "specs"
+    if specs_dir.is_dir():
+        for spec in specs_dir.iterdir():
+            match = SPEC_NUMBER_PATTERN.match(spec.name)
+            if match and spec.is_dir():
+                highest = max(highest, int(match.group(1)))
+
+    refs = GitRefs.find(project_root)
+    if refs is not None:
+        highest = max(highest, highest_feature_number(refs))
+
+    return highest
+
+
+def _read_counter(counter_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(counter_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_counter(counter_path: Path, data: dict[str, Any]) -> None:
+    tmp_path = counter_path.with_name(f".{counter_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, counter_path)
+
+
+def reserve_feature_numbers(project_root: Path, count: int = 1) -> list[int]:
+    """Atomically reserve the next count feature numbers.
+
+    Args:
+        project_root: Project root (containing .prd-kit/)
+        count: How many consecutive numbers to reserve
+
+    Returns:
+        The reserved numbers, in increasing order
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    prd_kit_dir = project_root / ".prd-kit"
+    counter_path = prd_kit_dir / COUNTER_FILE_NAME
+
+    # The span covers waiting for the lock as well as the reservation
+    lock_path = prd_kit_dir / LOCK_FILE_NAME
+    with span("reserve feature numbers", "io", count=count), _exclusive_lock(lock_path):
+        state = _read_counter(counter_path)
+        next_number = state["next"] if isinstance(state.get("next"), int) else 0
+        fingerprint = _sources_fingerprint(project_root)
+
+        if next_number < 1 or state.get("fingerprint") != fingerprint:
+            next_number = max(next_number, scan_highest_feature_number(project_root) + 1)
+
+        reserved = list(range(next_number, next_number + count))
+        _write_counter(counter_path, {
+            "next": next_number + count,
+            "fingerprint": fingerprint,
+        })
+
+    return reserved
+
+
+def main(args: list[str] | None = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Reserve feature numbers")
+    parser.add_argument("--count", type=int, default=1, help="How many numbers to reserve")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parsed = parser.parse_args(args)
+
+    paths = check_prd_kit_initialized()
+    numbers = reserve_feature_numbers(paths.project_root, parsed.count)
+    formatted = [str(n).zfill(3) for n in numbers]
+
+    if parsed.json:
+        print(json.dumps({"FEATURE_NUMBERS": formatted}, indent=2))
+    else:
+        log_success(f"Reserved feature number(s): {', '.join(formatted)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
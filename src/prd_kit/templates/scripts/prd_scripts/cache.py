@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""PRD Kit - Content-hash cache for validation results.
+
+Results are stored as JSON files under .prd-kit/cache/, keyed by a hash of
+the validator name, its rule-set version and the content of every input the
+result depends on. Unchanged inputs therefore return the stored result
+without being re-parsed; any content change produces a new key.
+
+Superseded entries are never looked up again, so the cache is swept at most
+once per PRUNE_INTERVAL (on the next put): entries unused for MAX_AGE are
+removed, then the least recently used ones beyond MAX_ENTRIES. A hit
+refreshes an entry's mtime, which serves as its last-use time.
+
+Setup scripts import this module on every run, so hashlib and tempfile are
+only imported once a key is built or an entry written.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .trace import span
+
+CACHE_DIR_NAME = "cache"
+
+# Sweep limits (entries are a few KB each)
+MAX_ENTRIES = 5000
+MAX_AGE = 30 * 24 * 3600
+PRUNE_INTERVAL = 3600
+PRUNE_STAMP = ".last-prune"
+
+
+def hash_file(path: Path) -> str:
+    """Return the sha256 of a file's content, or "missing" if unreadable."""
+    import hashlib
+
+    try:
+        with span("hash file", "io", path=str(path)):
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def find_cache_dir(start: Path) -> Path | None:
+    """Find .prd-kit/cache/ by searching upward from a path.
+
+    Returns None when the path is not inside a PRD Kit project.
+    """
+    current = start.resolve()
+    if not current.is_dir():
+        current = current.parent
+    while True:
+        prd_kit_dir = current / ".prd-kit"
+        if prd_kit_dir.is_dir():
+            return prd_kit_dir / CACHE_DIR_NAME
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+class ResultCache:
+    """On-disk store of validation results keyed by input content."""
+
+    def __init__(self, cache_dir: Path | None):
+        """Create a cache rooted at cache_dir. None disables caching."""
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def for_path(cls, path: Path) -> "ResultCache":
+        """Return the cache of the project containing path."""
+        return cls(find_cache_dir(path))
+
+    @staticmethod
+    def make_key(validator: str, version: str, inputs: list[tuple[str, str]]) -> str:
+        """Build a cache key.
+
+        Args:
+            validator: Validator name (e.g. "check-completeness").
+            version: Rule-set version of the validator.
+            inputs: (label, content hash) pairs for every input the result
+                depends on. Labels are typically file names, since they can
+                appear in the result messages.
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        digest.update(f"{validator}\0{version}\0".encode())
+        for label, content_hash in inputs:
+            digest.update(f"{label}\0{content_hash}\0".encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached result for a key, or None on a miss."""
+        if self.cache_dir is None:
+            return None
+        entry = self._entry_path(key)
+        try:
+            with open(entry) as f:
+                result: dict[str, Any] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result. Failures to write are ignored."""
+        if self.cache_dir is None:
+            return
+        import tempfile
+
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial JSON
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_name, entry)
+        except OSError:
+            return
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        """Prune unless the cache was swept within PRUNE_INTERVAL."""
+        assert self.cache_dir is not None
+        stamp = self.cache_dir / PRUNE_STAMP
+        try:
+            if time.time() - stamp.stat().st_mtime < PRUNE_INTERVAL:
+                return
+        except OSError:
+            pass
+        try:
+            stamp.touch()
+        except OSError:
+            return
+        self.prune()
+
+    def prune(self, max_entries: int = MAX_ENTRIES, max_age: float = MAX_AGE) -> int:
+        """Remove entries unused for max_age seconds, then the least recently
+        used ones beyond max_entries. Returns the number removed."""
+        if self.cache_dir is None:
+            return 0
+        with span("prune cache", "io") as s:
+            entries = []
+            try:
+                for bucket in os.scandir(self.cache_dir):
+                    if not bucket.is_dir():
+                        continue
+                    for item in os.scandir(bucket.path):
+                        if item.name.endswith((".json", ".tmp")):
+                            try:
+                                entries.append((item.stat().st_mtime, item.path))
+                            except OSError:
+                                continue
+            except OSError:
+                return 0
+
+            entries.sort(reverse=True)
+            cutoff = time.time() - max_age
+            stale = [path for i, (mtime, path) in enumerate(entries)
+                     if i >= max_entries or mtime < cutoff]
+            removed = 0
+            for path in stale:
+                try:
+                    os.unlink(path)
+                    removed += 1
+                except OSError:
+                    continue
+            if s is not None:
+                s.set(entries=len(entries), removed=removed)
+        return removed
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""PRD Kit - Completeness Validator.
+
+Validates that PRD and research documents have all required sections
+and no remaining [NEEDS_DETAIL] tags.
+
+Usage:
+    python .prd-kit/validators/check-completeness.py <file_path> [--no-cache]
+    python .prd-kit/validators/check-completeness.py prds/feature-name/PRD.md
+
+Or in-process (also available as prd_kit.validators):
+    from prd_scripts.check_completeness import validate_file_cached
+
+    result = validate_file_cached(Path("prds/feature-name/PRD.md"))
+
+Results are cached in .prd-kit/cache/ by file content; pass --no-cache
+to force a fresh validation.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import ResultCache, hash_file
+from .markdown import MarkdownDocument, Section, parse_markdown, user_story_sections
+from .scanner import Hit, Rule, Scanner
+from .trace import span, traced
+
+VALIDATOR_NAME = "check-completeness"
+
+# Bump whenever the rules below change so cached results are invalidated
+RULESET_VERSION = "2"
+
+
+class CompletenessResult(NamedTuple):
+    """Result of a validation check."""
+    passed: bool
+    issues: list[str]
+    warnings: list[str]
+    needs_detail_tags: list[str]
+    missing_sections: list[str]
+
+
+# Required sections for each document type
+REQUIRED_SECTIONS = {
+    "research.md": [
+        "Initial Idea",
+        "Discovery Questions",
+        "Problem Space",
+        "User Understanding",
+        "Solution Space",
+        "Success Criteria",
+        "Constitution Alignment",
+    ],
+    "PRD.md": [
+        "Problem Statement",
+        "Solution Overview",
+        "User Stories",
+        "Non-Functional Requirements",
+        "Success Metrics",
+        "Risks & Mitigations",
+    ],
+}
+
+
+# Content rules; the user story checks only ask whether each marker is present
+CONTENT_SCANNER = Scanner({
+    "needs_detail": Rule(r'\[NEEDS_DETAIL:\s*[^\]]+\]', literal="[NEEDS_DETAIL:"),
+    "placeholder": r'(?i:\[(?:PLACEHOLDER|TODO|TBD|XXX)[^\]]*\])',
+    "as_a": Rule(literal="**As a**", first_only=True),
+    "i_want": Rule(literal="**I want to**", first_only=True),
+    "so_that": Rule(literal="**So that**", first_only=True),
+    "gherkin": Rule(literal="```gherkin", first_only=True),
+})
+
+
+def needs_detail_text(hit: Hit) -> str:
+    """Return the description inside a [NEEDS_DETAIL: xxx] hit."""
+    return hit.text[len("[NEEDS_DETAIL:"):-1].strip()
+
+
+def find_needs_detail_tags(content: str) -> list[str]:
+    """Find all [NEEDS_DETAIL: xxx] tags in content."""
+    hits = CONTENT_SCANNER.scan(content)
+    return [needs_detail_text(hit) for hit in hits["needs_detail"]]
+
+
+def find_present_sections(content: str | MarkdownDocument) -> set[str]:
+    """Find all markdown headers (## and ###) in content."""
+    document = content if isinstance(content, MarkdownDocument) else parse_markdown(content)
+    return document.titles(levels=(2, 3))
+
+
+def check_section_present(present_sections: set[str], section_name: str) -> bool:
+    """Check if a section (by header) is present in a set of header titles."""
+    # Exact match
+    if section_name in present_sections:
+        return True
+    
+    # Partial match (section name is substring)
+    for section in present_sections:
+        if section_name.lower() in section.lower():
+            return True
+    
+    return False
+
+
+def validate_user_stories(
+    content: str,
+    document: MarkdownDocument | None = None,
+    hits: dict[str, list[Hit]] | None = None,
+) -> list[str]:
+    """Validate user story format."""
+    issues = []
+    
+    # Find user story sections
+    if document is None:
+        document = parse_markdown(content)
+    stories = user_story_sections(document)
+    
+    if not stories:
+        issues.append("No user stories found (expected format: ### [US1] Title)")
+        return issues
+    
+    # Check for required parts in each story
+    if hits is None:
+        hits = CONTENT_SCANNER.scan(content)
+    
+    if not hits["as_a"]:
+        issues.append("User stories missing 'As a' format")
+    if not hits["i_want"]:
+        issues.append("User stories missing 'I want to' format")
+    if not hits["so_that"]:
+        issues.append("User stories missing 'So that' format")
+    if not hits["gherkin"]:
+        issues.append("User stories missing Gherkin acceptance criteria")
+    
+    return issues
+
+
+def find_empty_sections(document: MarkdownDocument) -> list[Section]:
+    """Find ## and ### headers followed only by blank lines, then another
+    ## or ### header (including their own first subsection) or the end of
+    the document.
+
+    Same rule as the original line regex, except that headers inside code
+    fences are ignored and every empty header counts (the regex consumed
+    the next header's "## " and so skipped adjacent empty headers).
+    """
+    sections = document.sections
+    empty = []
+    for i, section in enumerate(sections):
+        if section.level not in (2, 3):
+            continue
+        body = document.body(section)
+        if body.strip() or "\n" not in body:
+            continue
+        following = sections[i + 1] if i + 1 < len(sections) else None
+        if following is None or following.level in (2, 3):
+            empty.append(section)
+    return empty
+
+
+@traced("validator")
+def validate_file(file_path: Path) -> CompletenessResult:
+    """Validate a PRD or research file."""
+    issues = []
+    warnings = []
+    missing_sections = []
+    
+    if not file_path.exists():
+        return CompletenessResult(
+            passed=False,
+            issues=[f"File not found: {file_path}"],
+            warnings=[],
+            needs_detail_tags=[],
+            missing_sections=[],
+        )
+    
+    with span("read", "io", path=str(file_path)):
+        content = file_path.read_text()
+    file_name = file_path.name
+    with span("parse markdown", "rule", size=len(content)):
+        document = parse_markdown(content)
+    hits = CONTENT_SCANNER.scan(content)
+    
+    # Find NEEDS_DETAIL tags
+    needs_detail = [needs_detail_text(hit) for hit in hits["needs_detail"]]
+    if needs_detail:
+        issues.append(f"Found {len(needs_detail)} [NEEDS_DETAIL] tags")
+    
+    # Check required sections based on file type
+    required = REQUIRED_SECTIONS.get(file_name, [])
+    with span("required sections", "rule", required=len(required)):
+        present_sections = find_present_sections(document)
+        for section in required:
+            if not check_section_present(present_sections, section):
+                missing_sections.append(section)
+    
+    if missing_sections:
+        issues.append(f"Missing {len(missing_sections)} required sections")
+    
+    # Additional validation for PRD files
+    if file_name == "PRD.md":
+        with span("user stories", "rule"):
+            story_issues = validate_user_stories(content, document, hits)
+        issues.extend(story_issues)
+        
+        # Check for placeholder values
+        placeholders = hits["placeholder"]
+        if placeholders:
+            warnings.append(f"Found {len(placeholders)} placeholder markers")
+    
+    # Check for empty sections (header followed by a blank line and another header)
+    with span("empty sections", "rule"):
+        empty_sections = find_empty_sections(document)
+    if empty_sections:
+        warnings.append(f"Found {len(empty_sections)} potentially empty sections")
+    
+    passed = len(issues) == 0 and len(needs_detail) == 0 and len(missing_sections) == 0
+    
+    return CompletenessResult(
+        passed=passed,
+        issues=issues,
+        warnings=warnings,
+        needs_detail_tags=needs_detail,
+        missing_sections=missing_sections,
+    )
+
+
+def validate_file_cached(file_path: Path, use_cache: bool = True) -> CompletenessResult:
+    """Validate a file, reusing a cached result if its content is unchanged."""
+    if not use_cache or not file_path.exists():
+        return validate_file(file_path)
+    
+    cache = ResultCache.for_path(file_path)
+    key = ResultCache.make_key(
+        VALIDATOR_NAME, RULESET_VERSION, [(file_path.name, hash_file(file_path))]
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return CompletenessResult(**cached)
+    
+    result = validate_file(file_path)
+    cache.put(key, result._asdict())
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+    args = [a for a in argv if a != "--no-cache"]
+    if len(args) < 1:
+        print("Usage: python check-completeness.py <file_path> [--no-cache]", file=sys.stderr)
+        return 1
+    
+    file_path = Path(args[0])
+    result = validate_file_cached(file_path, use_cache="--no-cache" not in argv)
+    
+    # Output as JSON for easy parsing by agents
+    output = {
+        "file": str(file_path),
+        "passed": result.passed,
+        "issues": result.issues,
+        "warnings": result.warnings,
+        "needs_detail_tags": result.needs_detail_tags,
+        "missing_sections": result.missing_sections,
+    }
+    
+    print(json.dumps(output, indent=2))
+    
+    # Also print human-readable summary
+    print("\n" + "=" * 50, file=sys.stderr)
+    if result.passed:
+        print("✅ VALIDATION PASSED", file=sys.stderr)
+    else:
+        print("❌ VALIDATION FAILED", file=sys.stderr)
+        
+        if result.needs_detail_tags:
+            print(f"\n[NEEDS_DETAIL] tags ({len(result.needs_detail_tags)}):", file=sys.stderr)
+            for tag in result.needs_detail_tags:
+                print(f"  - {tag}", file=sys.stderr)
+        
+        if result.missing_sections:
+            print(f"\nMissing sections ({len(result.missing_sections)}):", file=sys.stderr)
+            for section in result.missing_sections:
+                print(f"  - {section}", file=sys.stderr)
+        
+        if result.issues:
+            print(f"\nIssues ({len(result.issues)}):", file=sys.stderr)
+            for issue in result.issues:
+                print(f"  - {issue}", file=sys.stderr)
+    
+    if result.warnings:
+        print(f"\nWarnings ({len(result.warnings)}):", file=sys.stderr)
+        for warning in result.warnings:
+            print(f"  - {warning}", file=sys.stderr)
+    
+    return 0 if result.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""PRD Kit - Deliverables Validator.
+
+Validates deliverables-map.json and individual deliverable files.
+Checks for:
+- Valid JSON structure
+- No circular dependencies
+- All referenced IDs exist
+- Required sections in deliverable files
+
+Usage:
+    python .prd-kit/validators/check-deliverables.py <deliverables_dir_or_map_file> [--no-cache]
+    python .prd-kit/validators/check-deliverables.py prds/feature-name/deliverables/
+    python .prd-kit/validators/check-deliverables.py prds/feature/deliverables/deliverables-map.json
+    python .prd-kit/validators/check-deliverables.py --workspace [prds_dir]
+
+Or in-process (also available as prd_kit.validators):
+    from prd_scripts.check_deliverables import validate_path
+
+    result = validate_path(Path("prds/feature-name/deliverables"))
+
+Dependencies may reference another PRD's deliverables as "other-prd:003"
+(the feature's directory name in prds/). They are resolved against a
+workspace-wide graph of every deliverables map; --workspace validates that
+whole graph at once.
+
+Results are cached in .prd-kit/cache/ by the content of the map, README and
+every deliverable file; pass --no-cache to force a fresh validation.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .cache import ResultCache, find_cache_dir, hash_file
+from .graph import (
+    WorkspaceGraph,
+    cycle_path,
+    find_dependency_cycles,
+    is_qualified,
+    load_workspace_graph,
+    qualify,
+    split_reference,
+    workspace_fingerprint,
+)
+from .markdown import parse_markdown
+from .scanner import Rule, Scanner
+from .trace import span, traced
+
+VALIDATOR_NAME = "check-deliverables"
+
+# Bump whenever the rules below change so cached results are invalidated
+RULESET_VERSION = "2"
+
+
+class DeliverablesResult(NamedTuple):
+    """Result of validation."""
+    passed: bool
+    issues: list[str]
+    warnings: list[str]
+
+
+REQUIRED_DELIVERABLE_SECTIONS = [
+    "Context",
+    "User Stories",
+    "Acceptance Criteria",
+]
+
+RECOMMENDED_DELIVERABLE_SECTIONS = [
+    # Lists PRD features planned for other deliverables (prevents premature implementation)
+    "Out of Scope",
+]
+
+# Common code patterns (type definitions, imports, etc.): rule name -> description
+CODE_PATTERN_DESCRIPTIONS = {
+    "interface": "TypeScript interfaces",
+    "type_definition": "TypeScript type definitions",
+    "import": "import statements",
+    "export": "export statements",
+    "file_path": "file paths",
+}
+
+# Content rules; code patterns and headers only need to be found once
+CONTENT_SCANNER = Scanner({
+    "source_prd": Rule(literal="Source PRD", first_only=True),
+    "deliverable_id": Rule(literal="Deliverable ID", first_only=True),
+    "needs_detail": Rule(r'\[NEEDS_DETAIL:\s*[^\]]+\]', literal="[NEEDS_DETAIL:"),
+    "code_block": Rule(
+        r'(?i:```(?:typescript|javascript|python|js|ts|vue|jsx|tsx))', literal="```"
+    ),
+    "interface": Rule(r'\binterface\s+\w+\s*{', literal="interface", first_only=True),
+    "type_definition": Rule(r'\btype\s+\w+\s*=', literal="type", first_only=True),
+    "import": Rule(r'\bimport\s+.*\bfrom\b', literal="import", first_only=True),
+    "export": Rule(
+        r'\bexport\s+(default\s+)?(class|function|const|interface)',
+        literal="export",
+        first_only=True,
+    ),
+    "file_path": Rule(r'src/\w+/\w+\.(vue|ts|js|tsx|jsx)', literal="src/", first_only=True),
+})
+
+
+def load_deliverables_map(map_path: Path) -> dict[str, Any] | None:
+    """Load and parse deliverables-map.json."""
+    try:
+        with open(map_path) as f:
+            data: dict[str, Any] = json.load(f)
+            return data
+    except json.JSONDecodeError:
+        return None
+    except FileNotFoundError:
+        return None
+
+
+@traced("rule")
+def check_circular_dependencies(
+    deliverables: list[dict[str, Any]],
+    prd: str | None = None,
+    graph: WorkspaceGraph | None = None,
+) -> list[str]:
+    """Check for dangling and circular dependencies in the deliverables graph.
+    
+    Every dangling reference and every cycle group is reported in one run.
+    
+    Args:
+        deliverables: The map's deliverables
+        prd: Name of the PRD the map belongs to; dependencies qualified with
+            it ("prd:003") are local
+        graph: Workspace graph used to resolve dependencies on other PRDs
+            ("other-prd:003") and to find cycles that span PRDs
+    """
+    issues = []
+    
+    # Number the deliverables; a duplicated ID keeps its last entry, as before
+    ids = [d.get("id", "") for d in deliverables]
+    number = {d_id: i for i, d_id in enumerate(ids)}
+    
+    # Build adjacency list, checking all referenced dependencies exist
+    adjacency: list[list[int]] = [[] for _ in ids]
+    lookup = number.get
+    has_external = False
+    for i, d in enumerate(deliverables):
+        if number[ids[i]] != i:
+            continue
+        deps = d.get("dependencies", [])
+        if not isinstance(deps, list):
+            continue
+        edges = adjacency[i]
+        for dep in deps:
+            target = lookup(dep) if isinstance(dep, str) else None
+            if target is None and isinstance(dep, str) and is_qualified(dep):
+                dep_prd, dep_id = split_reference(dep, prd or "")
+                if dep_prd == prd:
+                    target = lookup(dep_id)
+                elif graph is not None and qualify(dep_prd, dep_id) in graph.nodes:
+                    has_external = True
+                    continue
+            if target is None:
+                issues.append(f"Deliverable '{ids[i]}' references non-existent dependency '{dep}'")
+            else:
+                edges.append(target)
+    
+    for group in find_dependency_cycles(adjacency):
+        path = cycle_path(adjacency, group)
+        message = f"Circular dependency detected: {' -> '.join(ids[n] for n in path)}"
+        if len(group) > len(path) - 1:
+            message += f" (cycle group of {len(group)}: {', '.join(ids[n] for n in group)})"
+        issues.append(message)
+    
+    # Cycles through other PRDs (cycles local to this map were reported above)
+    if has_external and graph is not None:
+        prefix = qualify(prd or "", "")
+        for keys in graph.cycles():
+            local = [key.startswith(prefix) for key in keys]
+            if any(local) and not all(local):
+                cycle = " -> ".join(graph.cycle_path(keys))
+                issues.append(f"Circular dependency across PRDs detected: {cycle}")
+    
+    return issues
+
+
+@traced("validator")
+def validate_deliverable_file(file_path: Path) -> tuple[list[str], list[str]]:
+    """Validate a single deliverable file.
+    
+    Returns:
+        Tuple of (issues, warnings)
+    """
+    issues: list[str] = []
+    warnings: list[str] = []
+    
+    if not file_path.exists():
+        issues.append(f"Deliverable file not found: {file_path}")
+        return issues, warnings
+    
+    with span("read", "io", path=str(file_path)):
+        content = file_path.read_text()
+    with span("parse markdown", "rule", size=len(content)):
+        document = parse_markdown(content)
+    
+    with span("required sections", "rule"):
+        # Check required sections
+        for section in REQUIRED_DELIVERABLE_SECTIONS:
+            if not document.has_section(section, levels=(2,), match="prefix"):
+                issues.append(f"{file_path.name}: Missing required section '{section}'")
+        
+        # Check recommended sections
+        for section in RECOMMENDED_DELIVERABLE_SECTIONS:
+            if not document.has_section(section, levels=(2,), match="prefix"):
+                warnings.append(
+                    f"{file_path.name}: Missing recommended section '{section}' - "
+                    "should list PRD features planned for other deliverables"
+                )
+    
+    hits = CONTENT_SCANNER.scan(content)
+    
+    # Check for Source PRD reference
+    if not hits["source_prd"]:
+        issues.append(f"{file_path.name}: Missing 'Source PRD' reference")
+    
+    # Check for Deliverable ID
+    if not hits["deliverable_id"]:
+        issues.append(f"{file_path.name}: Missing 'Deliverable ID'")
+    
+    # Check for NEEDS_DETAIL tags (shouldn't have any in final deliverables)
+    needs_detail = hits["needs_detail"]
+    if needs_detail:
+        issues.append(f"{file_path.name}: Contains {len(needs_detail)} [NEEDS_DETAIL] tags")
+    
+    # Check for code blocks (deliverables should NOT have code)
+    code_blocks = hits["code_block"]
+    if code_blocks:
+        warnings.append(
+            f"{file_path.name}: Contains {len(code_blocks)} code blocks - "
+            "deliverables should use plain English or pseudocode only"
+        )
+    
+    # Check for common code patterns (type definitions, imports, etc.)
+    for rule, description in CODE_PATTERN_DESCRIPTIONS.items():
+        if hits[rule]:
+            warnings.append(
+                f"{file_path.name}: Contains {description} - "
+                "deliverables should be client-facing without code"
+            )
+    
+    return issues, warnings
+
+
+def validate_deliverables_map(
+    map_data: dict[str, Any],
+    prd: str | None = None,
+    graph: WorkspaceGraph | None = None,
+) -> list[str]:
+    """Validate the structure of deliverables-map.json.
+    
+    prd and graph resolve cross-PRD dependencies (see check_circular_dependencies).
+    """
+    issues = []
+    
+    # Check required top-level fields
+    required_fields = ["source_prd", "deliverables"]
+    for field in required_fields:
+        if field not in map_data:
+            issues.append(f"Missing required field in map: '{field}'")
+    
+    deliverables = map_data.get("deliverables", [])
+    
+    if not isinstance(deliverables, list):
+        issues.append("'deliverables' must be an array")
+        return issues
+    
+    if len(deliverables) == 0:
+        issues.append("No deliverables defined in map")
+        return issues
+    
+    # Check each deliverable entry
+    required_deliverable_fields = ["id", "name", "title"]
+    ids_seen = set()
+    
+    for i, d in enumerate(deliverables):
+        for field in required_deliverable_fields:
+            if field not in d:
+                issues.append(f"Deliverable {i}: Missing required field '{field}'")
+        
+        d_id = d.get("id", "")
+        if d_id in ids_seen:
+            issues.append(f"Duplicate deliverable ID: '{d_id}'")
+        ids_seen.add(d_id)
+    
+    # Check for circular dependencies
+    circular_issues = check_circular_dependencies(deliverables, prd, graph)
+    issues.extend(circular_issues)
+    
+    return issues
+
+
+def _has_qualified_dependencies(deliverables: object) -> bool:
+    """Check whether any deliverable depends on a "prd:id" reference."""
+    if not isinstance(deliverables, list):
+        return False
+    return any(
+        isinstance(dep, str) and is_qualified(dep)
+        for d in deliverables if isinstance(d, dict)
+        for dep in (d["dependencies"] if isinstance(d.get("dependencies"), list) else [])
+    )
+
+
+def _workspace_of(dir_path: Path) -> tuple[str, Path]:
+    """Return (PRD name, prds/ directory) for prds/<prd>/deliverables/."""
+    feature_dir = dir_path.resolve().parent
+    return feature_dir.name, feature_dir.parent
+
+
+@traced("validator")
+def validate_directory(dir_path: Path) -> DeliverablesResult:
+    """Validate all deliverables in a directory."""
+    issues = []
+    warnings = []
+    
+    map_path = dir_path / "deliverables-map.json"
+    
+    if not map_path.exists():
+        return DeliverablesResult(
+            passed=False,
+            issues=["deliverables-map.json not found"],
+            warnings=[],
+        )
+    
+    # Validate map
+    map_data = load_deliverables_map(map_path)
+    if map_data is None:
+        return DeliverablesResult(
+            passed=False,
+            issues=["Failed to parse deliverables-map.json"],
+            warnings=[],
+        )
+    
+    # Cross-PRD references need the workspace graph (built once, cached)
+    prd, prds_dir = _workspace_of(dir_path)
+    graph = None
+    if _has_qualified_dependencies(map_data.get("deliverables")):
+        graph = load_workspace_graph(prds_dir, find_cache_dir(dir_path))
+    
+    map_issues = validate_deliverables_map(map_data, prd, graph)
+    issues.extend(map_issues)
+    
+    # Validate each deliverable file
+    deliverables = map_data.get("deliverables", [])
+    for d in deliverables:
+        file_name = d.get("file", "")
+        if file_name:
+            file_path = dir_path / file_name
+            file_issues, file_warnings = validate_deliverable_file(file_path)
+            issues.extend(file_issues)
+            warnings.extend(file_warnings)
+    
+    # Check for orphan deliverable files (not in map)
+    map_files = {d.get("file", "") for d in deliverables}
+    with span("glob deliverable-*.md", "scan", path=str(dir_path)):
+        present = [f.name for f in dir_path.glob("deliverable-*.md")]
+    for name in present:
+        if name not in map_files:
+            warnings.append(f"Orphan deliverable file not in map: {name}")
+    
+    # Check for README.md (implementation roadmap)
+    readme_path = dir_path / "README.md"
+    if not readme_path.exists():
+        issues.append("README.md not found - implementation roadmap is required")
+    else:
+        # Validate README has key sections
+        readme_content = readme_path.read_text()
+        if "Implementation Order" not in readme_content:
+            warnings.append("README.md missing 'Implementation Order' section")
+        if "Phase" not in readme_content:
+            warnings.append("README.md should organize deliverables by phases")
+    
+    passed = len(issues) == 0
+    return DeliverablesResult(passed=passed, issues=issues, warnings=warnings)
+
+
+def _cache_inputs(path: Path) -> list[tuple[str, str]]:
+    """List every input a validation result depends on, with content hashes.
+    
+    For a deliverables directory this covers the map, the README, every
+    deliverable file the map references and the names of all deliverable
+    files present (for orphan detection).
+    """
+    # Messages embed the path as given, so it is part of the key too
+    if not path.is_dir():
+        return [("path", str(path)), (path.name, hash_file(path))]
+    
+    map_path = path / "deliverables-map.json"
+    inputs = [
+        ("path", str(path)),
+        ("deliverables-map.json", hash_file(map_path)),
+        ("README.md", hash_file(path / "README.md")),
+    ]
+    
+    referenced = []
+    map_data = load_deliverables_map(map_path)
+    if isinstance(map_data, dict) and isinstance(map_data.get("deliverables"), list):
+        referenced = [
+            d.get("file", "") for d in map_data["deliverables"] if isinstance(d, dict)
+        ]
+    for file_name in referenced:
+        if file_name:
+            inputs.append((f"file:{file_name}", hash_file(path / file_name)))
+    
+    # Dependencies on other PRDs make the result depend on every map
+    if isinstance(map_data, dict) and _has_qualified_dependencies(map_data.get("deliverables")):
+        inputs.append(("workspace", workspace_fingerprint(_workspace_of(path)[1])))
+    
+    with span("glob deliverable-*.md", "scan", path=str(path)):
+        present = sorted(f.name for f in path.glob("deliverable-*.md"))
+    inputs.append(("present", ",".join(present)))
+    return inputs
+
+
+def validate_path(path: Path, use_cache: bool = True) -> DeliverablesResult:
+    """Validate a deliverables directory, map file or single deliverable.
+    
+    Reuses a cached result when none of the inputs changed.
+    """
+    if path.name == "deliverables-map.json":
+        path = path.parent
+    
+    cache = ResultCache.for_path(path) if use_cache and path.exists() else ResultCache(None)
+    key = ""
+    if cache.cache_dir is not None:
+        key = ResultCache.make_key(VALIDATOR_NAME, RULESET_VERSION, _cache_inputs(path))
+        cached = cache.get(key)
+        if cached is not None:
+            return DeliverablesResult(**cached)
+    
+    if path.is_dir():
+        result = validate_directory(path)
+    else:
+        # Single file validation
+        file_issues, file_warnings = validate_deliverable_file(path)
+        result = DeliverablesResult(
+            passed=len(file_issues) == 0,
+            issues=file_issues,
+            warnings=file_warnings,
+        )
+    
+    if key:
+        cache.put(key, result._asdict())
+    return result
+
+
+@traced("validator")
+def validate_workspace(prds_dir: Path, use_cache: bool = True) -> DeliverablesResult:
+    """Validate the dependencies of every deliverables map in prds_dir as one
+    graph: dangling references and cycles, including across PRDs."""
+    if not prds_dir.is_dir():
+        return DeliverablesResult(
+            passed=False, issues=[f"Directory not found: {prds_dir}"], warnings=[]
+        )
+    
+    graph = load_workspace_graph(prds_dir, find_cache_dir(prds_dir) if use_cache else None)
+    issues = [
+        f"Deliverable '{key}' references non-existent dependency '{dep}'"
+        for key, dep in graph.dangling()
+    ]
+    for group in graph.cycles():
+        path = graph.cycle_path(group)
+        message = f"Circular dependency detected: {' -> '.join(path)}"
+        if len(group) > len(path) - 1:
+            message += f" (cycle group of {len(group)}: {', '.join(group)})"
+        issues.append(message)
+    
+    warnings = [] if graph.nodes else ["No deliverables maps found"]
+    return DeliverablesResult(passed=len(issues) == 0, issues=issues, warnings=warnings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+    args = [a for a in argv if a not in ("--no-cache", "--workspace")]
+    if "--workspace" in argv:
+        path = Path(args[0]) if args else Path("prds")
+        result = validate_workspace(path, use_cache="--no-cache" not in argv)
+    elif len(args) < 1:
+        print("Usage: python check-deliverables.py <path> [--no-cache]", file=sys.stderr)
+        print(
+            "       python check-deliverables.py --workspace [prds_dir] [--no-cache]",
+            file=sys.stderr,
+        )
+        return 1
+    else:
+        path = Path(args[0])
+        result = validate_path(path, use_cache="--no-cache" not in argv)
+    
+    # Output as JSON
+    output = {
+        "path": str(path),
+        "passed": result.passed,
+        "issues": result.issues,
+        "warnings": result.warnings,
+    }
+    print(json.dumps(output, indent=2))
+    
+    # Human-readable summary
+    print("\n" + "=" * 50, file=sys.stderr)
+    if result.passed:
+        print("✅ VALIDATION PASSED", file=sys.stderr)
+    else:
+        print("❌ VALIDATION FAILED", file=sys.stderr)
+        print(f"\nIssues ({len(result.issues)}):", file=sys.stderr)
+        for issue in result.issues:
+            print(f"  - {issue}", file=sys.stderr)
+    
+    if result.warnings:
+        print(f"\nWarnings ({len(result.warnings)}):", file=sys.stderr)
+        for warning in result.warnings:
+            print(f"  - {warning}", file=sys.stderr)
+    
+    return 0 if result.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""PRD Kit - Client for the PRD Kit daemon.
+
+Runs a setup script or validator through a running `prd daemon` and falls
+back to running it in this process when no daemon is listening (or the
+platform has no Unix sockets), so it can always be used in place of calling
+the script directly. A daemon that accepts the request but does not answer
+is reported as an error instead: the script may already have run there.
+
+Usage:
+    python -m prd_scripts.client setup_plan --spec 001 --json
+    python -m prd_scripts.client check-completeness prds/feature/PRD.md
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+SOCKET_FILE_NAME = "daemon.sock"
+
+# The daemon listens on a Unix socket, which Python does not offer everywhere
+# (e.g. on Windows)
+DAEMON_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+# Unix socket paths are limited to ~104-108 bytes depending on the platform
+MAX_SOCKET_PATH = 100
+
+# Validator name -> prd_scripts module implementing it
+VALIDATOR_MODULES = {
+    "check-completeness": "check_completeness",
+    "check-deliverables": "check_deliverables",
+    "generate-implementation-order": "implementation_order",
+}
+VALIDATOR_METHODS = tuple(VALIDATOR_MODULES)
+
+
+def find_project_root(start: Path | None = None) -> Path:
+    """Find the project root by looking for a .prd-kit directory."""
+    current = (start or Path.cwd()).resolve()
+    while current != current.parent:
+        if (current / ".prd-kit").is_dir():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
+def socket_path(project_root: Path) -> Path:
+    """Return the daemon socket path for a project."""
+    path = project_root / ".prd-kit" / SOCKET_FILE_NAME
+    if len(os.fsencode(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha256(os.fsencode(project_root)).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"prd-kit-{digest}.sock"
+
+
+def request(
+    method: str,
+    params: dict[str, Any] | None = None,
+    project_root: Path | None = None,
+    timeout: float = 60.0,
+) -> dict[str, Any] | None:
+    """Send a JSON-RPC request to the daemon.
+
+    Returns the JSON-RPC response, or None if no daemon is running.
+
+    Raises:
+        TimeoutError: The daemon did not answer within timeout seconds
+        OSError: The connection failed after the daemon accepted it
+    """
+    if not DAEMON_SUPPORTED:
+        return None
+    path = socket_path(project_root or find_project_root())
+    if not path.exists():
+        return None
+
+    message = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(os.fspath(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None  # Stale socket left by a daemon that is gone
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise ConnectionError("daemon closed the connection without answering")
+    response: dict[str, Any] = json.loads(line)
+    return response
+
+
+def run_local(method: str, args: list[str]) -> int:
+    """Run a setup script or validator in this process (no daemon)."""
+    import importlib
+
+    module = importlib.import_module(f"prd_scripts.{VALIDATOR_MODULES.get(method, method)}")
+    try:
+        return module.main(args) or 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(
+            "Usage: python -m prd_scripts.client <setup_phase|validator> [args...]",
+            file=sys.stderr,
+        )
+        return 1
+
+    method, args = argv[0], argv[1:]
+    scripts_dir = Path(__file__).resolve().parent
+    is_setup = method.startswith("setup_") and (scripts_dir / f"{method}.py").is_file()
+    if not (is_setup or method in VALIDATOR_METHODS):
+        print(f"Unknown method: {method}", file=sys.stderr)
+        return 1
+
+    try:
+        response = request(method, {"args": args, "cwd": os.getcwd()})
+    except OSError as e:
+        reason = "did not answer in time" if isinstance(e, TimeoutError) else f"failed: {e}"
+        print(f"Error: PRD Kit daemon {reason} (running {method})", file=sys.stderr)
+        return 1
+    if response is None or "result" not in response:
+        return run_local(method, args)
+
+    result = response["result"]
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stderr.write(result.get("stderr", ""))
+    exit_code: int = result.get("exit_code", 0)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
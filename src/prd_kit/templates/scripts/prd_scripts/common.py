@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """PRD Kit - Common functions and configuration."""
 
-import re
 import sys
 from pathlib import Path
 
+from .gitrefs import GitRefs, parse_feature_branch
+from .index import get_workspace_index
+from .status import detect_feature_status
+
 
 # ============================================================================
 # Color Output (cross-platform)
@@ -19,7 +22,7 @@ class Colors:
     NC = "\033[0m"  # No Color
     
     @classmethod
-    def disable(cls):
+    def disable(cls) -> None:
         """Disable colors for non-TTY output."""
         cls.RED = ""
         cls.GREEN = ""
@@ -183,45 +186,32 @@ def get_feature_status(paths: PRDKitPaths, feature_name: str) -> str:
         - approved
         - decomposed
         - deliverables_generated
-    """
-    feature_dir = paths.get_feature_dir(feature_name)
-    
-    if not feature_dir.is_dir():
-        return "not_started"
-    
-    research_file = paths.get_research_file(feature_name)
-    prd_file = paths.get_prd_file(feature_name)
-    deliverables_map = paths.get_deliverables_map(feature_name)
-    deliverables_dir = paths.get_deliverables_dir(feature_name)
     
-    # Check for deliverable files
-    if deliverables_dir.is_dir():
-        deliverable_files = list(deliverables_dir.glob("deliverable-*.md"))
-        if deliverable_files:
-            return "deliverables_generated"
-    
-    if deliverables_map.is_file():
-        return "decomposed"
-    
-    if prd_file.is_file():
-        try:
-            content = prd_file.read_text()
-            if re.search(r"Status.*Approved", content):
-                return "approved"
-        except Exception:
-            pass
-        return "drafted"
+    Checks run cheapest first with bounded reads (see status.py).
+    """
+    return detect_feature_status(paths.get_feature_dir(feature_name))
+
+
+# ============================================================================
+# Spec Detection
+# ============================================================================
+def detect_current_spec(paths: PRDKitPaths) -> str | None:
+    """Detect the spec being worked on from the checked-out feat/NNN-name branch.
     
-    if research_file.is_file():
-        try:
-            content = research_file.read_text()
-            if "[NEEDS_DETAIL:" in content:
-                return "discovery_in_progress"
-        except Exception:
-            pass
-        return "discovery_complete"
+    Returns:
+        The spec directory name if specs/NNN-name exists, else the zero-padded
+        feature number, or None if HEAD is not a feature branch.
+    """
+    refs = GitRefs.find(paths.project_root)
+    branch = refs.current_branch() if refs else None
+    parsed = parse_feature_branch(branch) if branch else None
+    if branch is None or parsed is None:
+        return None
     
-    return "not_started"
+    spec_name = branch.rsplit("feat/", 1)[1]
+    if (paths.project_root / "specs" / spec_name).is_dir():
+        return spec_name
+    return f"{parsed[0]:03d}"
 
 
 # ============================================================================
@@ -252,23 +242,16 @@ def copy_template(paths: PRDKitPaths, template_name: str, dest_path: Path) -> bo
 
 def list_available_docs(paths: PRDKitPaths, feature_name: str) -> list[str]:
     """List available documentation files for a feature."""
-    feature_dir = paths.get_feature_dir(feature_name)
-    docs = []
-    
-    if (feature_dir / "research.md").is_file():
-        docs.append("research.md")
-    
-    if (feature_dir / "PRD.md").is_file():
-        docs.append("PRD.md")
-    
-    deliverables_dir = paths.get_deliverables_dir(feature_name)
+    documents = get_workspace_index(paths).feature_documents(feature_name)
+    docs: list[str] = []
     
-    if (deliverables_dir / "deliverables-map.json").is_file():
-        docs.append("deliverables-map.json")
+    for name in ("research.md", "PRD.md", "deliverables-map.json"):
+        if name in documents:
+            docs.append(name)
     
-    if deliverables_dir.is_dir():
-        for f in deliverables_dir.glob("deliverable-*.md"):
-            docs.append(f.name)
+    for name, doc in documents.items():
+        if doc["kind"] == "deliverable":
+            docs.append(name)
     
     return docs
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""PRD Kit - Resident daemon serving setup scripts and validators.
+
+Listens on a Unix socket (.prd-kit/daemon.sock) and answers newline-delimited
+JSON-RPC 2.0 requests. Each setup_* script and validator is a method; params
+are {"args": [...], "cwd": "..."} and the result is
+{"exit_code": int, "stdout": str, "stderr": str}, i.e. exactly what running
+the script directly would produce.
+
+The interpreter, imported modules and the workspace index stay warm between
+requests. Modules are re-imported when their source files change (e.g.
+after `prd update`), and the workspace index revalidates itself by mtime.
+
+Python offers no Unix sockets on some platforms (e.g. Windows); there the
+daemon does not start, and prd_scripts.client runs every script in-process.
+
+Usage:
+    python -m prd_scripts.daemon
+    prd daemon
+"""
+
+import importlib
+import io
+import json
+import os
+import socketserver
+import sys
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from .client import (
+    DAEMON_SUPPORTED,
+    VALIDATOR_METHODS,
+    VALIDATOR_MODULES,
+    find_project_root,
+    request,
+    socket_path,
+)
+from .common import log_error, log_info, log_success
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+VALIDATORS_DIR = SCRIPTS_DIR.parent.parent / "validators"
+
+# Modules that must survive a reload (the server itself)
+PERSISTENT_MODULES = {"prd_scripts", "prd_scripts.client", "prd_scripts.daemon"}
+
+
+def _trace() -> ModuleType:
+    """Return the current prd_scripts.trace module.
+
+    It is looked up on every request rather than imported once: a reload
+    replaces it, and the reloaded scripts record their spans in the new one.
+    """
+    return importlib.import_module(".trace", __package__)
+
+
+class ScriptRunner:
+    """Runs setup scripts and validators in-process, reloading on change."""
+
+    def __init__(self) -> None:
+        self._source_mtimes = self._snapshot_sources()
+
+    @staticmethod
+    def _snapshot_sources() -> dict[Path, int]:
+        sources = list(SCRIPTS_DIR.glob("*.py")) + list(VALIDATORS_DIR.glob("*.py"))
+        mtimes = {}
+        for path in sources:
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except OSError:
+                pass
+        return mtimes
+
+    def invalidate_if_changed(self) -> bool:
+        """Drop cached modules if any script or validator source changed."""
+        current = self._snapshot_sources()
+        if current == self._source_mtimes:
+            return False
+        self._source_mtimes = current
+        for name in list(sys.modules):
+            if name.startswith("prd_scripts.") and name not in PERSISTENT_MODULES:
+                del sys.modules[name]
+        return True
+
+    def methods(self) -> list[str]:
+        setup = sorted(p.stem for p in SCRIPTS_DIR.glob("setup_*.py"))
+        return setup + list(VALIDATOR_METHODS)
+
+    def run(self, method: str, args: list[str], cwd: str | None) -> dict[str, Any]:
+        """Run a method and capture its exit code and output."""
+        entry: Callable[[], Any]
+        if method in VALIDATOR_METHODS:
+            module = importlib.import_module(f"prd_scripts.{VALIDATOR_MODULES[method]}")
+            argv = [str(VALIDATORS_DIR / f"{method}.py"), *args]
+            entry = lambda: module.main(args)  # noqa: E731
+        elif method.startswith("setup_") and (SCRIPTS_DIR / f"{method}.py").is_file():
+            module = importlib.import_module(f"prd_scripts.{method}")
+            argv = [method, *args]
+            entry = lambda: module.main(args)  # noqa: E731
+        else:
+            raise LookupError(method)
+
+        trace = _trace()
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+        sys.argv = argv
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with (
+                trace.span(method, "command", args=args),
+                redirect_stdout(stdout),
+                redirect_stderr(stderr),
+            ):
+                try:
+                    exit_code = entry() or 0
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    print(f"[ERROR] {e}", file=sys.stderr)
+                    exit_code = 1
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+
+        # The daemon never exits between requests: write one trace per request
+        if trace.enabled():
+            trace.write_trace()
+
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+if DAEMON_SUPPORTED:
+    class DaemonServer(socketserver.UnixStreamServer):
+        """Single-threaded server: requests are handled one at a time, which
+        keeps the process-wide stdout/cwd redirection in ScriptRunner safe."""
+
+        def __init__(self, path: Path, runner: ScriptRunner):
+            self.runner = runner
+            self.should_stop = False
+            super().__init__(os.fspath(path), RequestHandler)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Reads newline-delimited JSON-RPC requests from one connection."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self._dispatch(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.should_stop:
+                return
+
+    def _dispatch(self, line: bytes) -> dict[str, Any]:
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": "Parse error"},
+            }
+
+        request_id = message.get("id")
+        method = message.get("method", "")
+        params = message.get("params") or {}
+        runner = self.server.runner
+
+        if method == "ping":
+            return {"jsonrpc": "2.0", "id": request_id, "result": {"pid": os.getpid()}}
+        if method == "methods":
+            return {"jsonrpc": "2.0", "id": request_id, "result": runner.methods()}
+        if method == "shutdown":
+            self.server.should_stop = True
+            return {"jsonrpc": "2.0", "id": request_id, "result": {"stopping": True}}
+
+        runner.invalidate_if_changed()
+        try:
+            result = runner.run(method, list(params.get("args", [])), params.get("cwd"))
+        except LookupError:
+            return {
+                "jsonrpc": "2.0", "id": request_id,
+                "error": {"code": -32601, "message": f"Method not found: {method}"},
+            }
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def is_running(project_root: Path) -> bool:
+    """Check whether a daemon is answering on the project's socket."""
+    try:
+        response = request("ping", project_root=project_root, timeout=2.0)
+    except TimeoutError:
+        return True  # Listening, but busy with a long request
+    except OSError:
+        return False
+    return response is not None and "result" in response
+
+
+def serve(project_root: Path | None = None) -> int:
+    """Run the daemon in the foreground until shut down."""
+    if not DAEMON_SUPPORTED:
+        log_error("The PRD Kit daemon needs Unix sockets, which this platform lacks")
+        log_info("Scripts run without it: prd_scripts.client runs them in-process")
+        return 1
+    project_root = project_root or find_project_root()
+    path = socket_path(project_root)
+
+    if path.exists():
+        if is_running(project_root):
+            print(f"Daemon already running on {path}", file=sys.stderr)
+            return 1
+        path.unlink()  # Stale socket from a crashed daemon
+
+    os.chdir(project_root)
+    server = DaemonServer(path, ScriptRunner())
+    log_info(f"PRD Kit daemon listening on {path} (pid {os.getpid()})")
+    try:
+        while not server.should_stop:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    log_success("PRD Kit daemon stopped")
+    return 0
+
+
+def stop(project_root: Path | None = None) -> bool:
+    """Ask a running daemon to shut down. Returns False if none was running."""
+    try:
+        response = request(
+            "shutdown", project_root=project_root or find_project_root(), timeout=5.0
+        )
+    except TimeoutError:
+        return True  # Busy: it stops once the current request is done
+    except OSError:
+        return False
+    return response is not None
+
+
+if __name__ == "__main__":
+    if "--stop" in sys.argv[1:]:
+        sys.exit(0 if stop() else 1)
+    sys.exit(serve())
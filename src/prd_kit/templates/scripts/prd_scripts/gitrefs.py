@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""PRD Kit - Pure-Python git ref reader.
+
+Reads HEAD, loose refs (refs/heads, refs/remotes) and packed-refs straight
+from the .git directory instead of spawning `git branch -a`, which is slow
+on repositories with many remote refs.
+
+Only ref names are read, never objects. Parsed results are cached per
+process and keyed by mtime: packed-refs and HEAD by file mtime, loose refs
+per directory (a directory's mtime changes when refs are added to or removed
+from it), so repeated lookups - e.g. in the daemon - cost a few stat calls.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar, cast
+
+from .trace import span
+
+# Namespaces scanned by ref_names() (what `git branch -a` lists)
+BRANCH_NAMESPACES = ("refs/heads/", "refs/remotes/")
+
+FEATURE_BRANCH_PATTERN = re.compile(r"(?:^|/)feat/(\d+)-(.+)$")
+
+_T = TypeVar("_T")
+
+# path -> (mtime_ns, size, parsed value)
+_file_cache: dict[str, tuple[int, int, object]] = {}
+# directory -> (mtime_ns, file names, subdirectory names)
+_dir_cache: dict[str, tuple[int, list[str], list[str]]] = {}
+
+
+def _stat_key(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cached(path: Path, parse: Callable[[str], _T]) -> _T | None:
+    """Parse a file, reusing the previous result while its mtime/size are unchanged."""
+    key = os.fspath(path)
+    stat = _stat_key(key)
+    if stat is None:
+        _file_cache.pop(key, None)
+        return None
+    cached = _file_cache.get(key)
+    if cached is not None and cached[:2] == stat:
+        return cast(_T, cached[2])
+    try:
+        with (
+            span("read ref file", "git", path=key),
+            open(key, encoding="utf-8", errors="replace") as f,
+        ):
+            value = parse(f.read())
+    except OSError:
+        return None
+    _file_cache[key] = (*stat, value)
+    return value
+
+
+def _list_dir(path: str) -> tuple[list[str], list[str]]:
+    """List a refs directory as (files, subdirectories), cached by mtime."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _dir_cache.pop(path, None)
+        return [], []
+    cached = _dir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    files, dirs = [], []
+    try:
+        with span("scandir refs", "git", path=path), os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".lock"):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+    except OSError:
+        return [], []
+    _dir_cache[path] = (mtime, files, dirs)
+    return files, dirs
+
+
+def _parse_packed_refs(content: str) -> list[str]:
+    names = []
+    for line in content.splitlines():
+        # "<sha> <refname>"; skip the header and "^<sha>" peeled-tag lines
+        if not line or line[0] in "#^":
+            continue
+        _, _, name = line.partition(" ")
+        if name:
+            names.append(name.strip())
+    return names
+
+
+def _parse_head(content: str) -> str | None:
+    content = content.strip()
+    if content.startswith("ref:"):
+        return content[4:].strip()
+    return None  # Detached HEAD
+
+
+def find_git_dir(start: Path) -> Path | None:
+    """Find the .git directory for a working tree, following `gitdir:` files
+    (worktrees and submodules)."""
+    current = start.resolve()
+    while True:
+        candidate = current / ".git"
+        if candidate.is_dir():
+            return candidate
+        if candidate.is_file():
+            try:
+                content = candidate.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[7:].strip())
+                return git_dir if git_dir.is_absolute() else (current / git_dir).resolve()
+            return None
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+class GitRefs:
+    """Ref names of one repository, read directly from its git directory."""
+
+    def __init__(self, git_dir: Path):
+        self.git_dir = git_dir
+        # Linked worktrees keep HEAD locally and refs in the common directory
+        common = _read_cached(git_dir / "commondir", lambda c: c.strip())
+        self.common_dir = (git_dir / common).resolve() if common else git_dir
+
+    @classmethod
+    def find(cls, start: Path) -> "GitRefs | None":
+        """Return a reader for the repository containing start, or None."""
+        git_dir = find_git_dir(start)
+        return cls(git_dir) if git_dir is not None else None
+
+    def head(self) -> str | None:
+        """Return the full ref HEAD points to (e.g. refs/heads/main), or None
+        if HEAD is detached or unreadable."""
+        return _read_cached(self.git_dir / "HEAD", _parse_head)
+
+    def current_branch(self) -> str | None:
+        """Return the checked-out branch name (e.g. feat/001-auth), or None."""
+        head = self.head()
+        if head and head.startswith("refs/heads/"):
+            return head[len("refs/heads/"):]
+        return None
+
+    def _loose_refs(self, namespace: str) -> list[str]:
+        names: list[str] = []
+        stack = [namespace.rstrip("/")]
+        while stack:
+            ref_dir = stack.pop()
+            files, dirs = _list_dir(os.path.join(self.common_dir, ref_dir))
+            names.extend(f"{ref_dir}/{name}" for name in files)
+            stack.extend(f"{ref_dir}/{name}" for name in dirs)
+        return names
+
+    def ref_names(self, namespaces: tuple[str, ...] = BRANCH_NAMESPACES) -> set[str]:
+        """Return full names of all loose and packed refs under namespaces."""
+        names = set()
+        for namespace in namespaces:
+            names.update(self._loose_refs(namespace))
+        packed = _read_cached(self.common_dir / "packed-refs", _parse_packed_refs) or []
+        names.update(name for name in packed if name.startswith(namespaces))
+        # refs/remotes/<remote>/HEAD is a symbolic ref, not a branch
+        return {name for name in names if not name.endswith("/HEAD")}
+
+
+def parse_feature_branch(name: str) -> tuple[int, str] | None:
+    """Parse a `feat/NNN-name` branch (optionally remote-prefixed) into
+    (number, name)."""
+    match = FEATURE_BRANCH_PATTERN.search(name)
+    if match is None:
+        return None
+    return int(match.group(1)), match.group(2)
+
+
+def highest_feature_number(refs: GitRefs) -> int:
+    """Return the highest NNN among local and remote feat/NNN-* branches (0 if none)."""
+    highest = 0
+    for name in refs.ref_names():
+        parsed = parse_feature_branch(name)
+        if parsed is not None:
+            highest = max(highest, parsed[0])
+    return highest
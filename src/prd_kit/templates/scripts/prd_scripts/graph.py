@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""PRD Kit - Workspace-wide deliverables dependency graph.
+
+Dependencies in deliverables-map.json name a deliverable ID of the same PRD
+("003") or, qualified by another feature's directory name in prds/, a
+deliverable of that PRD ("platform:003"). WorkspaceGraph merges every
+prds/*/deliverables/deliverables-map.json into one graph whose nodes are
+keyed "prd:id", so ordering and cycle checks can span PRDs.
+
+The merged graph is cached in memory and in .prd-kit/cache/workspace-graph.json,
+keyed by the path, mtime and size of every map: it is rebuilt only when a
+map is added, removed or changed. Building, cycle detection and ordering are
+all linear in the total number of deliverables and dependencies.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .trace import span
+
+QUALIFIER = ":"
+MAP_FILE_NAME = "deliverables-map.json"
+GRAPH_CACHE_FILE = "workspace-graph.json"
+GRAPH_CACHE_VERSION = "1"
+
+# prds directory -> (fingerprint, graph)
+_graphs: dict[str, tuple[list[Any], "WorkspaceGraph"]] = {}
+
+
+def split_reference(reference: str, prd: str) -> tuple[str, str]:
+    """Split a dependency into (prd, id); unqualified IDs belong to prd."""
+    other_prd, sep, d_id = reference.partition(QUALIFIER)
+    if not sep:
+        return prd, reference
+    return other_prd.strip(), d_id.strip()
+
+
+def qualify(prd: str, d_id: str) -> str:
+    """Return the workspace-wide key of a deliverable ("prd:id")."""
+    return f"{prd}{QUALIFIER}{d_id}"
+
+
+def is_qualified(reference: str) -> bool:
+    """Check whether a dependency names its PRD explicitly."""
+    return QUALIFIER in reference
+
+
+# ============================================================================
+# Cycle Detection
+# ============================================================================
+def find_dependency_cycles(adjacency: list[list[int]]) -> list[list[int]]:
+    """Find every group of mutually dependent nodes.
+
+    Iterative Tarjan strongly-connected-components pass (no recursion, so
+    long dependency chains cannot hit the recursion limit), linear in the
+    number of nodes plus edges.
+
+    Args:
+        adjacency: adjacency[i] lists the node numbers node i depends on
+
+    Returns:
+        One sorted list of node numbers per cycle group (an SCC with more
+        than one node, or a node that depends on itself), ordered by their
+        lowest node number.
+    """
+    count = len(adjacency)
+    index_of = [-1] * count
+    lowlink = [0] * count
+    on_stack = [False] * count
+    stack: list[int] = []
+    groups = []
+    next_index = 0
+
+    for root in range(count):
+        if index_of[root] != -1:
+            continue
+        index_of[root] = lowlink[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Each frame is [node, position of the next dependency to explore]
+        work = [[root, 0]]
+
+        while work:
+            frame = work[-1]
+            node = frame[0]
+            deps = adjacency[node]
+            position = frame[1]
+            descended = False
+            while position < len(deps):
+                dep = deps[position]
+                position += 1
+                if index_of[dep] == -1:
+                    frame[1] = position
+                    index_of[dep] = lowlink[dep] = next_index
+                    next_index += 1
+                    stack.append(dep)
+                    on_stack[dep] = True
+                    work.append([dep, 0])
+                    descended = True
+                    break
+                if on_stack[dep] and index_of[dep] < lowlink[node]:
+                    lowlink[node] = index_of[dep]
+            if descended:
+                continue
+
+            # All dependencies of node explored
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index_of[node]:
+                group = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    group.append(member)
+                    if member == node:
+                        break
+                if len(group) > 1 or node in deps:
+                    groups.append(sorted(group))
+
+    groups.sort()
+    return groups
+
+
+def cycle_path(adjacency: list[list[int]], group: list[int]) -> list[int]:
+    """Return a shortest dependency path from group[0] back to itself, staying
+    inside the group (breadth-first, so linear in the group's size)."""
+    start = group[0]
+    members = set(group)
+    parent: dict[int, int] = {}
+    queue = [start]
+    for node in queue:
+        for dep in adjacency[node]:
+            if dep == start:
+                path = []
+                while node != start:
+                    path.append(node)
+                    node = parent[node]
+                return [start] + path[::-1] + [start]
+            if dep in members and dep not in parent:
+                parent[dep] = node
+                queue.append(dep)
+    return [start, start]
+
+
+# ============================================================================
+# Workspace Graph
+# ============================================================================
+class WorkspaceGraph:
+    """Deliverables of every PRD in one dependency graph keyed "prd:id"."""
+
+    def __init__(self, nodes: dict[str, dict[str, Any]]):
+        """Create a graph from {key: deliverable}, where each deliverable
+        carries its "prd" and its dependencies as qualified keys."""
+        self.nodes = nodes
+        self.keys = list(nodes)
+        self._number = {key: i for i, key in enumerate(self.keys)}
+        self._cycles: list[list[str]] | None = None
+        self.adjacency = [
+            [self._number[dep] for dep in nodes[key]["dependencies"] if dep in self._number]
+            for key in self.keys
+        ]
+
+    def dangling(self) -> list[tuple[str, str]]:
+        """Return (deliverable, dependency) pairs whose dependency does not exist."""
+        return [
+            (key, dep)
+            for key, node in self.nodes.items()
+            for dep in node["dependencies"]
+            if dep not in self.nodes
+        ]
+
+    def cycles(self) -> list[list[str]]:
+        """Return every cycle group as a list of keys (computed once)."""
+        if self._cycles is None:
+            self._cycles = [
+                [self.keys[i] for i in group]
+                for group in find_dependency_cycles(self.adjacency)
+            ]
+        return self._cycles
+
+    def cycle_path(self, group: list[str]) -> list[str]:
+        """Return a shortest cycle through the first key of a cycle group."""
+        path = cycle_path(self.adjacency, [self._number[key] for key in group])
+        return [self.keys[i] for i in path]
+
+    def deliverables(self) -> list[dict[str, Any]]:
+        """Return every node in deliverables-map form, with "id" set to the
+        qualified key and the original ID under "local_id"."""
+        return [
+            {**node, "id": key, "local_id": node["id"]}
+            for key, node in self.nodes.items()
+        ]
+
+
+def _map_files(prds_dir: Path) -> list[tuple[str, Path]]:
+    """List (prd, map path) for every feature with a deliverables map."""
+    try:
+        with os.scandir(prds_dir) as entries:
+            features = sorted(e.name for e in entries if e.is_dir() and not e.name.startswith("."))
+    except OSError:
+        return []
+    maps = []
+    for prd in features:
+        map_path = prds_dir / prd / "deliverables" / MAP_FILE_NAME
+        if map_path.is_file():
+            maps.append((prd, map_path))
+    return maps
+
+
+def _fingerprint(maps: list[tuple[str, Path]]) -> list[Any]:
+    fingerprint = []
+    for prd, map_path in maps:
+        try:
+            stat = map_path.stat()
+        except OSError:
+            continue
+        fingerprint.append([prd, stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def workspace_fingerprint(prds_dir: Path) -> str:
+    """Return a digest that changes whenever any deliverables map changes."""
+    fingerprint = _fingerprint(_map_files(prds_dir))
+    return hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()
+
+
+def build_workspace_graph(prds_dir: Path) -> WorkspaceGraph:
+    """Merge every deliverables map under prds_dir into one graph (uncached)."""
+    nodes: dict[str, dict[str, Any]] = {}
+    for prd, map_path in _map_files(prds_dir):
+        try:
+            with span("read map", "io", path=str(map_path)):
+                data = json.loads(map_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        deliverables = data.get("deliverables") if isinstance(data, dict) else None
+        if not isinstance(deliverables, list):
+            continue
+        for d in deliverables:
+            if not isinstance(d, dict) or not isinstance(d.get("id"), str):
+                continue
+            deps = d.get("dependencies", [])
+            nodes[qualify(prd, d["id"])] = {
+                **d,
+                "prd": prd,
+                "dependencies": [
+                    qualify(*split_reference(dep, prd))
+                    for dep in (deps if isinstance(deps, list) else [])
+                    if isinstance(dep, str)
+                ],
+            }
+    return WorkspaceGraph(nodes)
+
+
+def _read_graph_cache(cache_file: Path, fingerprint: list[Any]) -> WorkspaceGraph | None:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != GRAPH_CACHE_VERSION
+        or data.get("fingerprint") != fingerprint
+    ):
+        return None
+    return WorkspaceGraph(data["nodes"])
+
+
+def _write_graph_cache(cache_file: Path, fingerprint: list[Any], graph: WorkspaceGraph) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "version": GRAPH_CACHE_VERSION,
+                "fingerprint": fingerprint,
+                "nodes": graph.nodes,
+            }, f)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        pass
+
+
+def load_workspace_graph(prds_dir: Path, cache_dir: Path | None = None) -> WorkspaceGraph:
+    """Return the merged graph for prds_dir, rebuilt only when a map changed.
+
+    Args:
+        prds_dir: The workspace's prds/ directory
+        cache_dir: Directory for the on-disk cache (.prd-kit/cache/), or None
+            to cache in memory only
+    """
+    maps = _map_files(prds_dir)
+    fingerprint = _fingerprint(maps)
+    key = os.fspath(prds_dir.resolve())
+
+    cached = _graphs.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    cache_file = cache_dir / GRAPH_CACHE_FILE if cache_dir is not None else None
+    graph = _read_graph_cache(cache_file, fingerprint) if cache_file is not None else None
+    if graph is None:
+        graph = build_workspace_graph(prds_dir)
+        if cache_file is not None:
+            _write_graph_cache(cache_file, fingerprint, graph)
+
+    _graphs[key] = (fingerprint, graph)
+    return graph
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""PRD Kit - Implementation Order Generator.
+
+Generates a topologically sorted implementation order from deliverables-map.json.
+Respects dependencies and identifies what can be parallelized.
+
+Usage:
+    python .prd-kit/validators/generate-implementation-order.py <map_path> [--workers N]
+
+    where <map_path> is e.g. prds/feature-name/deliverables/deliverables-map.json
+
+Or in-process (also available as prd_kit.validators):
+    from prd_scripts.implementation_order import generate_order
+
+    order = generate_order(Path("prds/feature-name/deliverables/deliverables-map.json"))
+
+With --workers N, deliverables are also list-scheduled onto N workers (agent
+slots or engineers): whenever a worker is free it takes the ready deliverable
+with the longest chain of dependents behind it, ties broken by the map's
+priority. Each deliverable takes 1, 2 or 3 rounds for estimated_effort
+small, medium or large (1 if unset). The output adds per-worker lanes and the
+projected number of rounds.
+
+Dependencies on other PRDs ("other-prd:003") are listed per deliverable as
+external_dependencies and treated as already delivered when ordering one
+map. With --workspace, every deliverables map in prds/ is merged into one
+graph (cached in .prd-kit/cache/) and ordered as a whole:
+
+    python .prd-kit/validators/generate-implementation-order.py --workspace [prds_dir] [--workers N]
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .cache import find_cache_dir
+from .graph import is_qualified, load_workspace_graph, split_reference
+from .trace import traced
+
+
+class ImplementationPhase(NamedTuple):
+    """A phase of implementation."""
+    phase_num: int
+    deliverables: list[str]
+    parallel: bool
+
+
+class ScheduledDeliverable(NamedTuple):
+    """A deliverable placed on a worker lane."""
+    deliverable_id: str
+    worker: int
+    start_round: int  # 1-based, inclusive
+    end_round: int    # 1-based, inclusive
+
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+EFFORT_ROUNDS = {"small": 1, "medium": 2, "large": 3}
+
+
+def load_deliverables_map(map_path: Path) -> dict[str, Any] | None:
+    """Load deliverables map."""
+    try:
+        with open(map_path) as f:
+            data: dict[str, Any] = json.load(f)
+            return data
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+@traced("rule")
+def topological_sort_with_levels(deliverables: list[dict[str, Any]]) -> list[ImplementationPhase]:
+    """
+    Perform topological sort and group deliverables into phases.
+    Deliverables in the same phase can be parallelized.
+    """
+    # Build graph
+    graph: dict[str, list[str]] = {}
+    in_degree: dict[str, int] = {}
+    id_to_deliverable: dict[str, dict[str, Any]] = {}
+    
+    for d in deliverables:
+        d_id = d.get("id", "")
+        deps = d.get("dependencies", [])
+        graph[d_id] = []
+        in_degree[d_id] = len(deps)
+        id_to_deliverable[d_id] = d
+    
+    # Build reverse edges (for tracking what depends on what)
+    for d in deliverables:
+        d_id = d.get("id", "")
+        for dep in d.get("dependencies", []):
+            if dep in graph:
+                graph[dep].append(d_id)
+    
+    # Kahn's algorithm with level tracking
+    phases: list[ImplementationPhase] = []
+    
+    # Start with nodes that have no dependencies
+    current_level = [d_id for d_id, degree in in_degree.items() if degree == 0]
+    phase_num = 1
+    
+    while current_level:
+        # All items in current_level can be done in parallel
+        phases.append(ImplementationPhase(
+            phase_num=phase_num,
+            deliverables=sorted(current_level),
+            parallel=len(current_level) > 1,
+        ))
+        
+        # Find next level
+        next_level = []
+        for d_id in current_level:
+            for dependent in graph[d_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_level.append(dependent)
+        
+        current_level = next_level
+        phase_num += 1
+    
+    # Check for cycles (if not all nodes were processed)
+    processed = sum(len(p.deliverables) for p in phases)
+    if processed < len(deliverables):
+        # There's a cycle - return empty (validation should catch this)
+        return []
+    
+    return phases
+
+
+@traced("rule")
+def schedule_with_workers(
+    deliverables: list[dict[str, Any]], workers: int
+) -> list[ScheduledDeliverable]:
+    """
+    List-schedule deliverables onto a fixed number of workers.
+    
+    Ready deliverables wait in a heap keyed by (longest remaining chain of
+    rounds, priority, id); finishing work sits in a second heap keyed by end
+    round, so each step costs O(log n).
+    
+    Returns:
+        The scheduled deliverables in start order, or [] on a cycle.
+    """
+    ids = [d.get("id", "") for d in deliverables]
+    id_to_deliverable = {d_id: d for d_id, d in zip(ids, deliverables)}
+    dependents: dict[str, list[str]] = {d_id: [] for d_id in id_to_deliverable}
+    in_degree: dict[str, int] = {}
+    rounds: dict[str, int] = {}
+    
+    for d_id, d in id_to_deliverable.items():
+        declared = d.get("dependencies")
+        deps = [
+            dep for dep in (declared if isinstance(declared, list) else [])
+            if isinstance(dep, str) and dep in dependents
+        ]
+        in_degree[d_id] = len(deps)
+        for dep in deps:
+            dependents[dep].append(d_id)
+        # Unknown or malformed (non-string) efforts count as small
+        effort = d.get("estimated_effort")
+        rounds[d_id] = EFFORT_ROUNDS.get(effort, 1) if isinstance(effort, str) else 1
+    
+    # Topological order (Kahn), then each node's chain length from the end
+    order = [d_id for d_id, degree in in_degree.items() if degree == 0]
+    remaining = dict(in_degree)
+    for d_id in order:
+        for dependent in dependents[d_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                order.append(dependent)
+    if len(order) < len(id_to_deliverable):
+        return []
+    
+    chain: dict[str, int] = {}
+    for d_id in reversed(order):
+        chain[d_id] = rounds[d_id] + max((chain[n] for n in dependents[d_id]), default=0)
+    
+    def ready_key(d_id: str) -> tuple[int, int, str]:
+        value = id_to_deliverable[d_id].get("priority", "medium")
+        priority = PRIORITY_RANK.get(value, 1) if isinstance(value, str) else 1
+        return (-chain[d_id], priority, d_id)
+    
+    ready = [ready_key(d_id) for d_id, degree in in_degree.items() if degree == 0]
+    heapq.heapify(ready)
+    free_workers = list(range(1, workers + 1))
+    running: list[tuple[int, int, str]] = []  # (end round, worker, id)
+    schedule: list[ScheduledDeliverable] = []
+    now = 0  # Rounds completed so far
+    
+    while ready or running:
+        while ready and free_workers:
+            d_id = heapq.heappop(ready)[2]
+            worker = heapq.heappop(free_workers)
+            end = now + rounds[d_id]
+            schedule.append(ScheduledDeliverable(d_id, worker, now + 1, end))
+            heapq.heappush(running, (end, worker, d_id))
+        
+        # Advance to the next round in which something finishes
+        now = running[0][0]
+        while running and running[0][0] == now:
+            _, worker, d_id = heapq.heappop(running)
+            heapq.heappush(free_workers, worker)
+            for dependent in dependents[d_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, ready_key(dependent))
+    
+    return schedule
+
+
+def _split_external(
+    deliverables: list[dict[str, Any]], prd: str
+) -> tuple[list[dict[str, Any]], dict[str, list[str]]]:
+    """
+    Prepare one map's deliverables for ordering on their own.
+    
+    "prd:id" references to the map's own PRD become plain IDs; references to
+    other PRDs are set aside (treated as already delivered) and returned as
+    {deliverable id: [external references]}.
+    """
+    local = []
+    external: dict[str, list[str]] = {}
+    for d in deliverables:
+        deps = []
+        for dep in d.get("dependencies", []):
+            if isinstance(dep, str) and is_qualified(dep):
+                dep_prd, dep_id = split_reference(dep, prd)
+                if dep_prd != prd:
+                    external.setdefault(d.get("id", ""), []).append(dep)
+                    continue
+                dep = dep_id
+            deps.append(dep)
+        local.append({**d, "dependencies": deps})
+    return local, external
+
+
+def generate_order(map_path: Path, workers: int | None = None) -> dict[str, Any]:
+    """Generate implementation order from map."""
+    map_data = load_deliverables_map(map_path)
+    
+    if map_data is None:
+        return {
+            "success": False,
+            "error": "Failed to load deliverables map",
+            "phases": [],
+        }
+    
+    deliverables = map_data.get("deliverables", [])
+    
+    if not deliverables:
+        return {
+            "success": False,
+            "error": "No deliverables found",
+            "phases": [],
+        }
+    
+    prd = map_path.resolve().parent.parent.name
+    deliverables, external = _split_external(deliverables, prd)
+    return _build_order(deliverables, str(map_path), workers, external)
+
+
+def generate_workspace_order(prds_dir: Path, workers: int | None = None) -> dict[str, Any]:
+    """Generate one implementation order across every PRD in prds_dir."""
+    graph = load_workspace_graph(prds_dir, find_cache_dir(prds_dir))
+    
+    if not graph.nodes:
+        return {
+            "success": False,
+            "error": "No deliverables found",
+            "phases": [],
+        }
+    
+    dangling = graph.dangling()
+    if dangling:
+        return {
+            "success": False,
+            "error": "Unresolved dependencies: "
+            + ", ".join(f"{key} -> {dep}" for key, dep in dangling),
+            "phases": [],
+        }
+    
+    return _build_order(graph.deliverables(), str(prds_dir), workers, {})
+
+
+def _build_order(
+    deliverables: list[dict[str, Any]],
+    source: str,
+    workers: int | None,
+    external: dict[str, list[str]],
+) -> dict[str, Any]:
+    """Order deliverables into phases (and worker lanes) for output."""
+    phases = topological_sort_with_levels(deliverables)
+    
+    if not phases and deliverables:
+        return {
+            "success": False,
+            "error": "Circular dependencies detected",
+            "phases": [],
+        }
+    
+    # Build detailed output
+    id_to_deliverable = {d["id"]: d for d in deliverables}
+    
+    phase_details = []
+    for phase in phases:
+        phase_info: dict[str, Any] = {
+            "phase": phase.phase_num,
+            "parallel": phase.parallel,
+            "deliverables": [],
+        }
+        
+        for d_id in phase.deliverables:
+            d = id_to_deliverable.get(d_id, {})
+            detail = {
+                "id": d_id,
+                "name": d.get("name", ""),
+                "title": d.get("title", ""),
+                "file": d.get("file", ""),
+                "priority": d.get("priority", "medium"),
+            }
+            if "prd" in d:
+                detail["prd"] = d["prd"]
+            if d_id in external:
+                detail["external_dependencies"] = external[d_id]
+            phase_info["deliverables"].append(detail)
+        
+        phase_details.append(phase_info)
+    
+    order = {
+        "success": True,
+        "source": source,
+        "total_deliverables": len(deliverables),
+        "total_phases": len(phases),
+        "phases": phase_details,
+    }
+    
+    if workers:
+        schedule = schedule_with_workers(deliverables, workers)
+        lanes: list[dict[str, Any]] = [
+            {"worker": w, "deliverables": []} for w in range(1, workers + 1)
+        ]
+        for item in schedule:
+            d = id_to_deliverable.get(item.deliverable_id, {})
+            lanes[item.worker - 1]["deliverables"].append({
+                "id": item.deliverable_id,
+                "title": d.get("title", ""),
+                "priority": d.get("priority", "medium"),
+                "start_round": item.start_round,
+                "end_round": item.end_round,
+            })
+        order["schedule"] = {
+            "workers": workers,
+            "rounds": max((item.end_round for item in schedule), default=0),
+            "lanes": lanes,
+        }
+    
+    return order
+
+
+def format_human_readable(order: dict[str, Any]) -> str:
+    """Format order for human reading."""
+    if not order.get("success"):
+        return f"Error: {order.get('error', 'Unknown error')}"
+    
+    lines = [
+        "=" * 60,
+        "IMPLEMENTATION ORDER",
+        "=" * 60,
+        f"Total Deliverables: {order['total_deliverables']}",
+        f"Total Phases: {order['total_phases']}",
+        "",
+    ]
+    
+    for phase in order["phases"]:
+        parallel_marker = " (can be parallel)" if phase["parallel"] else ""
+        lines.append(f"Phase {phase['phase']}{parallel_marker}:")
+        
+        for d in phase["deliverables"]:
+            lines.append(f"  [{d['id']}] {d['title']}")
+            lines.append(f"       File: {d['file']}")
+            lines.append(f"       Priority: {d['priority']}")
+            if d.get("external_dependencies"):
+                external = ", ".join(d["external_dependencies"])
+                lines.append(f"       Depends on (other PRDs): {external}")
+        
+        lines.append("")
+    
+    schedule = order.get("schedule")
+    if schedule:
+        lines.append(f"Worker Lanes ({schedule['workers']} workers, {schedule['rounds']} rounds):")
+        for lane in schedule["lanes"]:
+            items = ", ".join(
+                f"[{d['id']}] r{d['start_round']}"
+                + (f"-{d['end_round']}" if d["end_round"] > d["start_round"] else "")
+                for d in lane["deliverables"]
+            )
+            lines.append(f"  Worker {lane['worker']}: {items or '(idle)'}")
+        lines.append("")
+    
+    # Generate commands
+    lines.append("=" * 60)
+    lines.append("SPEC KIT COMMANDS (in order):")
+    lines.append("=" * 60)
+    
+    for phase in order["phases"]:
+        for d in phase["deliverables"]:
+            name = d["name"] or d["id"]
+            lines.append(f"specify init specs/{name}")
+    
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate implementation order from deliverables-map.json"
+    )
+    parser.add_argument(
+        "map_path", type=Path, nargs="?",
+        help="Path to deliverables-map.json (prds/ directory with --workspace)",
+    )
+    parser.add_argument(
+        "--workers", type=int,
+        help="Schedule onto N workers and report lanes and rounds",
+    )
+    parser.add_argument(
+        "--workspace", action="store_true",
+        help="Order every PRD's deliverables as one graph",
+    )
+    parsed = parser.parse_args(argv)
+    
+    if parsed.workers is not None and parsed.workers < 1:
+        print("--workers must be at least 1", file=sys.stderr)
+        return 1
+    
+    if parsed.workspace:
+        order = generate_workspace_order(parsed.map_path or Path("prds"), parsed.workers)
+    elif parsed.map_path is None:
+        parser.print_usage(sys.stderr)
+        return 1
+    else:
+        order = generate_order(parsed.map_path, parsed.workers)
+    
+    # JSON output
+    print(json.dumps(order, indent=2))
+    
+    # Human-readable output to stderr
+    print("\n" + format_human_readable(order), file=sys.stderr)
+    
+    return 0 if order.get("success") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""PRD Kit - Persistent workspace index.
+
+Keeps a SQLite database under .prd-kit/ with every feature, document and
+deliverable found in prds/ and specs/. Directories are only re-listed when
+their mtime changes and document records are only rewritten when a file's
+mtime or size changes, so repeated lookups do not rescan the whole
+workspace. File contents are never read here; feature status comes from
+the bounded readers in status.py.
+"""
+
+import os
+import re
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .trace import span
+
+if TYPE_CHECKING:
+    from .common import PRDKitPaths
+
+
+INDEX_FILE_NAME = "index.sqlite"
+SCHEMA_VERSION = "2"
+
+DELIVERABLE_FILE_PATTERN = re.compile(r"deliverable-(\d+)-(.+)\.md")
+
+# Documents tracked per feature in prds/<feature>/
+FEATURE_DOCUMENTS = {
+    "research.md": "research",
+    "PRD.md": "prd",
+}
+
+# Documents tracked per spec in specs/<spec>/
+SPEC_DOCUMENTS = ("README.md", "deliverable.md", "context.md", "plan.md", "tasks.md")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    root TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    deliverable_id TEXT,
+    deliverable_name TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_dir ON documents (dir);
+CREATE INDEX IF NOT EXISTS documents_owner ON documents (root, owner);
+"""
+
+
+def _classify_feature_file(name: str) -> str | None:
+    """Return the document kind for a file in a feature directory."""
+    return FEATURE_DOCUMENTS.get(name)
+
+
+def _classify_deliverables_file(name: str) -> str | None:
+    """Return the document kind for a file in a deliverables directory."""
+    if name == "deliverables-map.json":
+        return "map"
+    if name.startswith("deliverable-") and name.endswith(".md"):
+        return "deliverable"
+    return None
+
+
+def _classify_spec_file(name: str) -> str | None:
+    """Return the document kind for a file in a spec directory."""
+    if name in SPEC_DOCUMENTS or (name.startswith("deliverable-") and name.endswith(".md")):
+        return "spec_doc"
+    return None
+
+
+class WorkspaceIndex:
+    """Incrementally refreshed index of prds/ and specs/."""
+
+    def __init__(self, paths: "PRDKitPaths"):
+        self.paths = paths
+        self.project_root = paths.project_root
+        self.db_path = paths.prd_kit_dir / INDEX_FILE_NAME
+        self._conn = self._connect()
+        self._lookup: DeliverableLookup | None = None
+
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, falling back to memory if unwritable."""
+        conn = None
+        if self.paths.prd_kit_dir.is_dir():
+            try:
+                conn = sqlite3.connect(self.db_path, timeout=5)
+                self._ensure_schema(conn)
+            except sqlite3.Error:
+                conn = None
+        if conn is None:
+            conn = sqlite3.connect(":memory:")
+            self._ensure_schema(conn)
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        """Create tables, dropping them if the schema version changed."""
+        conn.executescript(SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or row[0] != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DELETE FROM dirs")
+                conn.execute("DELETE FROM documents")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+                    (SCHEMA_VERSION,),
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.project_root).as_posix()
+
+    def _forget_dir(self, rel_dir: str) -> None:
+        """Remove a directory and everything below it from the index."""
+        # Paths below rel_dir sort between "rel_dir/" and "rel_dir0" ("0" follows
+        # "/"), so both deletes are index range scans rather than table scans
+        prefix, prefix_end = rel_dir + "/", rel_dir + "0"
+        self._conn.execute(
+            "DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+            (rel_dir, prefix, prefix_end),
+        )
+        self._conn.execute(
+            "DELETE FROM documents WHERE dir = ? OR (dir >= ? AND dir < ?)",
+            (rel_dir, prefix, prefix_end),
+        )
+
+    def _sync_children(self, parent: Path) -> list[str]:
+        """Return the names of subdirectories of a root (prds/ or specs/)."""
+        rel_parent = self._rel(parent)
+        try:
+            mtime_ns = parent.stat().st_mtime_ns
+        except OSError:
+            self._forget_dir(rel_parent)
+            return []
+
+        row = self._conn.execute(
+            "SELECT mtime_ns FROM dirs WHERE path = ?", (rel_parent,)
+        ).fetchone()
+        if row is not None and row[0] == mtime_ns:
+            return [
+                r[0].rsplit("/", 1)[-1]
+                for r in self._conn.execute(
+                    "SELECT path FROM dirs WHERE parent = ? ORDER BY path", (rel_parent,)
+                )
+            ]
+
+        with span("scandir", "scan", path=rel_parent):
+            children = sorted(
+                entry.name
+                for entry in os.scandir(parent)
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+        known = {
+            r[0].rsplit("/", 1)[-1]
+            for r in self._conn.execute("SELECT path FROM dirs WHERE parent = ?", (rel_parent,))
+        }
+        for name in known - set(children):
+            self._forget_dir(f"{rel_parent}/{name}")
+        for name in set(children) - known:
+            # mtime -1 forces the child to be listed on its first sync
+            self._conn.execute(
+                "INSERT INTO dirs (path, parent, mtime_ns) VALUES (?, ?, -1)",
+                (f"{rel_parent}/{name}", rel_parent),
+            )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, '', ?)",
+            (rel_parent, mtime_ns),
+        )
+        return children
+
+    def _sync_dir(
+        self, directory: Path, root: str, owner: str, classify: Callable[[str], str | None]
+    ) -> None:
+        """Bring the documents of one directory up to date."""
+        rel_dir = self._rel(directory)
+        try:
+            dir_mtime = directory.stat().st_mtime_ns
+        except OSError:
+            self._forget_dir(rel_dir)
+            return
+
+        stored = {
+            r[0]: (r[1], r[2])
+            for r in self._conn.execute(
+                "SELECT name, mtime_ns, size FROM documents WHERE dir = ?", (rel_dir,)
+            )
+        }
+        row = self._conn.execute(
+            "SELECT mtime_ns FROM dirs WHERE path = ?", (rel_dir,)
+        ).fetchone()
+
+        current: dict[str, os.stat_result] = {}
+        if row is not None and row[0] == dir_mtime:
+            # Listing unchanged: only stat the files we already know about
+            for name in stored:
+                try:
+                    current[name] = (directory / name).stat()
+                except OSError:
+                    pass
+        else:
+            with span("scandir", "scan", path=rel_dir):
+                for entry in os.scandir(directory):
+                    if classify(entry.name) and entry.is_file():
+                        current[entry.name] = entry.stat()
+            parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                (rel_dir, parent, dir_mtime),
+            )
+
+        for name in stored.keys() - current.keys():
+            self._conn.execute("DELETE FROM documents WHERE path = ?", (f"{rel_dir}/{name}",))
+
+        for name, st in current.items():
+            if stored.get(name) == (st.st_mtime_ns, st.st_size):
+                continue
+            kind = classify(name)
+            deliverable_id = deliverable_name = None
+            if kind == "deliverable":
+                match = DELIVERABLE_FILE_PATTERN.match(name)
+                if match:
+                    deliverable_id, deliverable_name = match.group(1), match.group(2)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (path, dir, root, owner, name, kind, "
+                "deliverable_id, deliverable_name, mtime_ns, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    f"{rel_dir}/{name}", rel_dir, root, owner, name, kind,
+                    deliverable_id, deliverable_name,
+                    st.st_mtime_ns, st.st_size,
+                ),
+            )
+
+    def _refresh_feature_unlocked(self, feature_name: str) -> None:
+        feature_dir = self.paths.get_feature_dir(feature_name)
+        if not feature_dir.is_dir():
+            self._forget_dir(self._rel(feature_dir))
+            return
+        self._sync_dir(feature_dir, "prds", feature_name, _classify_feature_file)
+        deliverables_dir = feature_dir / "deliverables"
+        if deliverables_dir.is_dir():
+            self._sync_dir(deliverables_dir, "prds", feature_name, _classify_deliverables_file)
+        else:
+            self._forget_dir(self._rel(deliverables_dir))
+
+    def refresh_feature(self, feature_name: str) -> None:
+        """Refresh the index entries of a single feature."""
+        with self._conn:
+            self._refresh_feature_unlocked(feature_name)
+
+    def refresh_prds(self) -> list[str]:
+        """Refresh every feature under prds/ and return their names."""
+        with span("refresh prds", "scan"), self._conn:
+            features = self._sync_children(self.paths.prds_dir)
+            for feature_name in features:
+                self._refresh_feature_unlocked(feature_name)
+        return features
+
+    def refresh_specs(self) -> list[str]:
+        """Refresh every spec directory under specs/ and return their names."""
+        specs_dir = self.project_root / "specs"
+        with span("refresh specs", "scan"), self._conn:
+            specs = self._sync_children(specs_dir)
+            for spec_name in specs:
+                self._sync_dir(specs_dir / spec_name, "specs", spec_name, _classify_spec_file)
+        return specs
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def feature_documents(self, feature_name: str) -> dict[str, dict[str, Any]]:
+        """Return {file name: document record} for a feature (after refresh)."""
+        self.refresh_feature(feature_name)
+        rows = self._conn.execute(
+            "SELECT name, kind, path, deliverable_id, deliverable_name "
+            "FROM documents WHERE root = 'prds' AND owner = ? ORDER BY name",
+            (feature_name,),
+        )
+        return {
+            name: {
+                "kind": kind,
+                "path": path,
+                "id": deliverable_id,
+                "name": deliverable_name,
+            }
+            for name, kind, path, deliverable_id, deliverable_name in rows
+        }
+
+    def deliverables(self) -> list[dict[str, Any]]:
+        """Return every deliverable file in prds/, ordered by PRD and file name."""
+        self.refresh_prds()
+        rows = self._conn.execute(
+            "SELECT owner, deliverable_id, deliverable_name, path, name FROM documents "
+            "WHERE root = 'prds' AND kind = 'deliverable' ORDER BY owner, name"
+        )
+        return [
+            {"prd": owner, "id": d_id, "name": d_name, "path": path, "file": name}
+            for owner, d_id, d_name, path, name in rows
+        ]
+
+    def deliverable_lookup(self) -> "DeliverableLookup":
+        """Return a DeliverableLookup, rebuilt only when deliverables changed."""
+        deliverables = self.deliverables()
+        if self._lookup is None or self._lookup.deliverables != deliverables:
+            self._lookup = DeliverableLookup(self.project_root, deliverables)
+        return self._lookup
+
+    def spec_documents(self) -> dict[str, list[str]]:
+        """Return {spec name: [document names]} for every spec directory."""
+        specs = self.refresh_specs()
+        result: dict[str, list[str]] = {name: [] for name in specs}
+        for owner, name in self._conn.execute(
+            "SELECT owner, name FROM documents WHERE root = 'specs' ORDER BY owner, name"
+        ):
+            result.setdefault(owner, []).append(name)
+        return result
+
+
+# ============================================================================
+# Deliverable Lookup
+# ============================================================================
+class DeliverableMatch(NamedTuple):
+    """Result of resolving one deliverable identifier."""
+    identifier: str
+    path: Path | None
+    candidates: list[str]  # Relative paths of every match (>1 means ambiguous)
+
+    @property
+    def ambiguous(self) -> bool:
+        return len(self.candidates) > 1
+
+
+def _normalize_key(key: str) -> str:
+    """Normalize an identifier: case-insensitive, no .md, numeric IDs unpadded."""
+    key = key.strip().lower()
+    if key.endswith(".md"):
+        key = key[:-3]
+    prefix, sep, last = key.rpartition("/")
+    if last.isdigit():
+        last = str(int(last))
+    return f"{prefix}{sep}{last}"
+
+
+class DeliverableLookup:
+    """In-memory index of deliverables keyed by ID, name, file name
+    (deliverable-001-auth, 001-auth) and the same keys qualified by PRD
+    (checkout/001), built from one WorkspaceIndex query."""
+
+    def __init__(self, project_root: Path, deliverables: list[dict[str, Any]]):
+        self.project_root = project_root
+        self.deliverables = deliverables
+        self._by_key: dict[str, list[dict[str, Any]]] = {}
+        for d in deliverables:
+            stem = d["file"][:-3] if d["file"].endswith(".md") else d["file"]
+            local_keys = {stem, stem.removeprefix("deliverable-")}
+            if d["id"] is not None:
+                local_keys.add(d["id"])
+            if d["name"]:
+                local_keys.add(d["name"])
+            keys = {_normalize_key(k) for k in local_keys}
+            keys |= {_normalize_key(f"{d['prd']}/{k}") for k in local_keys}
+            for key in keys:
+                self._by_key.setdefault(key, []).append(d)
+
+    def _match(self, identifier: str, matches: list[dict[str, Any]]) -> DeliverableMatch:
+        candidates = [d["path"] for d in matches]
+        path = self.project_root / candidates[0] if len(candidates) == 1 else None
+        return DeliverableMatch(identifier, path, candidates)
+
+    def resolve(self, identifier: str) -> DeliverableMatch:
+        """Resolve an identifier: a file path, an exact key, or (as a last
+        resort) a unique substring of a deliverable file name."""
+        # Direct path (absolute, relative to cwd, or relative to the project root)
+        for candidate in (Path(identifier), self.project_root / identifier):
+            if candidate.is_file():
+                return DeliverableMatch(identifier, candidate, [str(candidate)])
+
+        matches = self._by_key.get(_normalize_key(identifier))
+        if matches:
+            return self._match(identifier, matches)
+
+        needle = identifier.lower()
+        matches = [d for d in self.deliverables if needle in d["file"].lower()]
+        return self._match(identifier, matches)
+
+    def resolve_all(self, identifiers: list[str]) -> list[DeliverableMatch]:
+        """Resolve several identifiers against the same index."""
+        return [self.resolve(identifier) for identifier in identifiers]
+
+
+_INDEXES: dict[Path, WorkspaceIndex] = {}
+
+
+def get_workspace_index(paths: "PRDKitPaths") -> WorkspaceIndex:
+    """Return the (per-process shared) workspace index for a project."""
+    index = _INDEXES.get(paths.project_root)
+    if index is None:
+        index = WorkspaceIndex(paths)
+        _INDEXES[paths.project_root] = index
+    return index
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""PRD Kit - Single-pass Markdown section parser.
+
+Parses a document once into a tree of sections so that validators and setup
+scripts can answer "is section X present?" or "what is under header Y?"
+without re-scanning the whole document for every question.
+
+Offsets are character offsets into the parsed string; line numbers are
+1-based. Headers inside fenced code blocks are ignored.
+"""
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .trace import span
+
+HEADER_PATTERN = re.compile(r"(#{1,6})[ \t]+(.+?)[ \t]*$")
+FENCE_PATTERN = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+# User stories are "### [USn] Title" headers, or deeper ones
+USER_STORY_PATTERN = re.compile(r"\[US\d+\]")
+USER_STORY_LEVELS = (3, 4, 5, 6)
+
+
+@dataclass
+class Section:
+    """A header and the span of text it owns.
+
+    Attributes:
+        title: Header text without the leading #'s.
+        level: Header level (1-6). The document root has level 0.
+        line: 1-based line number of the header.
+        start: Offset of the header line.
+        body_start: Offset just after the header line.
+        body_end: Offset of the next header of any level (own body only).
+        end: Offset of the next header of the same or higher level
+            (body including subsections).
+        children: Direct subsections.
+    """
+    title: str
+    level: int
+    line: int
+    start: int
+    body_start: int
+    body_end: int
+    end: int
+    children: list["Section"] = field(default_factory=list)
+
+
+@dataclass
+class MarkdownDocument:
+    """A parsed document: the section tree plus a flat list in document order."""
+    content: str
+    root: Section
+    sections: list[Section]
+
+    def body(self, section: Section) -> str:
+        """Text directly under a header, excluding subsections."""
+        return self.content[section.body_start:section.body_end]
+
+    def text(self, section: Section) -> str:
+        """Text under a header, including subsections."""
+        return self.content[section.body_start:section.end]
+
+    def iter_sections(self, levels: tuple[int, ...] | None = None) -> Iterator[Section]:
+        """Iterate sections in document order, optionally filtered by level."""
+        for section in self.sections:
+            if levels is None or section.level in levels:
+                yield section
+
+    def titles(self, levels: tuple[int, ...] | None = None) -> set[str]:
+        """Return the set of header titles, optionally filtered by level."""
+        return {s.title for s in self.iter_sections(levels)}
+
+    def find(
+        self,
+        name: str,
+        levels: tuple[int, ...] | None = None,
+        match: str = "contains",
+    ) -> Section | None:
+        """Find the first section whose title matches a name.
+
+        Args:
+            name: Section name to look for.
+            levels: Header levels to consider (default: all).
+            match: "exact" (case-sensitive), "prefix" or "contains"
+                (both case-insensitive).
+        """
+        needle = name if match == "exact" else name.lower()
+        for section in self.iter_sections(levels):
+            if match == "exact":
+                if section.title == needle:
+                    return section
+            elif match == "prefix":
+                if section.title.lower().startswith(needle):
+                    return section
+            elif needle in section.title.lower():
+                return section
+        return None
+
+    def has_section(
+        self,
+        name: str,
+        levels: tuple[int, ...] | None = None,
+        match: str = "contains",
+    ) -> bool:
+        """Check whether a section matching a name is present."""
+        return self.find(name, levels, match) is not None
+
+    @property
+    def title(self) -> Section | None:
+        """The first level-1 header, if any."""
+        for section in self.root.children:
+            if section.level == 1:
+                return section
+        return None
+
+
+def parse_markdown(content: str) -> MarkdownDocument:
+    """Parse markdown content into a section tree in a single pass."""
+    root = Section(
+        title="", level=0, line=0, start=0, body_start=0,
+        body_end=len(content), end=len(content),
+    )
+    sections: list[Section] = []
+    stack: list[Section] = [root]
+    previous: Section = root
+
+    fence: str | None = None
+    offset = 0
+    for line_no, line in enumerate(content.splitlines(keepends=True), start=1):
+        line_start = offset
+        offset += len(line)
+        stripped = line.rstrip("\r\n")
+
+        fence_match = FENCE_PATTERN.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and \
+                    not stripped.strip()[len(marker):].strip():
+                fence = None
+            continue
+        if fence is not None or not stripped.startswith("#"):
+            continue
+
+        header = HEADER_PATTERN.match(stripped)
+        if not header:
+            continue
+
+        level = len(header.group(1))
+        previous.body_end = line_start
+        while stack[-1].level >= level:
+            stack.pop().end = line_start
+
+        section = Section(
+            title=header.group(2).strip(),
+            level=level,
+            line=line_no,
+            start=line_start,
+            body_start=offset,
+            body_end=len(content),
+            end=len(content),
+        )
+        stack[-1].children.append(section)
+        stack.append(section)
+        sections.append(section)
+        previous = section
+
+    return MarkdownDocument(content=content, root=root, sections=sections)
+
+
+def parse_markdown_file(path: Path) -> MarkdownDocument:
+    """Read and parse a markdown file."""
+    with span("read", "io", path=str(path)):
+        content = path.read_text()
+    return parse_markdown(content)
+
+
+def user_story_sections(document: MarkdownDocument) -> list[Section]:
+    """Return the [USn] user story sections of a document, in order."""
+    return [
+        s for s in document.iter_sections(levels=USER_STORY_LEVELS)
+        if USER_STORY_PATTERN.match(s.title)
+    ]
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""PRD Kit - Per-phase context packs.
+
+With --pack, a setup script adds the contents of every file its phase needs
+(PRD, research notes, constitutions, template, command file, ...) to its
+JSON output, so an agent gets everything in one call instead of reading
+each path separately:
+
+    "PACK": {
+      "max_file_bytes": 65536,
+      "total_bytes": 18234,
+      "cached": false,
+      "files": {
+        "PRD_FILE": {
+          "path": "prds/feature/PRD.md",
+          "bytes": 12034,
+          "sha256": "...",
+          "truncated": false,
+          "content": "# PRD: ..."
+        }
+      }
+    }
+
+Files larger than --max-file-bytes are cut at the last line break before the
+cap and end with a truncation marker naming the file to read for the rest;
+sha256 is always the hash of the whole file. Packs are cached in
+.prd-kit/cache/ keyed by the path, size and mtime of every input, so an
+unchanged phase is answered without reading the files again.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+from .cache import ResultCache
+from .trace import span
+
+PACK_VERSION = "1"
+DEFAULT_MAX_FILE_BYTES = 64 * 1024
+
+# Output keys naming files the phase reads (VALIDATOR is run, not read)
+FILE_KEY_SUFFIXES = ("_FILE", "_TEMPLATE", "_MAP", "CONSTITUTION")
+
+TRUNCATION_MARKER = (
+    "\n[... truncated: {shown} of {total} bytes shown; read {path} for the rest ...]\n"
+)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for a strictly positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {number}")
+    return number
+
+
+def add_pack_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --pack and --max-file-bytes to a setup script's parser."""
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Output as JSON including the contents of every file this phase needs",
+    )
+    parser.add_argument(
+        "--max-file-bytes",
+        type=positive_int,
+        default=DEFAULT_MAX_FILE_BYTES,
+        help=f"Per-file size cap for --pack (default: {DEFAULT_MAX_FILE_BYTES})",
+    )
+
+
+def pack_entry(path: Path, max_file_bytes: int) -> dict[str, Any]:
+    """Read one file into a pack entry, truncating it to max_file_bytes."""
+    import hashlib
+
+    with span("read", "io", path=str(path)):
+        data = path.read_bytes()
+
+    entry = {
+        "path": str(path),
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "truncated": len(data) > max_file_bytes,
+    }
+    if entry["truncated"]:
+        # Cut after the last full line (a UTF-8 sequence split by a hard cut is dropped)
+        cut = data.rfind(b"\n", 0, max_file_bytes) + 1 or max_file_bytes
+        content = data[:cut].decode("utf-8", errors="ignore")
+        content += TRUNCATION_MARKER.format(shown=cut, total=len(data), path=path)
+    else:
+        content = data.decode("utf-8", errors="replace")
+    entry["content"] = content
+    return entry
+
+
+def build_pack(
+    files: dict[str, Path], max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+) -> dict[str, Any]:
+    """Pack the given files (label -> path), reusing a cached pack when no
+    input changed since it was built.
+
+    Missing files (and directories) are skipped.
+
+    Raises:
+        ValueError: If max_file_bytes is not positive
+    """
+    if max_file_bytes <= 0:
+        raise ValueError(f"max_file_bytes must be greater than 0, got {max_file_bytes}")
+    stats = {}
+    for label, path in files.items():
+        try:
+            stats[label] = path.stat()
+        except OSError:
+            continue
+
+    cache = ResultCache.for_path(Path.cwd())
+    key = ResultCache.make_key(
+        "pack",
+        PACK_VERSION,
+        [("max_file_bytes", str(max_file_bytes))] + [
+            (label, f"{files[label]}:{st.st_size}:{st.st_mtime_ns}")
+            for label, st in stats.items()
+        ],
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+
+    entries = {}
+    for label in stats:
+        try:
+            entries[label] = pack_entry(files[label], max_file_bytes)
+        except OSError:
+            continue
+
+    pack = {
+        "max_file_bytes": max_file_bytes,
+        "total_bytes": sum(len(e["content"].encode()) for e in entries.values()),
+        "cached": False,
+        "files": entries,
+    }
+    cache.put(key, pack)
+    return pack
+
+
+def phase_files(
+    output: dict[str, Any], extra_files: dict[str, Path] | None = None
+) -> dict[str, Path]:
+    """Return the files a setup script's output points at, by output key.
+
+    Every file-valued key (PRD_FILE, PRD_TEMPLATE, DELIVERABLES_MAP,
+    CONSTITUTION, ...) is included, plus any extra_files.
+    """
+    files = {
+        key: Path(value)
+        for key, value in output.items()
+        if key.endswith(FILE_KEY_SUFFIXES) and isinstance(value, str) and value
+    }
+    files.update(extra_files or {})
+    return files
+
+
+def pack_output(
+    output: dict[str, Any],
+    max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+    extra_files: dict[str, Path] | None = None,
+) -> dict[str, Any]:
+    """Add a PACK of every file a setup script's output points at (see
+    phase_files)."""
+    return {**output, "PACK": build_pack(phase_files(output, extra_files), max_file_bytes)}
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""PRD Kit - Prefiltered multi-rule scanner.
+
+Runs a set of named content rules over a document and returns every rule's
+hits with line numbers. Each rule is compiled separately (one alternation of
+all rules would retry every alternative at every offset, which is far
+slower than separate passes), and two cheap shortcuts skip most of the
+regex work:
+
+- literal prefilter: a rule may name a literal every match contains; when
+  the document does not contain it (a single C-level substring search) the
+  rule's regex never runs
+- presence rules (first_only) stop at the first hit, for checks that only
+  ask "is it there?"; a rule with no pattern is a plain substring search
+
+Usage:
+    scanner = Scanner({
+        "needs_detail": Rule(r"\\[NEEDS_DETAIL:\\s*([^\\]]+)\\]", literal="[NEEDS_DETAIL:"),
+        "source_prd": Rule(literal="Source PRD", first_only=True),
+        "placeholder": r"(?i:\\[(?:TODO|TBD)[^\\]]*\\])",
+    })
+    hits = scanner.scan(content)
+    hits["needs_detail"]  # -> [Hit(line=3, start=42, text="[NEEDS_DETAIL: x]"), ...]
+"""
+
+import re
+from typing import NamedTuple
+
+from .trace import span
+
+
+class Hit(NamedTuple):
+    """A single rule match."""
+    line: int
+    start: int
+    text: str
+
+
+class Rule(NamedTuple):
+    """A named scanner rule.
+
+    Attributes:
+        pattern: Regex to match; None matches literal as plain text.
+        literal: Text every match contains, checked case-sensitively before
+            the regex runs (use a case-neutral literal for (?i:...) rules).
+        first_only: Report at most the first hit (presence checks).
+    """
+    pattern: str | None = None
+    literal: str | None = None
+    first_only: bool = False
+
+
+class Scanner:
+    """A set of named rules, each matched with its own compiled pattern."""
+
+    def __init__(self, rules: dict[str, str | Rule], flags: int = re.MULTILINE):
+        """Compile the rules.
+
+        Args:
+            rules: Mapping of rule name -> regex pattern or Rule.
+            flags: Flags applied to every pattern.
+        """
+        self.rule_names = list(rules)
+        self._rules: list[tuple[str, Rule, re.Pattern[str] | None]] = []
+        for name, rule in rules.items():
+            if isinstance(rule, str):
+                rule = Rule(rule)
+            if rule.pattern is None and rule.literal is None:
+                raise ValueError(f"Rule {name!r} needs a pattern or a literal")
+            regex = re.compile(rule.pattern, flags) if rule.pattern is not None else None
+            self._rules.append((name, rule, regex))
+
+    @staticmethod
+    def _find(content: str, rule: Rule, regex: re.Pattern[str] | None) -> list[tuple[int, str]]:
+        """Return (offset, text) of a rule's matches."""
+        if rule.literal is not None and rule.literal not in content:
+            return []
+        if regex is None:
+            literal = rule.literal or ""
+            matches = []
+            start = content.find(literal)
+            while start != -1:
+                matches.append((start, literal))
+                if rule.first_only:
+                    break
+                start = content.find(literal, start + len(literal))
+            return matches
+        if rule.first_only:
+            match = regex.search(content)
+            return [(match.start(), match.group())] if match else []
+        return [(match.start(), match.group()) for match in regex.finditer(content)]
+
+    def scan(self, content: str) -> dict[str, list[Hit]]:
+        """Scan content and return {rule name: [hits]} for every rule."""
+        found: list[tuple[int, str, str]] = []  # (offset, rule name, text)
+        with span("scan rules", "rule", rules=len(self._rules), size=len(content)) as s:
+            for name, rule, regex in self._rules:
+                matches = self._find(content, rule, regex)
+                found.extend((start, name, text) for start, text in matches)
+
+            # Line numbers in one forward pass over all hits
+            hits: dict[str, list[Hit]] = {name: [] for name in self.rule_names}
+            line = 1
+            last = 0
+            for start, name, text in sorted(found):
+                line += content.count("\n", last, start)
+                last = start
+                hits[name].append(Hit(line, start, text))
+            if s is not None:
+                s.set(hits={name: len(rule_hits) for name, rule_hits in hits.items() if rule_hits})
+        return hits
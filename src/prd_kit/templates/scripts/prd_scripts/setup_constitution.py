@@ -14,6 +14,9 @@ from .common import (
     log_success,
     log_warn,
 )
+from .markdown import parse_markdown
+from .pack import add_pack_arguments, pack_output, phase_files
+from .tokens import add_token_arguments, token_report
 
 
 def check_constitution_completeness(constitution_path: Path) -> tuple[int, int, str]:
@@ -37,15 +40,17 @@ def check_constitution_completeness(constitution_path: Path) -> tuple[int, int,
         placeholder_count = len(placeholders)
         
         # Check for key sections being filled
-        if re.search(r'^### I\.', content, re.MULTILINE) and \
+        document = parse_markdown(content)
+        
+        if document.has_section("I.", levels=(3,), match="prefix") and \
            '[PRINCIPLE_1_NAME]' not in content:
             filled_count += 1
         
-        if re.search(r'^### Vision', content, re.MULTILINE) and \
+        if document.has_section("Vision", levels=(3,), match="prefix") and \
            '[VISION_STATEMENT]' not in content:
             filled_count += 1
         
-        if re.search(r'^### Primary Persona', content, re.MULTILINE) and \
+        if document.has_section("Primary Persona", levels=(3,), match="prefix") and \
            '[PERSONA_1_NAME]' not in content:
             filled_count += 1
         
@@ -64,6 +69,8 @@ def main(args: list[str] | None = None) -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="PRD Kit Constitution Setup")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     parsed = parser.parse_args(args)
     
     # Check initialization
@@ -84,7 +91,7 @@ def main(args: list[str] | None = None) -> int:
     placeholder_count, filled_count, status = check_constitution_completeness(constitution)
     
     # Output
-    if parsed.json:
+    if parsed.json or parsed.pack:
         output = {
             "CONSTITUTION": str(constitution),
             "CONSTITUTION_TEMPLATE": str(constitution_template),
@@ -92,6 +99,9 @@ def main(args: list[str] | None = None) -> int:
             "PLACEHOLDER_COUNT": placeholder_count,
             "STATUS": status,
         }
+        output["TOKENS"] = token_report(phase_files(output), parsed.token_budget)
+        if parsed.pack:
+            output = pack_output(output, parsed.max_file_bytes)
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Constitution file: {constitution}")
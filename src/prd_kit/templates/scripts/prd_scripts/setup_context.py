@@ -12,10 +12,13 @@ from pathlib import Path
 from .common import (
     PRDKitPaths,
     check_prd_kit_initialized,
+    detect_current_spec,
     log_error,
     log_info,
     log_success,
 )
+from .pack import add_pack_arguments, pack_output, phase_files
+from .tokens import add_token_arguments, token_report
 
 
 def find_spec_dir(paths: PRDKitPaths, identifier: str) -> Path | None:
@@ -69,18 +72,34 @@ def find_spec_dir(paths: PRDKitPaths, identifier: str) -> Path | None:
 def main(args: list[str] | None = None) -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="PRD Kit Context Setup")
-    parser.add_argument("--spec", required=True, help="Spec directory identifier")
+    parser.add_argument(
+        "--spec",
+        help="Spec directory identifier (default: detected from the feat/NNN-name branch)",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     parsed = parser.parse_args(args)
     
     # Check initialization
     paths = check_prd_kit_initialized()
     
+    # Default to the spec of the checked-out feature branch
+    if parsed.spec is None:
+        parsed.spec = detect_current_spec(paths)
+        if parsed.spec is None:
+            message = "No --spec given and the current branch is not a feat/NNN-name branch"
+            if parsed.json or parsed.pack:
+                print(json.dumps({"ERROR": message}, indent=2))
+            else:
+                log_error(message)
+            return 1
+    
     # Find spec directory
     spec_dir = find_spec_dir(paths, parsed.spec)
     
     if spec_dir is None:
-        if parsed.json:
+        if parsed.json or parsed.pack:
             print(json.dumps({
                 "ERROR": f"Spec directory not found: {parsed.spec}",
                 "SPECS_AVAILABLE": [
@@ -104,7 +123,7 @@ def main(args: list[str] | None = None) -> int:
     has_tech_constitution = tech_constitution.is_file()
     
     # Output
-    if parsed.json:
+    if parsed.json or parsed.pack:
         output = {
             "SPEC_DIR": str(spec_dir),
             "SPEC_NAME": spec_dir.name,
@@ -116,6 +135,9 @@ def main(args: list[str] | None = None) -> int:
             "HAS_CONTEXT": has_context,
             "STATUS": "ready" if has_deliverable else "missing_deliverable",
         }
+        output["TOKENS"] = token_report(phase_files(output), parsed.token_budget)
+        if parsed.pack:
+            output = pack_output(output, parsed.max_file_bytes)
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Spec: {spec_dir.name}")
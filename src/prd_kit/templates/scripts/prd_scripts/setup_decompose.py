@@ -20,6 +20,8 @@ from .common import (
     log_success,
     log_warn,
 )
+from .pack import add_pack_arguments, pack_output, phase_files
+from .tokens import add_token_arguments, token_report
 
 
 def main(args: list[str] | None = None) -> int:
@@ -27,6 +29,8 @@ def main(args: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="PRD Kit Decompose Setup")
     parser.add_argument("--feature", required=True, help="Feature name")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     parsed = parser.parse_args(args)
     
     feature_name = parsed.feature
@@ -72,7 +76,7 @@ def main(args: list[str] | None = None) -> int:
     validator = paths.validators_dir / "check-deliverables.py"
     
     # Output
-    if parsed.json:
+    if parsed.json or parsed.pack:
         output = {
             "FEATURE_NAME": feature_name,
             "FEATURE_DIR": str(feature_dir),
@@ -85,6 +89,9 @@ def main(args: list[str] | None = None) -> int:
             "VALIDATOR": str(validator),
             "STATUS": status,
         }
+        output["TOKENS"] = token_report(phase_files(output), parsed.token_budget)
+        if parsed.pack:
+            output = pack_output(output, parsed.max_file_bytes)
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Feature: {feature_name}")
@@ -19,6 +19,9 @@ from .common import (
     log_success,
     log_warn,
 )
+from .pack import add_pack_arguments, pack_output, phase_files
+from .tokens import add_token_arguments, token_report
+from .trace import span
 
 
 def main(args: list[str] | None = None) -> int:
@@ -26,6 +29,8 @@ def main(args: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="PRD Kit Generate Deliverables Setup")
     parser.add_argument("--feature", required=True, help="Feature name")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     parsed = parser.parse_args(args)
     
     feature_name = parsed.feature
@@ -55,7 +60,8 @@ def main(args: list[str] | None = None) -> int:
     # List existing deliverables
     existing_deliverables = []
     if deliverables_dir.is_dir():
-        existing_deliverables = [f.name for f in deliverables_dir.glob("deliverable-*.md")]
+        with span("glob deliverable-*.md", "scan", path=str(deliverables_dir)):
+            existing_deliverables = [f.name for f in deliverables_dir.glob("deliverable-*.md")]
     
     existing_deliverables_str = ",".join(existing_deliverables)
     
@@ -73,7 +79,7 @@ def main(args: list[str] | None = None) -> int:
     validator = paths.validators_dir / "check-deliverables.py"
     
     # Output
-    if parsed.json:
+    if parsed.json or parsed.pack:
         output = {
             "FEATURE_NAME": feature_name,
             "FEATURE_DIR": str(feature_dir),
@@ -89,6 +95,9 @@ def main(args: list[str] | None = None) -> int:
             "TEMPLATE_REQUIRED": "MUST read and follow deliverable-template.md structure",
             "VALIDATION_REQUIRED": "MUST run validator and fix all errors before completing",
         }
+        output["TOKENS"] = token_report(phase_files(output), parsed.token_budget)
+        if parsed.pack:
+            output = pack_output(output, parsed.max_file_bytes)
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Feature: {feature_name}")
@@ -15,6 +15,8 @@ from .common import (
     log_info,
     log_success,
 )
+from .pack import add_pack_arguments, pack_output, phase_files
+from .tokens import add_token_arguments, token_report
 
 
 def main(args: list[str] | None = None) -> int:
@@ -22,6 +24,8 @@ def main(args: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="PRD Kit Draft Setup")
     parser.add_argument("--feature", required=True, help="Feature name")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     parsed = parser.parse_args(args)
     
     feature_name = parsed.feature
@@ -62,7 +66,7 @@ def main(args: list[str] | None = None) -> int:
     validator = paths.validators_dir / "check-completeness.py"
     
     # Output
-    if parsed.json:
+    if parsed.json or parsed.pack:
         output = {
             "FEATURE_NAME": feature_name,
             "FEATURE_DIR": str(feature_dir),
@@ -74,6 +78,9 @@ def main(args: list[str] | None = None) -> int:
             "VALIDATOR": str(validator),
             "STATUS": status,
         }
+        output["TOKENS"] = token_report(phase_files(output), parsed.token_budget)
+        if parsed.pack:
+            output = pack_output(output, parsed.max_file_bytes)
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Feature: {feature_name}")
@@ -6,6 +6,7 @@ Supports multiple deliverables - creates one branch/directory for all.
 """
 
 import argparse
+import hashlib
 import json
 import re
 import subprocess
@@ -13,6 +14,7 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from .allocator import reserve_feature_numbers, scan_highest_feature_number
 from .common import (
     Colors,
     PRDKitPaths,
@@ -21,49 +23,30 @@ from .common import (
     log_info,
     log_success,
 )
+from .index import get_workspace_index
+from .markdown import (
+    MarkdownDocument,
+    parse_markdown,
+    parse_markdown_file,
+    user_story_sections,
+)
+from .pack import add_pack_arguments, pack_output
+from .tokens import add_token_arguments, token_report
+from .trace import span
 
 
 def get_next_feature_number(paths: PRDKitPaths) -> int:
-    """Determine the next feature number from all sources.
+    """Determine the next feature number from all sources, without reserving it.
     
     Checks:
     - specs/ directory
     - Remote branches (feat/XXX-*)
     - Local branches (feat/XXX-*)
     
-    Returns the highest number found + 1.
+    Returns the highest number found + 1. Use reserve_feature_numbers() to
+    actually claim a number (safe against parallel runs).
     """
-    highest = 0
-    
-    # Check specs directory
-    specs_dir = paths.project_root / "specs"
-    if specs_dir.is_dir():
-        for spec in specs_dir.iterdir():
-            if spec.is_dir():
-                match = re.match(r"^(\d+)-", spec.name)
-                if match:
-                    num = int(match.group(1))
-                    highest = max(highest, num)
-    
-    # Check git branches
-    try:
-        result = subprocess.run(
-            ["git", "branch", "-a", "--format=%(refname:short)"],
-            capture_output=True,
-            text=True,
-            cwd=paths.project_root,
-        )
-        if result.returncode == 0:
-            for branch in result.stdout.strip().split("\n"):
-                # Match feat/001-name or origin/feat/001-name
-                match = re.search(r"feat/(\d+)-", branch)
-                if match:
-                    num = int(match.group(1))
-                    highest = max(highest, num)
-    except Exception:
-        pass  # Git not available
-    
-    return highest + 1
+    return scan_highest_feature_number(paths.project_root) + 1
 
 
 def slugify(text: str) -> str:
@@ -84,70 +67,34 @@ def find_deliverable(paths: PRDKitPaths, identifier: str) -> Path | None:
             - Full path to deliverable file
             - Deliverable ID (e.g., "001", "002")
             - Deliverable name
+            - PRD-qualified ID or name (e.g., "checkout/001")
             
     Returns:
-        Path to deliverable file, or None if not found.
+        Path to deliverable file, or None if not found or ambiguous.
     """
-    # Check if it's a direct path
-    if Path(identifier).is_file():
-        return Path(identifier)
-    
-    # Check if it's an absolute path
-    abs_path = paths.project_root / identifier
-    if abs_path.is_file():
-        return abs_path
-    
-    # Search in all prds/*/deliverables/ directories
-    for prd_dir in paths.prds_dir.iterdir():
-        if not prd_dir.is_dir():
-            continue
-        deliverables_dir = prd_dir / "deliverables"
-        if not deliverables_dir.is_dir():
-            continue
-        
-        # Try to match by ID
-        for f in deliverables_dir.glob("deliverable-*.md"):
-            # Match deliverable-001-name.md
-            match = re.match(r"deliverable-(\d+)-(.+)\.md", f.name)
-            if match:
-                file_id = match.group(1)
-                if identifier == file_id or identifier == f"0{file_id}" or identifier.zfill(3) == file_id.zfill(3):
-                    return f
-            
-            # Match just the filename
-            if identifier.lower() in f.name.lower():
-                return f
-    
-    return None
+    return get_workspace_index(paths).deliverable_lookup().resolve(identifier).path
 
 
-def list_available_deliverables(paths: PRDKitPaths) -> list[dict]:
+def list_available_deliverables(paths: PRDKitPaths) -> list[dict[str, Any]]:
     """List all available deliverables."""
-    deliverables = []
-    
-    for prd_dir in paths.prds_dir.iterdir():
-        if not prd_dir.is_dir():
-            continue
-        deliverables_dir = prd_dir / "deliverables"
-        if not deliverables_dir.is_dir():
-            continue
-        
-        for f in deliverables_dir.glob("deliverable-*.md"):
-            match = re.match(r"deliverable-(\d+)-(.+)\.md", f.name)
-            if match:
-                deliverables.append({
-                    "id": match.group(1),
-                    "name": match.group(2),
-                    "path": str(f.relative_to(paths.project_root)),
-                    "prd": prd_dir.name,
-                })
-    
-    return deliverables
+    return [
+        {
+            "id": d["id"],
+            "name": d["name"],
+            "path": d["path"],
+            "prd": d["prd"],
+        }
+        for d in get_workspace_index(paths).deliverables()
+        if d["id"] is not None
+    ]
 
 
-def extract_deliverable_info(deliverable_path: Path) -> dict:
+def extract_deliverable_info(
+    deliverable_path: Path, document: MarkdownDocument | None = None
+) -> dict[str, Any]:
     """Extract name and priority from deliverable file."""
-    content = deliverable_path.read_text()
+    if document is None:
+        document = parse_markdown_file(deliverable_path)
     
     info = {
         "name": "",
@@ -162,12 +109,21 @@ def extract_deliverable_info(deliverable_path: Path) -> dict:
         info["id"] = match.group(1)
         info["name"] = match.group(2)
     
-    # Extract from content
-    lines = content.split("\n")
+    # Extract from the title header
+    title = document.title
+    if title is not None and title.title.startswith("Deliverable:"):
+        info["name"] = title.title.replace("Deliverable:", "").strip()
+    
+    # Extract from the metadata block (before the first ## section, first 20 lines)
+    metadata_end = len(document.content)
+    for section in document.iter_sections(levels=(2,)):
+        metadata_end = section.start
+        break
+    lines = document.content[:metadata_end].split("\n")
     for line in lines[:20]:  # Check first 20 lines
-        if line.startswith("# Deliverable:"):
-            info["name"] = line.replace("# Deliverable:", "").strip()
-        elif "Deliverable ID" in line:
+        if line.startswith("#"):
+            continue
+        if "Deliverable ID" in line:
             match = re.search(r"(\d+)", line)
             if match:
                 info["id"] = match.group(1)
@@ -183,21 +139,49 @@ def extract_deliverable_info(deliverable_path: Path) -> dict:
     return info
 
 
+def count_user_stories(document: MarkdownDocument) -> int:
+    """Count [USn] user story sections (### or deeper) in a parsed document."""
+    return len(user_story_sections(document))
+
+
+def load_deliverable(deliverable_path: Path) -> dict[str, Any]:
+    """Read a deliverable once and extract everything init-feature needs.
+    
+    Returns the extract_deliverable_info() fields plus:
+        - path: the deliverable path
+        - user_stories: number of [USn] stories
+        - sha256: content hash
+        - content: raw bytes, reused when copying into specs/
+    """
+    with span("read deliverable", "io", path=str(deliverable_path)):
+        data = deliverable_path.read_bytes()
+    # Invalid bytes only garble the text parsed for metadata; content stays raw
+    document = parse_markdown(data.decode("utf-8", errors="replace"))
+    
+    info = extract_deliverable_info(deliverable_path, document)
+    info["path"] = deliverable_path
+    info["user_stories"] = count_user_stories(document)
+    info["sha256"] = hashlib.sha256(data).hexdigest()
+    info["content"] = data
+    return info
+
+
 def create_branch(paths: PRDKitPaths, branch_name: str) -> bool:
     """Create a new git branch."""
     try:
-        result = subprocess.run(
-            ["git", "checkout", "-b", branch_name],
-            capture_output=True,
-            text=True,
-            cwd=paths.project_root,
-        )
+        with span("git checkout -b", "subprocess", branch=branch_name):
+            result = subprocess.run(
+                ["git", "checkout", "-b", branch_name],
+                capture_output=True,
+                text=True,
+                cwd=paths.project_root,
+            )
         return result.returncode == 0
     except Exception:
         return False
 
 
-def generate_combined_name(deliverable_infos: list[dict]) -> str:
+def generate_combined_name(deliverable_infos: list[dict[str, Any]]) -> str:
     """Generate a combined name from multiple deliverables.
     
     Examples:
@@ -223,7 +207,8 @@ def generate_combined_name(deliverable_infos: list[dict]) -> str:
     return slugify(combined)[:40]
 
 
-def main():
+def main(args: list[str] | None = None) -> int:
+    """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Initialize feature branch and spec directory"
     )
@@ -238,27 +223,40 @@ def main():
         action="store_true",
         help="Output results as JSON",
     )
+    add_pack_arguments(parser)
+    add_token_arguments(parser)
     
-    args = parser.parse_args()
+    parsed = parser.parse_args(args)
     
     try:
         paths = check_prd_kit_initialized()
         
-        # Find all deliverables
-        deliverable_paths = []
-        not_found = []
+        # Resolve all deliverables against one index
+        matches = get_workspace_index(paths).deliverable_lookup().resolve_all(parsed.deliverable)
+        deliverable_paths = [m.path for m in matches if m.path is not None]
+        not_found = [m.identifier for m in matches if not m.candidates]
+        ambiguous = {m.identifier: m.candidates for m in matches if m.ambiguous}
         
-        for identifier in args.deliverable:
-            deliverable_path = find_deliverable(paths, identifier)
-            if deliverable_path is None:
-                not_found.append(identifier)
+        # Handle ambiguous deliverables (never silently pick one)
+        if ambiguous:
+            if parsed.json or parsed.pack:
+                print(json.dumps({
+                    "STATUS": "error",
+                    "ERROR": f"Ambiguous deliverables: {', '.join(ambiguous)}",
+                    "AMBIGUOUS": ambiguous,
+                }))
             else:
-                deliverable_paths.append(deliverable_path)
+                log_error(f"Ambiguous deliverables: {', '.join(ambiguous)}")
+                for identifier, candidates in ambiguous.items():
+                    log_info(f"'{identifier}' matches (use prd/ID to disambiguate):")
+                    for candidate in candidates:
+                        print(f"  - {candidate}")
+            sys.exit(1)
         
         # Handle not found deliverables
         if not_found:
             available = list_available_deliverables(paths)
-            if args.json:
+            if parsed.json or parsed.pack:
                 print(json.dumps({
                     "STATUS": "error",
                     "ERROR": f"Deliverables not found: {', '.join(not_found)}",
@@ -271,15 +269,11 @@ def main():
                     print(f"  - {d['id']}: {d['name']} ({d['path']})")
             sys.exit(1)
         
-        # Extract info from all deliverables
-        deliverable_infos = []
-        for path in deliverable_paths:
-            info = extract_deliverable_info(path)
-            info["path"] = path
-            deliverable_infos.append(info)
+        # Read each deliverable once: metadata, story count, hash and content
+        deliverable_infos = [load_deliverable(path) for path in deliverable_paths]
         
-        # Determine next feature number
-        next_num = get_next_feature_number(paths)
+        # Reserve the next feature number (locked, safe against parallel runs)
+        next_num = reserve_feature_numbers(paths.project_root)[0]
         feature_num = str(next_num).zfill(3)
         
         # Generate combined name
@@ -318,23 +312,22 @@ def main():
 """
         (spec_dir / "README.md").write_text(readme_content)
         
-        # Copy all deliverable references
+        # Copy all deliverable references (from the buffers already read)
         import shutil
         for i, info in enumerate(deliverable_infos):
             if len(deliverable_infos) == 1:
                 dest_name = "deliverable.md"
             else:
                 dest_name = f"deliverable-{info['id']}.md"
-            shutil.copy2(info["path"], spec_dir / dest_name)
+            dest_path = spec_dir / dest_name
+            dest_path.write_bytes(info["content"])
+            shutil.copystat(info["path"], dest_path)
         
         # Create branch
         branch_created = create_branch(paths, branch_name)
         
         # Count total user stories
-        total_us = 0
-        for info in deliverable_infos:
-            content = info["path"].read_text()
-            total_us += len(re.findall(r"###\s*\[US\d+\]", content))
+        total_us = sum(info["user_stories"] for info in deliverable_infos)
         
         # Collect all priorities and dependencies
         priorities = set(info["priority"] for info in deliverable_infos)
@@ -344,7 +337,7 @@ def main():
         unique_deps = sorted(set(all_deps))
         
         # Build result
-        result = {
+        result: dict[str, Any] = {
             "STATUS": "success",
             "FEATURE_NUMBER": feature_num,
             "FEATURE_NAME": spec_dir_name,
@@ -357,6 +350,7 @@ def main():
                     "name": info["name"],
                     "priority": info["priority"],
                     "path": str(info["path"].relative_to(paths.project_root)),
+                    "sha256": info["sha256"],
                 }
                 for info in deliverable_infos
             ],
@@ -374,7 +368,11 @@ def main():
             ],
         }
         
-        if args.json:
+        if parsed.json or parsed.pack:
+            spec_files = {name: spec_dir / name for name in result["FILES_CREATED"]}
+            result["TOKENS"] = token_report(spec_files, parsed.token_budget)
+            if parsed.pack:
+                result = pack_output(result, parsed.max_file_bytes, spec_files)
             print(json.dumps(result, indent=2))
         else:
             print()
@@ -407,7 +405,7 @@ def main():
     except SystemExit:
         raise
     except Exception as e:
-        if args.json:
+        if parsed.json or parsed.pack:
             print(json.dumps({
                 "STATUS": "error",
                 "ERROR": str(e),
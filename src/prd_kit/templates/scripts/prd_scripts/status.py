@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""PRD Kit - Feature status detection with bounded reads.
+
+Checks run from cheapest to most expensive and stop at the first one that
+decides the status:
+
+1. deliverables/deliverables-map.json (stat), then the deliverable files it
+   lists (stat each until one exists); the deliverables directory is only
+   listed when there is no usable map
+2. PRD.md: only the metadata block at the top is read, through a small
+   bounded buffer
+3. research.md: streamed in chunks, stopping at the first [NEEDS_DETAIL:
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+from .trace import span
+
+# The PRD metadata block (title + **Status** line) sits in the first few lines
+PRD_HEADER_BYTES = 4096
+PRD_APPROVED_PATTERN = re.compile(r"Status.*Approved")
+
+NEEDS_DETAIL_MARKER = "[NEEDS_DETAIL:"
+SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def read_header(path: Path, limit: int = PRD_HEADER_BYTES) -> str:
+    """Read the metadata block of a markdown file: at most limit bytes, cut at
+    the first `## ` section heading."""
+    with span("read header", "io", path=str(path)), open(path, "rb") as f:
+        head = f.read(limit).decode("utf-8", errors="ignore")
+    section = re.search(r"^## ", head, re.MULTILINE)
+    return head[:section.start()] if section else head
+
+
+def prd_is_approved(path: Path) -> bool:
+    """Check the PRD metadata block for an Approved status."""
+    try:
+        return PRD_APPROVED_PATTERN.search(read_header(path)) is not None
+    except OSError:
+        return False
+
+
+def file_contains(path: Path, marker: str, chunk_size: int = SCAN_CHUNK_SIZE) -> bool:
+    """Stream a file looking for marker, stopping at the first occurrence."""
+    needle = marker.encode()
+    overlap = len(needle) - 1
+    tail = b""
+    try:
+        with span("scan file", "io", path=str(path), marker=marker), open(path, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return False
+                window = tail + chunk
+                if needle in window:
+                    return True
+                tail = window[-overlap:] if overlap else b""
+    except OSError:
+        return False
+
+
+def research_needs_detail(path: Path) -> bool:
+    """Check whether a research file still has open [NEEDS_DETAIL] tags."""
+    return file_contains(path, NEEDS_DETAIL_MARKER)
+
+
+def _has_deliverable_files(deliverables_dir: Path, map_file: Path) -> bool:
+    """Check for generated deliverable files, preferring the names in the map."""
+    try:
+        data = json.loads(map_file.read_text(encoding="utf-8"))
+        listed: list[str] = [
+            d["file"] for d in data.get("deliverables", [])
+            if isinstance(d, dict) and d.get("file")
+        ]
+    except (OSError, ValueError, AttributeError):
+        listed = []
+
+    if any((deliverables_dir / name).is_file() for name in listed):
+        return True
+
+    # No usable map entries (or files named differently): list the directory
+    try:
+        with (
+            span("scandir", "scan", path=str(deliverables_dir)),
+            os.scandir(deliverables_dir) as entries,
+        ):
+            return any(
+                e.name.startswith("deliverable-") and e.name.endswith(".md") and e.is_file()
+                for e in entries
+            )
+    except OSError:
+        return False
+
+
+def detect_feature_status(feature_dir: Path) -> str:
+    """Detect the status of the feature in feature_dir.
+
+    Returns one of:
+        - not_started
+        - discovery_in_progress
+        - discovery_complete
+        - drafted
+        - approved
+        - decomposed
+        - deliverables_generated
+    """
+    if not feature_dir.is_dir():
+        return "not_started"
+
+    deliverables_dir = feature_dir / "deliverables"
+    map_file = deliverables_dir / "deliverables-map.json"
+    if map_file.is_file():
+        if _has_deliverable_files(deliverables_dir, map_file):
+            return "deliverables_generated"
+        return "decomposed"
+    if deliverables_dir.is_dir() and _has_deliverable_files(deliverables_dir, map_file):
+        return "deliverables_generated"
+
+    prd_file = feature_dir / "PRD.md"
+    if prd_file.is_file():
+        return "approved" if prd_is_approved(prd_file) else "drafted"
+
+    research_file = feature_dir / "research.md"
+    if research_file.is_file():
+        if research_needs_detail(research_file):
+            return "discovery_in_progress"
+        return "discovery_complete"
+
+    return "not_started"
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""PRD Kit - Offline token estimates and section-boundary chunking.
+
+Setup scripts report how many tokens each input of a phase (PRD, research
+notes, constitutions, command file, ...) and the phase as a whole will take
+in an agent's context window, so oversized bundles are caught before an
+agent loads them.
+
+estimate_tokens() approximates byte-pair tokenizers without a vocabulary:
+the text is split into the same kind of pieces BPE pre-tokenizers produce
+(letter runs, digit runs, punctuation runs, whitespace) and each piece is
+costed by its length. It errs on the high side for long English words and
+is meant for budgeting a context window, not exact counts; results are
+memoized per text.
+
+When a phase does not fit its budget, the largest documents are split by
+chunk_markdown() at section boundaries (then paragraphs, then lines) into
+chunks that do, reported as line ranges an agent can load one at a time.
+
+Per-file estimates are kept in .prd-kit/cache/token-counts.json keyed by
+path, size and mtime, so a setup script only reads and estimates the files
+that changed since its last run (and the markdown parser is only loaded
+when a document has to be chunked).
+"""
+
+import argparse
+import json
+import os
+import re
+import stat
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .cache import find_cache_dir
+from .trace import span
+
+if TYPE_CHECKING:
+    from .markdown import MarkdownDocument, Section
+
+DEFAULT_TOKEN_BUDGET = 64_000
+
+# A document is never chunked below this many tokens per chunk
+MIN_CHUNK_TOKENS = 1_000
+
+# Letter runs, digit runs, whitespace runs, other symbol runs
+PIECE_PATTERN = re.compile(r"[^\W\d_]+|\d+|\s+|[^\w\s]+|_+")
+
+# Bump whenever estimate_tokens() changes so cached counts are recomputed
+TOKENS_VERSION = "1"
+TOKEN_CACHE_FILE = "token-counts.json"
+
+# Files remembered in the token cache (least recently estimated dropped first)
+MAX_CACHED_FILES = 1000
+
+# Average characters per token for each kind of piece
+LETTERS_PER_TOKEN = 6
+DIGITS_PER_TOKEN = 3
+SYMBOLS_PER_TOKEN = 2
+
+
+class Chunk(NamedTuple):
+    """A run of whole sections (or paragraphs) that fits a token budget."""
+    start_line: int  # 1-based, inclusive
+    end_line: int    # 1-based, inclusive
+    tokens: int
+    sections: list[str]  # Headers starting inside the chunk
+
+
+def add_token_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --token-budget to a setup script's parser."""
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=DEFAULT_TOKEN_BUDGET,
+        help=f"Context budget for this phase's inputs, in tokens (default: {DEFAULT_TOKEN_BUDGET})",
+    )
+
+
+@lru_cache(maxsize=512)
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens a BPE tokenizer produces for text."""
+    tokens = 0
+    for piece in PIECE_PATTERN.findall(text):
+        first = piece[0]
+        if first.isspace():
+            # A single space merges into the next word; line breaks do not
+            tokens += piece.count("\n") or int(len(piece) > 1)
+        elif first.isdigit():
+            tokens += -(-len(piece) // DIGITS_PER_TOKEN)
+        elif first.isalpha():
+            if piece.isascii():
+                tokens += -(-len(piece) // LETTERS_PER_TOKEN)
+            else:
+                # About one token per CJK character (three UTF-8 bytes)
+                tokens += -(-len(piece.encode()) // 3)
+        else:
+            tokens += -(-len(piece) // SYMBOLS_PER_TOKEN)
+    return tokens
+
+
+def _split_lines(content: str, start: int, end: int, budget: int) -> list[tuple[int, int]]:
+    """Split content[start:end] at blank lines, then at line breaks."""
+    if start >= end:
+        return []
+    if estimate_tokens(content[start:end]) <= budget:
+        return [(start, end)]
+
+    pieces = []
+    for separator in ("\n\n", "\n"):
+        cuts = [start]
+        position = content.find(separator, start, end)
+        while position != -1:
+            cuts.append(position + len(separator))
+            position = content.find(separator, position + len(separator), end)
+        if cuts[-1] != end:
+            cuts.append(end)
+        if len(cuts) > 2:
+            break
+    else:
+        # A single line longer than the budget stays whole
+        return [(start, end)]
+
+    for piece_start, piece_end in zip(cuts, cuts[1:]):
+        if separator == "\n\n":
+            pieces.extend(_split_lines(content, piece_start, piece_end, budget))
+        else:
+            pieces.append((piece_start, piece_end))
+    return pieces
+
+
+def _split_section(
+    document: "MarkdownDocument", section: "Section", budget: int
+) -> list[tuple[int, int]]:
+    """Split a section into spans that fit the budget, at subsection boundaries."""
+    content = document.content
+    if estimate_tokens(content[section.start:section.end]) <= budget:
+        return [(section.start, section.end)] if section.start < section.end else []
+
+    pieces = _split_lines(content, section.start, section.body_end, budget)
+    for child in section.children:
+        pieces.extend(_split_section(document, child, budget))
+    return pieces
+
+
+def chunk_markdown(content: str, budget: int) -> list[Chunk]:
+    """Split a document into chunks of at most budget tokens.
+
+    Consecutive sections are packed into a chunk while they fit; a section
+    that does not fit on its own is split at its subsections, then at blank
+    lines, then at line breaks. Only a single line longer than the budget
+    yields a chunk over it.
+    """
+    from .markdown import parse_markdown
+
+    with span("chunk", "rule", size=len(content), budget=budget):
+        document = parse_markdown(content)
+        spans = _split_section(document, document.root, budget)
+
+        merged: list[tuple[int, int, int]] = []  # (start, end, tokens)
+        for start, end in spans:
+            tokens = estimate_tokens(content[start:end])
+            if merged and merged[-1][2] + tokens <= budget:
+                previous_start, _, previous_tokens = merged[-1]
+                merged[-1] = (previous_start, end, previous_tokens + tokens)
+            else:
+                merged.append((start, end, tokens))
+
+        chunks = []
+        line = 1
+        offset = 0
+        for start, end, tokens in merged:
+            line += content.count("\n", offset, start)
+            end_line = line + content.count("\n", start, end - 1)
+            chunks.append(Chunk(
+                start_line=line,
+                end_line=end_line,
+                tokens=tokens,
+                sections=[s.title for s in document.sections if start <= s.start < end],
+            ))
+            offset = start
+        return chunks
+
+
+def _read_token_counts(cache_file: Path) -> dict[str, list[int]]:
+    """Load {path: [size, mtime_ns, tokens]} from the token cache."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != TOKENS_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_token_counts(cache_file: Path, counts: dict[str, list[int]]) -> None:
+    """Store the token cache, keeping the MAX_CACHED_FILES newest entries."""
+    import tempfile
+
+    files = dict(list(counts.items())[-MAX_CACHED_FILES:])
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": TOKENS_VERSION, "files": files}, f)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        pass
+
+
+def _read_text(path: Path) -> str:
+    with span("read", "io", path=str(path)):
+        return path.read_text(encoding="utf-8", errors="replace")
+
+
+def token_report(files: dict[str, Path], budget: int = DEFAULT_TOKEN_BUDGET) -> dict[str, Any]:
+    """Estimate the tokens of a phase's input files and fit them to a budget.
+
+    If the files do not fit together, the largest ones are chunked (largest
+    first) so that each of their chunks fits next to the other files, until
+    the phase fits.
+
+    Args:
+        files: Label (e.g. "PRD_FILE") -> path; missing files are skipped
+        budget: Token budget for the whole phase
+    """
+    cache_dir = find_cache_dir(Path.cwd())
+    cache_file = cache_dir / TOKEN_CACHE_FILE if cache_dir is not None else None
+    counts = _read_token_counts(cache_file) if cache_file is not None else {}
+    updated = False
+
+    contents: dict[str, str] = {}
+    report_files: dict[str, dict[str, Any]] = {}
+    for label, path in files.items():
+        try:
+            st = path.stat()
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            key = str(path.absolute())
+            cached = counts.get(key)
+            if isinstance(cached, list) and cached[:2] == [st.st_size, st.st_mtime_ns]:
+                tokens = cached[2]
+            else:
+                contents[label] = _read_text(path)
+                tokens = estimate_tokens(contents[label])
+                counts.pop(key, None)
+                counts[key] = [st.st_size, st.st_mtime_ns, tokens]
+                updated = True
+        except OSError:
+            continue
+        report_files[label] = {"tokens": tokens}
+
+    if updated and cache_file is not None:
+        _write_token_counts(cache_file, counts)
+
+    total = sum(entry["tokens"] for entry in report_files.values())
+
+    # Chunked documents count with their largest chunk from here on
+    loaded = total
+    for label in sorted(report_files, key=lambda name: -report_files[name]["tokens"]):
+        if loaded <= budget:
+            break
+        tokens = report_files[label]["tokens"]
+        room = max(budget - (loaded - tokens), MIN_CHUNK_TOKENS)
+        if tokens <= room:
+            continue
+        try:
+            content = contents[label] if label in contents else _read_text(files[label])
+        except OSError:
+            continue
+        chunks = chunk_markdown(content, room)
+        report_files[label]["chunks"] = [
+            {
+                "lines": [chunk.start_line, chunk.end_line],
+                "tokens": chunk.tokens,
+                "sections": chunk.sections,
+            }
+            for chunk in chunks
+        ]
+        loaded += max(chunk.tokens for chunk in chunks) - tokens
+
+    return {
+        "budget": budget,
+        "total": total,
+        "fits": total <= budget,
+        "fits_chunked": loaded <= budget,
+        "files": report_files,
+    }
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""PRD Kit - Opt-in hot-path tracing.
+
+Set PRD_KIT_TRACE=1 (or pass `prd --profile ...`) to record spans for file
+reads, directory scans and globs, git and other subprocess calls, and
+validator rules. When the process exits the spans are written as Chrome
+trace-event JSON to .prd-kit/traces/<program>-<timestamp>-<pid>.json; open
+it in chrome://tracing or https://ui.perfetto.dev. Every process (worker
+pools, validator subprocesses) writes its own file, on a shared clock, so
+the files of one run can be loaded together.
+
+When tracing is off, span() returns a shared no-op context manager after a
+single flag check, so instrumented code pays next to nothing.
+
+Usage:
+    from .trace import span
+
+    with span("read", "io", path=str(path)):
+        data = path.read_bytes()
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TypeVar, cast
+
+ENV_VAR = "PRD_KIT_TRACE"
+TRACES_DIR_NAME = "traces"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_NULL_SPAN = nullcontext()
+
+_enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+_events: list[dict[str, Any]] = []
+_lock = threading.Lock()
+_registered = False
+
+
+class _Span:
+    """Context manager recording one complete ("X") trace event."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        end = time.perf_counter_ns()
+        event: dict[str, Any] = {
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+
+    def set(self, **args: Any) -> None:
+        """Attach more arguments (e.g. result sizes) to the span."""
+        self.args.update(args)
+
+
+def enabled() -> bool:
+    """Check whether tracing is on for this process."""
+    return _enabled
+
+
+def enable() -> None:
+    """Turn tracing on for this process and the processes it starts."""
+    global _enabled
+    _enabled = True
+    os.environ[ENV_VAR] = "1"
+    _register()
+
+
+def span(name: str, cat: str = "", **args: Any) -> AbstractContextManager[_Span | None]:
+    """Return a context manager timing a block as a trace span.
+
+    Args:
+        name: Span name (e.g. "read", "git checkout")
+        cat: Category used to filter spans: io, scan, subprocess, git,
+            validator, rule, command
+        **args: Details shown with the span (paths, counts, ...)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    _register()
+    return _Span(name, cat, args)
+
+
+def traced(cat: str) -> Callable[[_F], _F]:
+    """Decorator recording a span for every call of a function."""
+    def decorate(func: _F) -> _F:
+        name = func.__qualname__
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(name, cat):
+                return func(*args, **kwargs)
+
+        return cast(_F, functools.update_wrapper(wrapper, func))
+    return decorate
+
+
+def _find_traces_dir() -> Path | None:
+    """Find .prd-kit/traces/ by searching upward from the working directory."""
+    current = Path.cwd()
+    while True:
+        if (current / ".prd-kit").is_dir():
+            return current / ".prd-kit" / TRACES_DIR_NAME
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+def write_trace(traces_dir: Path | None = None) -> Path | None:
+    """Write the spans recorded so far and clear them.
+
+    Returns:
+        The trace file written, or None if there was nothing to write or no
+        PRD Kit project was found.
+    """
+    with _lock:
+        events = list(_events)
+        _events.clear()
+    if not events:
+        return None
+    traces_dir = traces_dir or _find_traces_dir()
+    if traces_dir is None:
+        return None
+
+    program = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "python"
+    pid = os.getpid()
+    events.append({
+        "name": "process_name",
+        "ph": "M",
+        "pid": pid,
+        "args": {"name": f"{program} ({pid})"},
+    })
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    trace_file = traces_dir / f"{program}-{stamp}-{pid}.json"
+    try:
+        traces_dir.mkdir(parents=True, exist_ok=True)
+        trace_file.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+    except OSError:
+        return None
+    return trace_file
+
+
+def _register() -> None:
+    global _registered
+    if _registered:
+        return
+    _registered = True
+    atexit.register(write_trace)
+    # Pool workers leave through os._exit (skipping atexit) after running
+    # multiprocessing's finalizers
+    multiprocessing = sys.modules.get("multiprocessing")
+    if multiprocessing is not None and multiprocessing.parent_process() is not None:
+        from multiprocessing.util import Finalize
+        Finalize(None, write_trace, exitpriority=10)
+
+
+def _after_fork() -> None:
+    """Forked children start with no spans of their own."""
+    global _registered
+    _events.clear()
+    _registered = False
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
@@ -0,0 +1,15 @@
+"""PRD Kit - Tracing for CLI commands.
+
+The tracer itself ships to projects as prd_scripts/trace.py; the CLI uses
+that same module so `prd --profile` and PRD_KIT_TRACE=1 record spans from
+commands, validator workers and project scripts into one set of Chrome
+trace files under .prd-kit/traces/.
+"""
+
+from prd_kit.resources import add_scripts_to_path
+
+add_scripts_to_path()
+
+from prd_scripts.trace import enable, enabled, span, traced, write_trace  # noqa: E402
+
+__all__ = ["enable", "enabled", "span", "traced", "write_trace"]
@@ -0,0 +1,97 @@
+"""PRD Kit - In-process validator library.
+
+The validators ship to projects as prd_scripts modules (the hyphenated
+scripts in .prd-kit/validators/ are thin command-line shims over them). This
+package exposes the same code to the CLI and to tools, so any number of
+validations run in one process with no interpreter startup or JSON parsing:
+
+    from prd_kit.validators import validate
+
+    result = validate(Path("prds/feature-name/PRD.md"))
+    if not result.passed:
+        print(result.issues)
+"""
+
+from pathlib import Path
+
+from prd_kit.resources import add_scripts_to_path
+
+add_scripts_to_path()
+
+from prd_scripts.check_completeness import (  # noqa: E402
+    CompletenessResult,
+    validate_file,
+    validate_file_cached,
+)
+from prd_scripts.check_deliverables import (  # noqa: E402
+    DeliverablesResult,
+    validate_directory,
+    validate_path,
+    validate_workspace,
+)
+from prd_scripts.implementation_order import (  # noqa: E402
+    ImplementationPhase,
+    ScheduledDeliverable,
+    generate_order,
+    generate_workspace_order,
+    schedule_with_workers,
+    topological_sort_with_levels,
+)
+
+COMPLETENESS = "check-completeness"
+DELIVERABLES = "check-deliverables"
+
+__all__ = [
+    "COMPLETENESS",
+    "DELIVERABLES",
+    "CompletenessResult",
+    "DeliverablesResult",
+    "ImplementationPhase",
+    "ScheduledDeliverable",
+    "generate_order",
+    "generate_workspace_order",
+    "schedule_with_workers",
+    "topological_sort_with_levels",
+    "validate",
+    "validate_directory",
+    "validate_file",
+    "validate_file_cached",
+    "validate_path",
+    "validate_workspace",
+    "validator_for",
+]
+
+
+def validator_for(path: Path) -> str:
+    """Return the validator that checks path.
+
+    Deliverables directories, deliverables-map.json and deliverable-*.md
+    files go to check-deliverables; anything else (research.md, PRD.md) to
+    check-completeness.
+    """
+    if path.is_dir() or path.name == "deliverables-map.json":
+        return DELIVERABLES
+    if path.name.startswith("deliverable") and path.suffix == ".md":
+        return DELIVERABLES
+    return COMPLETENESS
+
+
+def validate(
+    path: Path,
+    validator: str | None = None,
+    use_cache: bool = True,
+) -> CompletenessResult | DeliverablesResult:
+    """Validate one document or deliverables directory in-process.
+
+    Args:
+        path: File or deliverables directory to validate
+        validator: "check-completeness" or "check-deliverables"; picked from
+            the path when omitted
+        use_cache: Reuse results cached in .prd-kit/cache/
+    """
+    validator = validator or validator_for(path)
+    if validator == COMPLETENESS:
+        return validate_file_cached(path, use_cache=use_cache)
+    if validator == DELIVERABLES:
+        return validate_path(path, use_cache=use_cache)
+    raise ValueError(f"Unknown validator: {validator}")